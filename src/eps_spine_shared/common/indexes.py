@@ -70,7 +70,9 @@ class EpsIndexFactory(object):
         index_dict = {}
         try:
             self._add_prescibing_site_status_index(context.epsRecord, index_dict)
-            self._add_dispensing_site_status_index(context.epsRecord, index_dict)
+            # the dispenser indexes all share a walk of the instances, so build them together
+            dispenser_indexes = context.epsRecord.return_dispenser_indexes()
+            self._add_dispensing_site_status_index(dispenser_indexes, index_dict)
             self._add_nominated_pharmacy_status_index(context.epsRecord, index_dict)
             self._add_next_activity_next_activity_date_index(context, index_dict)
             self._add_nhs_number_index(context.epsRecord, index_dict)
@@ -80,11 +82,19 @@ class EpsIndexFactory(object):
             # Riak 1.4
             self._add_nhs_number_date_index(context.epsRecord, index_dict)
             self._add_nhs_number_prescriber_date_index(context.epsRecord, index_dict)
-            self._add_nhs_number_prescriber_dispenser_date_index(context.epsRecord, index_dict)
-            self._add_nhs_number_dispenser_date_index(context.epsRecord, index_dict)
+            self._add_dispenser_date_index(
+                context.epsRecord, dispenser_indexes, INDEX_NHSNUMBER_PRDSDATE, index_dict
+            )
+            self._add_dispenser_date_index(
+                context.epsRecord, dispenser_indexes, INDEX_NHSNUMBER_DSDATE, index_dict
+            )
             self._add_prescriber_date_index(context.epsRecord, index_dict)
-            self._add_prescriber_dispenser_date_index(context.epsRecord, index_dict)
-            self._add_dispenser_date_index(context.epsRecord, index_dict)
+            self._add_dispenser_date_index(
+                context.epsRecord, dispenser_indexes, INDEX_PRESCRIBER_DSDATE, index_dict
+            )
+            self._add_dispenser_date_index(
+                context.epsRecord, dispenser_indexes, INDEX_DISPENSER_DATE, index_dict
+            )
             self._add_delta_index(context.epsRecord, index_dict)
         except EpsSystemError as e:
             self.log_object.write_log(
@@ -114,17 +124,13 @@ class EpsIndexFactory(object):
         new_indexes = eps_record.add_release_and_status(index)
         index_dict[INDEX_NHSNUMBER_PRDATE] = new_indexes
 
-    def _add_nhs_number_prescriber_dispenser_date_index(self, eps_record, index_dict):
+    def _add_dispenser_date_index(self, eps_record, dispenser_indexes, index_name, index_dict):
         """
         See build_indexes
         """
-        result_list = eps_record.return_nhs_number_prescriber_dispenser_date_index()
-        [success, nhs_number_presc_disp_date_bin] = result_list
-        if not success:
-            raise EpsSystemError(INDEX_NHSNUMBER_PRDSDATE)
-        if nhs_number_presc_disp_date_bin:
-            new_indexes = eps_record.add_release_and_status(nhs_number_presc_disp_date_bin, False)
-            index_dict[INDEX_NHSNUMBER_PRDSDATE] = new_indexes
+        dispenser_date_bin = dispenser_indexes[index_name]
+        if dispenser_date_bin:
+            index_dict[index_name] = eps_record.add_release_and_status(dispenser_date_bin, False)
 
     def _add_prescriber_date_index(self, eps_record, index_dict):
         """
@@ -135,42 +141,6 @@ class EpsIndexFactory(object):
         prescriber_date_bin = prescriber + SEPERATOR + prescription_time
         index_dict[INDEX_PRESCRIBER_DATE] = eps_record.add_release_and_status(prescriber_date_bin)
 
-    def _add_nhs_number_dispenser_date_index(self, eps_record, index_dict):
-        """
-        See build_indexes
-        """
-        result_list = eps_record.return_nhs_number_dispenser_date_index()
-        [success, nhs_number_dispenser_date_bin] = result_list
-        if not success:
-            raise EpsSystemError(INDEX_NHSNUMBER_DSDATE)
-        if nhs_number_dispenser_date_bin:
-            new_indexes = eps_record.add_release_and_status(nhs_number_dispenser_date_bin, False)
-            index_dict[INDEX_NHSNUMBER_DSDATE] = new_indexes
-
-    def _add_prescriber_dispenser_date_index(self, eps_record, index_dict):
-        """
-        See build_indexes
-        """
-        result_list = eps_record.return_prescriber_dispenser_date_index()
-        [success, presc_disp_dates] = result_list
-        if not success:
-            raise EpsSystemError(INDEX_PRESCRIBER_DSDATE)
-        if presc_disp_dates:
-            new_indexes = eps_record.add_release_and_status(presc_disp_dates, False)
-            index_dict[INDEX_PRESCRIBER_DSDATE] = new_indexes
-
-    def _add_dispenser_date_index(self, eps_record, index_dict):
-        """
-        See build_indexes
-        """
-        result_list = eps_record.return_dispenser_date_index()
-        [success, disp_dates] = result_list
-        if not success:
-            raise EpsSystemError(INDEX_DISPENSER_DATE)
-        if disp_dates:
-            new_indexes = eps_record.add_release_and_status(disp_dates, False)
-            index_dict[INDEX_DISPENSER_DATE] = new_indexes
-
     def _add_next_activity_next_activity_date_index(self, context, index_dict):
         """
         See build_indexes
@@ -199,15 +169,11 @@ class EpsIndexFactory(object):
         for status in prescription_status:
             index_dict[INDEX_PRESCRIBER_STATUS].append(presc_site + "_" + status)
 
-    def _add_dispensing_site_status_index(self, eps_record, index_dict):
+    def _add_dispensing_site_status_index(self, dispenser_indexes, index_dict):
         """
         See build_indexes
         """
-        result_list = eps_record.return_disp_site_status_index()
-        [success, disp_site_statuses] = result_list
-        if not success:
-            raise EpsSystemError(INDEX_DISPENSER_STATUS)
-        index_dict[INDEX_DISPENSER_STATUS] = list(disp_site_statuses)
+        index_dict[INDEX_DISPENSER_STATUS] = list(dispenser_indexes[INDEX_DISPENSER_STATUS])
 
     def _add_nominated_pharmacy_status_index(self, eps_record, index_dict):
         """
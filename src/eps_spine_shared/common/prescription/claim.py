@@ -6,6 +6,8 @@ class PrescriptionClaim(object):
     Wrapper class to simplify interacting with an issue claim portion of a prescription record.
     """
 
+    __slots__ = ("_claim_dict",)
+
     def __init__(self, claim_dict):
         """
         Constructor.
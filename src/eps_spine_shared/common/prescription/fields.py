@@ -2,6 +2,8 @@
 Field name constants and related configuration for prescription records.
 """
 
+from types import MappingProxyType
+
 from eps_spine_shared.spinecore.changelog import PrescriptionsChangeLogProcessor
 
 # Field name constants
@@ -209,12 +211,11 @@ INSTANCE_CANCELLATION_DETAILS = [
     FIELD_CANCELLATION_MSG_REF,
     FIELD_CANCEL_LINE_ITEM_REF,
     FIELD_REASONS,
-    FIELD_CANCELLATION_MSG_REF,
 ]
 
 # Prescription ID lengths for different versions
-R1_PRESCRIPTIONID_LENGTHS = [36, 37]
-R2_PRESCRIPTIONID_LENGTHS = [19, 20]
+R1_PRESCRIPTIONID_LENGTHS = frozenset([36, 37])
+R2_PRESCRIPTIONID_LENGTHS = frozenset([19, 20])
 
 R1_VERSION = "R1"
 R2_VERSION = "R2"
@@ -240,31 +241,36 @@ SPECIAL_DISPENSE_RESET = "specialDispenseReset"
 SPECIAL_RESET_CURRENT_INSTANCE = "specialCurrentInstanceReset"
 SPECIAL_APPLY_PENDING_CANCELLATIONS = "specialApplyPendingCancellations"
 
-# Update detail text mapping
-UPDATE_DETAIL_TEXT = {
-    NEXTACTIVITY_EXPIRE: "Batch update for Prescription Expiry",
-    NEXTACTIVITY_CREATENOCLAIM: "Batch create no claim",
-    NEXTACTIVITY_DELETE: "Batch prescription deletion",
-    NEXTACTIVITY_READY: "Batch make prescription available for download",
-    ACTIVITY_NOMINATED_DOWNLOAD: "Batch make prescription available for nominated download",
-    ADMIN_ACTION_RESET_NAD: "Administrative reset of Next Activity Date",
-    SPECIAL_DISPENSE_RESET: "Administrative hard-reset return to Spine",
-    SPECIAL_RESET_CURRENT_INSTANCE: "Administrative reset current issue number",
-    SPECIAL_APPLY_PENDING_CANCELLATIONS: "Administrative apply all pending cancellations",
-    NEXTACTIVITY_PURGE: "Batch prescription purge",
-}
+# Update detail text mapping (read-only)
+UPDATE_DETAIL_TEXT = MappingProxyType(
+    {
+        NEXTACTIVITY_EXPIRE: "Batch update for Prescription Expiry",
+        NEXTACTIVITY_CREATENOCLAIM: "Batch create no claim",
+        NEXTACTIVITY_DELETE: "Batch prescription deletion",
+        NEXTACTIVITY_READY: "Batch make prescription available for download",
+        ACTIVITY_NOMINATED_DOWNLOAD: "Batch make prescription available for nominated download",
+        ADMIN_ACTION_RESET_NAD: "Administrative reset of Next Activity Date",
+        SPECIAL_DISPENSE_RESET: "Administrative hard-reset return to Spine",
+        SPECIAL_RESET_CURRENT_INSTANCE: "Administrative reset current issue number",
+        SPECIAL_APPLY_PENDING_CANCELLATIONS: "Administrative apply all pending cancellations",
+        NEXTACTIVITY_PURGE: "Batch prescription purge",
+    }
+)
 
-# Activity lookup mapping
-ACTIVITY_LOOKUP = {}
-ACTIVITY_LOOKUP[NEXTACTIVITY_EXPIRE] = NEXTACTIVITY_EXPIRE
-ACTIVITY_LOOKUP[NEXTACTIVITY_CREATENOCLAIM] = NEXTACTIVITY_CREATENOCLAIM
-ACTIVITY_LOOKUP[NEXTACTIVITY_DELETE] = NEXTACTIVITY_DELETE
-ACTIVITY_LOOKUP[NEXTACTIVITY_PURGE] = NEXTACTIVITY_PURGE
-ACTIVITY_LOOKUP[ACTIVITY_NOMINATED_DOWNLOAD] = NEXTACTIVITY_READY
-ACTIVITY_LOOKUP[ADMIN_ACTION_RESET_NAD] = ADMIN_ACTION_RESET_NAD
-ACTIVITY_LOOKUP[SPECIAL_DISPENSE_RESET] = SPECIAL_DISPENSE_RESET
-ACTIVITY_LOOKUP[SPECIAL_RESET_CURRENT_INSTANCE] = SPECIAL_RESET_CURRENT_INSTANCE
-ACTIVITY_LOOKUP[SPECIAL_APPLY_PENDING_CANCELLATIONS] = SPECIAL_APPLY_PENDING_CANCELLATIONS
+# Activity lookup mapping (read-only)
+ACTIVITY_LOOKUP = MappingProxyType(
+    {
+        NEXTACTIVITY_EXPIRE: NEXTACTIVITY_EXPIRE,
+        NEXTACTIVITY_CREATENOCLAIM: NEXTACTIVITY_CREATENOCLAIM,
+        NEXTACTIVITY_DELETE: NEXTACTIVITY_DELETE,
+        NEXTACTIVITY_PURGE: NEXTACTIVITY_PURGE,
+        ACTIVITY_NOMINATED_DOWNLOAD: NEXTACTIVITY_READY,
+        ADMIN_ACTION_RESET_NAD: ADMIN_ACTION_RESET_NAD,
+        SPECIAL_DISPENSE_RESET: SPECIAL_DISPENSE_RESET,
+        SPECIAL_RESET_CURRENT_INSTANCE: SPECIAL_RESET_CURRENT_INSTANCE,
+        SPECIAL_APPLY_PENDING_CANCELLATIONS: SPECIAL_APPLY_PENDING_CANCELLATIONS,
+    }
+)
 
 USER_IMPACTING_ACTIVITY = [NEXTACTIVITY_READY]
 
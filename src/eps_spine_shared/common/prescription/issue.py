@@ -15,6 +15,8 @@ class PrescriptionIssue(object):
     to "instance" in the code and database records.
     """
 
+    __slots__ = ("_issue_dict",)
+
     def __init__(self, issue_dict):
         """
         Constructor.
@@ -294,9 +296,8 @@ class PrescriptionIssue(object):
         :type line_item_id: str
         :rtype: list()
         """
-        return [
-            c for c in self.cancellations if c[fields.FIELD_CANCEL_LINE_ITEM_REF] == line_item_id
-        ]
+        field_cancel_line_item_ref = fields.FIELD_CANCEL_LINE_ITEM_REF
+        return [c for c in self.cancellations if c[field_cancel_line_item_ref] == line_item_id]
 
     def get_line_item_first_cancellation_time(self, line_item_id):
         """
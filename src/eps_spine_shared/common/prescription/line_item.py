@@ -7,6 +7,8 @@ class PrescriptionLineItem(object):
     Wrapper class to simplify interacting with line item sections of a prescription record.
     """
 
+    __slots__ = ("_line_item_dict",)
+
     def __init__(self, line_item_dict):
         """
         Constructor.
@@ -3,7 +3,15 @@ import datetime
 from eps_spine_shared.common.prescription import fields
 from eps_spine_shared.common.prescription.statuses import PrescriptionStatus
 from eps_spine_shared.logger import EpsLogger
-from eps_spine_shared.nhsfundamentals.time_utilities import TimeFormats
+from eps_spine_shared.nhsfundamentals.time_utilities import (
+    date_as_standard_string,
+    standard_date_string_as_datetime,
+)
+
+# Date inputs which are left unset rather than defaulted to now when missing
+_OPTIONAL_DATE_KEYS = frozenset(
+    [fields.FIELD_NOMINATED_DOWNLOAD_DATE, fields.FIELD_DISPENSE_WINDOW_LOW_DATE]
+)
 
 
 class NextActivityGenerator(object):
@@ -67,6 +75,12 @@ class NextActivityGenerator(object):
     INPUT_BY_STATUS[PrescriptionStatus.FUTURE_DATED_PRESCRIPTION] = INPUT_LIST_6
     INPUT_BY_STATUS[PrescriptionStatus.PENDING_CANCELLATION] = [fields.FIELD_PRESCRIPTION_DATE]
 
+    # The dated inputs for each status, which are converted to datetimes before use
+    DATE_KEYS_BY_STATUS = {
+        status: tuple(key for key in keys if fields.FIELD_CAPITAL_D_DATE in key)
+        for status, keys in INPUT_BY_STATUS.items()
+    }
+
     FIELD_REPEAT_DISPENSE_EXPIRY_PERIOD = "repeatDispenseExpiryPeriod"
     FIELD_PRESCRIPTION_EXPIRY_PERIOD = "prescriptionExpiryPeriod"
     FIELD_WITH_DISPENSER_ACTIVE_EXPIRY_PERIOD = "withDispenserActiveExpiryPeriod"
@@ -77,6 +91,8 @@ class NextActivityGenerator(object):
     FIELD_NOT_DISPENSED_DELETE_PERIOD = "notDispensedDeletePeriod"
     FIELD_RELEASE_VERSION = "releaseVersion"
 
+    __slots__ = ("log_object", "internal_id", "_index_map")
+
     def __init__(self, log_object, internal_id):
         self.log_object = EpsLogger(log_object)
         self.internal_id = internal_id
@@ -109,17 +125,12 @@ class NextActivityGenerator(object):
         """
         prescription_status = nad_status[fields.FIELD_PRESCRIPTION_STATUS]
 
-        for key in NextActivityGenerator.INPUT_BY_STATUS[prescription_status]:
-            if fields.FIELD_CAPITAL_D_DATE in key:
-                if nad_status[key]:
-                    nad_status[key] = datetime.datetime.strptime(
-                        nad_status[key], TimeFormats.STANDARD_DATE_FORMAT
-                    )
-                elif key not in [
-                    fields.FIELD_NOMINATED_DOWNLOAD_DATE,
-                    fields.FIELD_DISPENSE_WINDOW_LOW_DATE,
-                ]:
-                    nad_status[key] = datetime.datetime.now()
+        for key in NextActivityGenerator.DATE_KEYS_BY_STATUS[prescription_status]:
+            value = nad_status[key]
+            if value:
+                nad_status[key] = standard_date_string_as_datetime(value)
+            elif key not in _OPTIONAL_DATE_KEYS:
+                nad_status[key] = datetime.datetime.now()
 
         self._calculate_expiry_date(nad_status, nad_reference)
         return_value = self._index_map[prescription_status](nad_status, nad_reference)
@@ -141,8 +152,7 @@ class NextActivityGenerator(object):
             )
 
         nad_status[fields.FIELD_EXPIRY_DATE] = expiry_date
-        expiry_date_str = expiry_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
-        nad_status[fields.FIELD_FORMATTED_EXPIRY_DATE] = expiry_date_str
+        nad_status[fields.FIELD_FORMATTED_EXPIRY_DATE] = date_as_standard_string(expiry_date)
 
     def un_dispensed(self, nad_status, _):
         """
@@ -165,16 +175,15 @@ class NextActivityGenerator(object):
         max_dispense_time += nad_reference[self.FIELD_WITH_DISPENSER_ACTIVE_EXPIRY_PERIOD]
         expiry_date = min(max_dispense_time, nad_status[fields.FIELD_EXPIRY_DATE])
 
-        if nad_status[self.FIELD_RELEASE_VERSION] == fields.R1_VERSION:
+        if (
+            nad_status[self.FIELD_RELEASE_VERSION] == fields.R1_VERSION
+            or not nad_status[fields.FIELD_LAST_DISPENSE_NOTIFICATION_MSG_REF]
+        ):
             next_activity = fields.NEXTACTIVITY_EXPIRE
-            next_activity_date = expiry_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+            next_activity_date = date_as_standard_string(expiry_date)
         else:
-            if not nad_status[fields.FIELD_LAST_DISPENSE_NOTIFICATION_MSG_REF]:
-                next_activity = fields.NEXTACTIVITY_EXPIRE
-                next_activity_date = expiry_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
-            else:
-                next_activity = fields.NEXTACTIVITY_CREATENOCLAIM
-                next_activity_date = max_dispense_time.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+            next_activity = fields.NEXTACTIVITY_CREATENOCLAIM
+            next_activity_date = date_as_standard_string(max_dispense_time)
         return [next_activity, next_activity_date, expiry_date]
 
     def expired(self, nad_status, nad_reference):
@@ -187,7 +196,7 @@ class NextActivityGenerator(object):
             + nad_reference[self.FIELD_EXPIRED_DELETE_PERIOD]
         )
         next_activity = fields.NEXTACTIVITY_DELETE
-        next_activity_date = deletion_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+        next_activity_date = date_as_standard_string(deletion_date)
         return [next_activity, next_activity_date, None]
 
     def cancelled(self, nad_status, nad_reference):
@@ -200,7 +209,7 @@ class NextActivityGenerator(object):
             + nad_reference[self.FIELD_CANCELLED_DELETE_PERIOD]
         )
         next_activity = fields.NEXTACTIVITY_DELETE
-        next_activity_date = deletion_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+        next_activity_date = date_as_standard_string(deletion_date)
         return [next_activity, next_activity_date, None]
 
     def dispensed(self, nad_status, nad_reference):
@@ -218,7 +227,7 @@ class NextActivityGenerator(object):
             next_activity = fields.NEXTACTIVITY_DELETE
         else:
             next_activity = fields.NEXTACTIVITY_CREATENOCLAIM
-        next_activity_date = max_notification_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+        next_activity_date = date_as_standard_string(max_notification_date)
         return [next_activity, next_activity_date, None]
 
     def completed(self, nad_status, nad_reference):
@@ -234,7 +243,7 @@ class NextActivityGenerator(object):
             + nad_reference[self.FIELD_CLAIMED_DELETE_PERIOD]
         )
         next_activity = fields.NEXTACTIVITY_DELETE
-        next_activity_date = deletion_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+        next_activity_date = date_as_standard_string(deletion_date)
         return [next_activity, next_activity_date, None]
 
     def not_dispensed(self, nad_status, nad_reference):
@@ -247,7 +256,7 @@ class NextActivityGenerator(object):
             + nad_reference[self.FIELD_NOT_DISPENSED_DELETE_PERIOD]
         )
         next_activity = fields.NEXTACTIVITY_DELETE
-        next_activity_date = deletion_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+        next_activity_date = date_as_standard_string(deletion_date)
         return [next_activity, next_activity_date, None]
 
     def awaiting_nominated_release(self, nad_status, _):
@@ -260,11 +269,9 @@ class NextActivityGenerator(object):
         if nad_status[fields.FIELD_NOMINATED_DOWNLOAD_DATE]:
             ready_date = nad_status[fields.FIELD_NOMINATED_DOWNLOAD_DATE]
 
-        ready_date_string = ready_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
-
         if ready_date < nad_status[fields.FIELD_EXPIRY_DATE]:
             next_activity = fields.NEXTACTIVITY_READY
-            next_activity_date = ready_date_string
+            next_activity_date = date_as_standard_string(ready_date)
         else:
             next_activity = fields.NEXTACTIVITY_EXPIRE
             next_activity_date = nad_status[fields.FIELD_FORMATTED_EXPIRY_DATE]
@@ -283,13 +290,14 @@ class NextActivityGenerator(object):
         else:
             ready_date = nad_status[fields.FIELD_PRESCRIPTION_DATE]
 
-        ready_date_string = ready_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+        # the returned date is the one before any nominated download date is applied
+        ready_date_to_return = ready_date
 
         if nad_status[fields.FIELD_NOMINATED_DOWNLOAD_DATE]:
             ready_date = nad_status[fields.FIELD_NOMINATED_DOWNLOAD_DATE]
         if ready_date < nad_status[fields.FIELD_EXPIRY_DATE]:
             next_activity = fields.NEXTACTIVITY_READY
-            next_activity_date = ready_date_string
+            next_activity_date = date_as_standard_string(ready_date_to_return)
         else:
             next_activity = fields.NEXTACTIVITY_EXPIRE
             next_activity_date = nad_status[fields.FIELD_FORMATTED_EXPIRY_DATE]
@@ -304,5 +312,5 @@ class NextActivityGenerator(object):
             nad_status[fields.FIELD_HANDLE_TIME] + nad_reference[self.FIELD_CANCELLED_DELETE_PERIOD]
         )
         next_activity = fields.NEXTACTIVITY_DELETE
-        next_activity_date = deletion_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+        next_activity_date = date_as_standard_string(deletion_date)
         return [next_activity, next_activity_date, None]
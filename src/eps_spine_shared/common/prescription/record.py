@@ -1,6 +1,8 @@
 import datetime
+import math
 import sys
-from copy import copy
+from collections import namedtuple
+from functools import lru_cache
 
 from dateutil.relativedelta import relativedelta
 
@@ -15,10 +17,165 @@ from eps_spine_shared.errors import (
     EpsSystemError,
 )
 from eps_spine_shared.logger import EpsLogger
-from eps_spine_shared.nhsfundamentals.time_utilities import TimeFormats
+from eps_spine_shared.nhsfundamentals.time_utilities import (
+    TimeFormats,
+    date_as_standard_string,
+    standard_date_string_as_datetime,
+    standard_date_time_string_as_datetime,
+)
 from eps_spine_shared.spinecore.base_utilities import handle_encoding_oddities, quoted
 from eps_spine_shared.spinecore.changelog import PrescriptionsChangeLogProcessor
 
+# Sentinel to distinguish a field missing from a record from one set to None
+_MISSING = object()
+
+# Sentinel for an admin update whose value is taken from the context rather than fixed
+_FROM_CONTEXT = object()
+
+# An admin update copied from the context onto each updated issue, see
+# PrescriptionRecord._ADMIN_INSTANCE_UPDATES. section is None for fields held directly on
+# the issue.
+_AdminInstanceUpdate = namedtuple(
+    "_AdminInstanceUpdate",
+    ["context_attr", "section", "stored_field", "logged_field", "fixed_value"],
+    defaults=[_FROM_CONTEXT],
+)
+
+# An admin update resolved against a particular context, see
+# PrescriptionRecord._resolve_admin_instance_updates
+_ResolvedAdminUpdate = namedtuple(
+    "_ResolvedAdminUpdate",
+    ["section", "stored_field", "logged_field", "new_value", "logged_value"],
+)
+
+# Prefix lengths of the next activity index terms ("<activity>_<YYYYMMDD>"), so the
+# activity checks can use a plain slice compare
+_PURGE_PREFIX_LEN = len(fields.NEXTACTIVITY_PURGE)
+_EXPIRE_PREFIX_LEN = len(fields.NEXTACTIVITY_EXPIRE)
+
+# Offsets from the patient's birth date to the edges of the age exemptions, see
+# PrescriptionRecord.set_exemption_dates
+_YOUNG_AGE_EXEMPTION_DELTA = relativedelta(years=fields._YOUNG_AGE_EXEMPTION, days=-1)
+_OLD_AGE_EXEMPTION_DELTA = relativedelta(years=fields._OLD_AGE_EXEMPTION)
+
+# The release response quotes the display names, which come from fixed lookups, so
+# quote them once rather than for every release, see
+# PrescriptionRecord.fetch_release_response_parameters
+_QUOTED_PRESCRIPTION_DISPLAY_NAMES = {
+    status: quoted(display_name)
+    for status, display_name in PrescriptionStatus.PRESCRIPTION_DISPLAY_LOOKUP.items()
+}
+_QUOTED_ITEM_DISPLAY_NAMES = {
+    status: quoted(display_name)
+    for status, display_name in LineItemStatus.ITEM_DISPLAY_LOOKUP.items()
+}
+
+# Line item states kept as they are in the release history entry, every other line
+# item goes back to with dispenser, see PrescriptionRecord.create_release_history_entry
+_TERMINAL_LINE_STATES = frozenset([LineItemStatus.CANCELLED, LineItemStatus.EXPIRED])
+
+# Release dates of issues caught by the go-live download problem, see
+# PrescriptionRecord._confirm_dispense_reset_on_issue - to be removed with that method
+# post clean-up
+_SPECIAL_DISPENSE_RESET_DATES = frozenset(
+    [
+        "20140824",
+        "20140825",
+        "20140826",
+        "20140827",
+        "20140828",
+        "20140829",
+        "20140830",
+        "20140831",
+        "20140901",
+        "20140902",
+        "20140903",
+        "20140904",
+        "20140905",
+        "20140906",
+        "20140907",
+        "20140908",
+    ]
+)
+
+
+def _cancellation_target(cancellation):
+    """
+    The target of a cancellation, for comparing cancellations and for logging. Line item
+    cancellations are identified as LineItem_<<LineItemRef>>.
+
+    :type cancellation: dict
+    :rtype: str
+    """
+    target = str(cancellation[fields.FIELD_CANCELLATION_TARGET])
+    if target == "LineItem":
+        return f"LineItem_{cancellation[fields.FIELD_CANCEL_LINE_ITEM_REF]}"
+    return target
+
+
+@lru_cache(maxsize=64)
+def _issue_number_str(issue_number):
+    """
+    Convert an issue number to the str key used in the instances dict. Issue numbers
+    are drawn from a small range, so cache the conversions rather than re-allocating
+    the same key on every issue access.
+
+    :type issue_number: int
+    :rtype: str
+    """
+    return str(issue_number)
+
+
+@lru_cache(maxsize=256)
+def _release_version_for_id(prescription_id):
+    """
+    Derive the release version from the length of the prescription ID. Keyed on the ID
+    itself so that the cached value cannot go stale if the record is replaced.
+
+    :type prescription_id: str
+    :rtype: str
+    """
+    id_length = len(str(prescription_id))
+    if id_length in fields.R1_PRESCRIPTIONID_LENGTHS:
+        return fields.R1_VERSION
+    if id_length in fields.R2_PRESCRIPTIONID_LENGTHS:
+        return fields.R2_VERSION
+    return None
+
+
+@lru_cache(maxsize=256)
+def _parse_prescription_time(prescription_time_str):
+    """
+    Parse a standard format prescription time. The same record time is parsed
+    repeatedly through the time property, so cache on the string - datetimes are
+    immutable so sharing the result is safe.
+
+    :type prescription_time_str: str
+    :rtype: datetime.datetime
+    """
+    return standard_date_time_string_as_datetime(prescription_time_str)
+
+
+@lru_cache(maxsize=64)
+def _parse_days_supply(days_supply):
+    """
+    Normalise a stored daysSupply to an int. Migrated records may hold null or blank
+    values, which are treated as 0. Only a handful of distinct values occur, so cache
+    on the stored value rather than on the record.
+
+    :type days_supply: int or str or None
+    :rtype: int
+    """
+    # Handle records that were migrated with null daysSupply rather than 0.
+    if not days_supply:
+        return 0
+    if isinstance(days_supply, int):
+        return days_supply
+    # Handle records that were migrated with blank space in the daysSupply rather than 0.
+    if not days_supply.strip():
+        return 0
+    return int(days_supply)
+
 
 class PrescriptionRecord(object):
     """
@@ -36,6 +193,135 @@ class PrescriptionRecord(object):
     # uncontrolled loop - and updating the change log may lead to the record being of an
     # unbounded size
 
+    # Consistency check fields required on each part of the record, by prescription status
+    _DISPENSE_CHECKS = {
+        PrescriptionStatus.WITH_DISPENSER: (fields.FIELD_DISPENSING_ORGANIZATION,),
+        PrescriptionStatus.WITH_DISPENSER_ACTIVE: (
+            fields.FIELD_DISPENSING_ORGANIZATION,
+            fields.FIELD_LAST_DISPENSE_DATE,
+        ),
+        PrescriptionStatus.DISPENSED: (fields.FIELD_LAST_DISPENSE_DATE,),
+        PrescriptionStatus.CLAIMED: (fields.FIELD_LAST_DISPENSE_DATE,),
+    }
+    _INSTANCE_CHECKS = {
+        PrescriptionStatus.EXPIRED: (fields.FIELD_COMPLETION_DATE, fields.FIELD_EXPIRY_DATE),
+        PrescriptionStatus.CANCELLED: (fields.FIELD_COMPLETION_DATE,),
+        PrescriptionStatus.NOT_DISPENSED: (fields.FIELD_COMPLETION_DATE,),
+        PrescriptionStatus.AWAITING_RELEASE_READY: (
+            fields.FIELD_DISPENSE_WINDOW_LOW_DATE,
+            fields.FIELD_NOMINATED_DOWNLOAD_DATE,
+        ),
+        PrescriptionStatus.REPEAT_DISPENSE_FUTURE_INSTANCE: (
+            fields.FIELD_DISPENSE_WINDOW_LOW_DATE,
+            fields.FIELD_NOMINATED_DOWNLOAD_DATE,
+        ),
+    }
+    _PRESCRIPTION_CHECKS = {
+        PrescriptionStatus.AWAITING_RELEASE_READY: (fields.FIELD_PRESCRIPTION_TIME,),
+        PrescriptionStatus.REPEAT_DISPENSE_FUTURE_INSTANCE: (fields.FIELD_PRESCRIPTION_TIME,),
+    }
+    _PRESCRIPTION_CHECKS_DEFAULT = (
+        fields.FIELD_PRESCRIPTION_TREATMENT_TYPE,
+        fields.FIELD_PRESCRIPTION_TIME,
+    )
+    _CLAIM_CHECKS = {
+        PrescriptionStatus.CLAIMED: (fields.FIELD_CLAIM_RECEIVED_DATE,),
+    }
+
+    # Next activities permitted by an issue's position, see _include_next_activity_for_instance
+    _FINAL_ISSUE_ACTIVITIES = frozenset(
+        [
+            fields.NEXTACTIVITY_EXPIRE,
+            fields.NEXTACTIVITY_CREATENOCLAIM,
+            fields.NEXTACTIVITY_READY,
+            fields.NEXTACTIVITY_DELETE,
+            fields.NEXTACTIVITY_PURGE,
+        ]
+    )
+    _PREVIOUS_ISSUE_ACTIVITIES = frozenset([fields.NEXTACTIVITY_CREATENOCLAIM])
+    _CURRENT_ISSUE_ACTIVITIES = frozenset(
+        [
+            fields.NEXTACTIVITY_EXPIRE,
+            fields.NEXTACTIVITY_READY,
+            fields.NEXTACTIVITY_CREATENOCLAIM,
+        ]
+    )
+    # Activities which win a next activity date tie-break, see return_next_activity_index
+    _USER_IMPACTING_ACTIVITIES = frozenset(fields.USER_IMPACTING_ACTIVITY)
+
+    # Admin updates copied from the context onto each updated issue, in the order they are
+    # applied, see _make_admin_instance_updates
+    _ADMIN_INSTANCE_UPDATES = (
+        _AdminInstanceUpdate(
+            context_attr="completionDate",
+            section=None,
+            stored_field=fields.FIELD_COMPLETION_DATE,
+            logged_field=fields.FIELD_COMPLETION_DATE,
+        ),
+        _AdminInstanceUpdate(
+            context_attr="dispenseWindowLowDate",
+            section=None,
+            stored_field=fields.FIELD_DISPENSE_WINDOW_LOW_DATE,
+            logged_field=fields.FIELD_DISPENSE_WINDOW_LOW_DATE,
+        ),
+        _AdminInstanceUpdate(
+            context_attr="nominatedDownloadDate",
+            section=None,
+            stored_field=fields.FIELD_NOMINATED_DOWNLOAD_DATE,
+            logged_field=fields.FIELD_NOMINATED_DOWNLOAD_DATE,
+        ),
+        _AdminInstanceUpdate(
+            context_attr="releaseDate",
+            section=None,
+            stored_field=fields.FIELD_RELEASE_DATE,
+            logged_field=fields.FIELD_RELEASE_DATE,
+        ),
+        _AdminInstanceUpdate(
+            context_attr="dispensingOrganization",
+            section=fields.FIELD_DISPENSE,
+            stored_field=fields.FIELD_DISPENSING_ORGANIZATION,
+            logged_field=fields.FIELD_DISPENSING_ORGANIZATION,
+        ),
+        # This is to reset the dispensing org
+        _AdminInstanceUpdate(
+            context_attr="dispensingOrgNullFlavor",
+            section=fields.FIELD_DISPENSE,
+            stored_field=fields.FIELD_DISPENSING_ORGANIZATION,
+            logged_field=fields.FIELD_DISPENSING_ORGANIZATION,
+            fixed_value=None,
+        ),
+        _AdminInstanceUpdate(
+            context_attr="lastDispenseDate",
+            section=fields.FIELD_DISPENSE,
+            stored_field=fields.FIELD_LAST_DISPENSE_DATE,
+            logged_field=fields.FIELD_LAST_DISPENSE_DATE,
+        ),
+        _AdminInstanceUpdate(
+            context_attr="claimSentDate",
+            section=fields.FIELD_CLAIM,
+            stored_field=fields.FIELD_CLAIM_RECEIVED_DATE,
+            logged_field=fields.FIELD_CLAIM_SENT_DATE,
+        ),
+    )
+
+    # Statuses reported differently in the release response, see
+    # fetch_release_response_parameters - '0000' is internal only
+    _RELEASE_RESPONSE_STATUS_REMAP = {
+        PrescriptionStatus.AWAITING_RELEASE_READY: PrescriptionStatus.TO_BE_DISPENSED,
+    }
+
+    # Handlers for each instance specific action, see perform_instance_specific_updates.
+    # Held by name so that a subclass overriding a handler is still dispatched to.
+    _INSTANCE_ACTION_HANDLERS = {
+        fields.ACTIVITY_NOMINATED_DOWNLOAD: "_action_nominated_download",
+        fields.SPECIAL_RESET_CURRENT_INSTANCE: "_action_reset_current_instance",
+        fields.SPECIAL_DISPENSE_RESET: "_action_dispense_reset",
+        fields.SPECIAL_APPLY_PENDING_CANCELLATIONS: "_action_apply_pending_cancellations",
+        fields.NEXTACTIVITY_EXPIRE: "_action_expire",
+        fields.NEXTACTIVITY_CREATENOCLAIM: "_action_create_no_claim",
+        fields.ADMIN_ACTION_RESET_NAD: "_action_reset_nad",
+    }
+
     def __init__(self, log_object, internal_id):
         """
         The basic attributes of an epsRecord
@@ -130,18 +416,21 @@ class PrescriptionRecord(object):
         Cycle through all of the issues in the prescription and add the current prescription
         status and the status of each line item (by order not ID) to a dictionary keyed on issue number
         """
+        # bind the field names used in the loops to locals
+        field_line_items = fields.FIELD_LINE_ITEMS
+        field_order = fields.FIELD_ORDER
+        field_status = fields.FIELD_STATUS
+
         status_dict = {}
         prescription_issues = self.prescription_record[fields.FIELD_INSTANCES]
-        for issue in prescription_issues:
+        for issue, issue_data in prescription_issues.items():
             issue_dict = {}
             issue_dict[fields.FIELD_PRESCRIPTION] = str(
-                prescription_issues[issue][fields.FIELD_PRESCRIPTION_STATUS]
+                issue_data[fields.FIELD_PRESCRIPTION_STATUS]
             )
-            issue_dict[fields.FIELD_LINE_ITEMS] = {}
-            for line_item in prescription_issues[issue][fields.FIELD_LINE_ITEMS]:
-                line_order = line_item[fields.FIELD_ORDER]
-                line_status = line_item[fields.FIELD_STATUS]
-                issue_dict[fields.FIELD_LINE_ITEMS][str(line_order)] = str(line_status)
+            line_item_statuses = issue_dict[field_line_items] = {}
+            for line_item in issue_data[field_line_items]:
+                line_item_statuses[str(line_item[field_order])] = str(line_item[field_status])
             status_dict[self.generate_status_dict_issue_reference(issue)] = issue_dict
         return status_dict
 
@@ -213,11 +502,8 @@ class PrescriptionRecord(object):
         """
         Adds a document reference to the high-level document list.
         """
-        if fields.FIELDS_DOCUMENTS not in self.prescription_record:
-            self.prescription_record[fields.FIELDS_DOCUMENTS] = []
-
-        for document in document_refs:
-            self.prescription_record[fields.FIELDS_DOCUMENTS].append(document)
+        documents = self.prescription_record.setdefault(fields.FIELDS_DOCUMENTS, [])
+        documents.extend(document_refs)
 
     def return_record_to_be_stored(self):
         """
@@ -230,13 +516,13 @@ class PrescriptionRecord(object):
         """
         Return the nextActivityNAD_bin index of the prescription record
         """
-        if fields.FIELD_INDEXES in self.prescription_record:
-            if indexes.INDEX_NEXTACTIVITY in self.prescription_record[fields.FIELD_INDEXES]:
-                return self.prescription_record[fields.FIELD_INDEXES][indexes.INDEX_NEXTACTIVITY]
-            if indexes.INDEX_NEXTACTIVITY.lower() in self.prescription_record[fields.FIELD_INDEXES]:
-                return self.prescription_record[fields.FIELD_INDEXES][
-                    indexes.INDEX_NEXTACTIVITY.lower()
-                ]
+        record_indexes = self.prescription_record.get(fields.FIELD_INDEXES)
+        if record_indexes is not None:
+            if indexes.INDEX_NEXTACTIVITY in record_indexes:
+                return record_indexes[indexes.INDEX_NEXTACTIVITY]
+            next_activity_lower = indexes.INDEX_NEXTACTIVITY.lower()
+            if next_activity_lower in record_indexes:
+                return record_indexes[next_activity_lower]
         return None
 
     def create_record_from_store(self, record):
@@ -315,17 +601,19 @@ class PrescriptionRecord(object):
         Default any missing value to False
         """
         snippet = {}
+        context_is_dict = isinstance(context, dict)
+        date_time_format = TimeFormats.STANDARD_DATE_TIME_FORMAT
         for item_detail in details_list:
             if hasattr(context, item_detail):
                 value = getattr(context, item_detail)
-            elif isinstance(context, dict) and item_detail in context:
+            elif context_is_dict and item_detail in context:
                 value = context[item_detail]
             else:
                 snippet[item_detail] = False
                 continue
 
             if isinstance(value, datetime.datetime):
-                value = value.strftime(TimeFormats.STANDARD_DATE_TIME_FORMAT)
+                value = value.strftime(date_time_format)
             snippet[item_detail] = value
         return snippet
 
@@ -355,6 +643,15 @@ class PrescriptionRecord(object):
                 return {}
         return prescription_instance_data
 
+    def _get_target_instance_data(self, target_instance=None):
+        """
+        Internal method to support record access, for methods which act on the current
+        instance unless a target instance is given
+        """
+        if target_instance:
+            return self._get_prescription_instance_data(target_instance)
+        return self._current_instance_data
+
     def get_prescription_instance_data(self, instance_number, raise_exception_on_missing=True):
         """
         Public method to support record access
@@ -380,8 +677,9 @@ class PrescriptionRecord(object):
         if not isinstance(issue_number, int):
             raise TypeError("Issue number must be an int")
 
-        issue_number_str = str(issue_number)
-        issue_data = self.prescription_record[fields.FIELD_INSTANCES].get(issue_number_str)
+        issue_data = self.prescription_record[fields.FIELD_INSTANCES].get(
+            _issue_number_str(issue_number)
+        )
 
         if not issue_data:
             self._handle_missing_issue(issue_number)
@@ -421,8 +719,16 @@ class PrescriptionRecord(object):
         :rtype: list(int)
         """
         # we have to convert instance numbers to ints, as they're stored as strings
-        issue_numbers = [int(i) for i in list(self.prescription_record["instances"].keys())]
-        return sorted(issue_numbers)
+        return sorted(map(int, self.prescription_record[fields.FIELD_INSTANCES]))
+
+    def _has_issue(self, issue_number):
+        """
+        Whether the prescription has an issue with this number, as stored on the record.
+
+        :type issue_number: int
+        :rtype: bool
+        """
+        return _issue_number_str(issue_number) in self.prescription_record[fields.FIELD_INSTANCES]
 
     def get_issue_numbers_in_range(self, lowest=None, highest=None):
         """
@@ -434,15 +740,9 @@ class PrescriptionRecord(object):
         :type highest: int or None
         :rtype: list(int)
         """
-        candidate_numbers = self.issue_numbers
-
-        if lowest is not None:
-            candidate_numbers = [i for i in candidate_numbers if i >= lowest]
-
-        if highest is not None:
-            candidate_numbers = [i for i in candidate_numbers if i <= highest]
-
-        return candidate_numbers
+        lowest = -math.inf if lowest is None else lowest
+        highest = math.inf if highest is None else highest
+        return [i for i in self.issue_numbers if lowest <= i <= highest]
 
     def get_issues_in_range(self, lowest=None, highest=None):
         """
@@ -472,11 +772,9 @@ class PrescriptionRecord(object):
 
         :rtype: list(int)
         """
-        expected_issue_numbers = range(1, self.max_repeats + 1)
-        actual_issue_numbers = self.issue_numbers
-        missing_issue_numbers = set(expected_issue_numbers) - set(actual_issue_numbers)
-
-        return sorted(list(missing_issue_numbers))
+        actual_issue_numbers = set(map(int, self.prescription_record[fields.FIELD_INSTANCES]))
+        # walking the expected range keeps the result sorted without a further sort
+        return [i for i in range(1, self.max_repeats + 1) if i not in actual_issue_numbers]
 
     @property
     def issues(self):
@@ -493,21 +791,31 @@ class PrescriptionRecord(object):
         """
         Internal property to support record access
         """
-        return self._get_prescription_instance_data(str(self.current_issue_number))
+        return self._get_prescription_instance_data(self._current_instance_key)
 
     @property
-    def current_issue_number(self):
+    def _current_instance_key(self):
         """
-        The current issue number of this prescription.
+        The current issue number as stored on the record, which is also the key of the
+        current instance - avoids round-tripping through int where the key is all we need
 
-        :rtype: int
+        :rtype: str
         """
         current_issue_number_str = self.prescription_record[fields.FIELD_PRESCRIPTION].get(
             fields.FIELD_CURRENT_INSTANCE
         )
         if not current_issue_number_str:
             self._handle_missing_issue(fields.FIELD_CURRENT_INSTANCE)
-        return int(current_issue_number_str)
+        return current_issue_number_str
+
+    @property
+    def current_issue_number(self):
+        """
+        The current issue number of this prescription.
+
+        :rtype: int
+        """
+        return int(self._current_instance_key)
 
     @current_issue_number.setter
     def current_issue_number(self, value):
@@ -558,14 +866,13 @@ class PrescriptionRecord(object):
         """
         Internal property to support record access
         """
-        obj = self.prescription_record.get(fields.FIELD_PRESCRIPTION, {}).get(
-            fields.FIELD_PENDING_CANCELLATIONS
-        )
-        if not obj:
+        try:
+            obj = self.prescription_record[fields.FIELD_PRESCRIPTION][
+                fields.FIELD_PENDING_CANCELLATIONS
+            ]
+        except KeyError:
             return False
-        if isinstance(obj, list) and obj:
-            return True
-        return False
+        return isinstance(obj, list) and bool(obj)
 
     @_pending_cancellations.setter
     def _pending_cancellations(self, value):
@@ -604,25 +911,16 @@ class PrescriptionRecord(object):
 
         :rtype: datetime.datetime
         """
-        prescription_time_str = self.prescription_record[fields.FIELD_PRESCRIPTION][
-            fields.FIELD_PRESCRIPTION_TIME
-        ]
-        prescription_time = datetime.datetime.strptime(
-            prescription_time_str, TimeFormats.STANDARD_DATE_TIME_FORMAT
+        return _parse_prescription_time(
+            self.prescription_record[fields.FIELD_PRESCRIPTION][fields.FIELD_PRESCRIPTION_TIME]
         )
-        return prescription_time
 
     @property
     def _release_version(self):
         """
         Internal property to support record access
         """
-        prescriptionID = str(self.return_prescription_id())
-        idLength = len(prescriptionID)
-        if idLength in fields.R1_PRESCRIPTIONID_LENGTHS:
-            return fields.R1_VERSION
-        if idLength in fields.R2_PRESCRIPTIONID_LENGTHS:
-            return fields.R2_VERSION
+        return _release_version_for_id(self.return_prescription_id())
 
     def get_release_version(self):
         """
@@ -637,17 +935,13 @@ class PrescriptionRecord(object):
         """
         release_version = self._release_version
         status_list = self.return_prescription_status_set()
-        return_set = []
-        for each_status in status_list:
-            if not is_string:
-                for each_index in index_prefix:
-                    new_value = each_index + "|" + release_version + "|" + each_status
-                    return_set.append(new_value)
-            else:
-                new_value = index_prefix + "|" + release_version + "|" + each_status
-                return_set.append(new_value)
-
-        return return_set
+        if is_string:
+            return [f"{index_prefix}|{release_version}|{status}" for status in status_list]
+        return [
+            f"{each_index}|{release_version}|{status}"
+            for status in status_list
+            for each_index in index_prefix
+        ]
 
     def update_nominated_performer(self, context):
         """
@@ -686,36 +980,93 @@ class PrescriptionRecord(object):
         """
         Return the Nominated Pharmacy
         """
-        return self.prescription_record.get(fields.FIELD_NOMINATION, {}).get(
-            fields.FIELD_NOMINATED_PERFORMER
-        )
+        try:
+            return self.prescription_record[fields.FIELD_NOMINATION].get(
+                fields.FIELD_NOMINATED_PERFORMER
+            )
+        except KeyError:
+            return None
 
     def return_disp_site_or_nom_pharm(self, instance):
         """
         Returns the Dispensing Site if available, otherwise, returns the Nominated Pharmacy
         or None if neither exist
         """
-        disp_site = instance.get(fields.FIELD_DISPENSE, {}).get(
-            fields.FIELD_DISPENSING_ORGANIZATION
-        )
-        if not disp_site:
-            disp_site = self.return_nom_pharm()
-        return disp_site
+        try:
+            disp_site = instance[fields.FIELD_DISPENSE].get(fields.FIELD_DISPENSING_ORGANIZATION)
+        except KeyError:
+            disp_site = None
+        return disp_site or self.return_nom_pharm()
+
+    def _return_dispensing_site_instances(self):
+        """
+        Walk the instances once, pairing each with its dispensing site, or the Nominated
+        Pharmacy if not yet downloaded. Instances with neither are skipped.
+
+        :rtype: list(tuple(str, dict))
+        """
+        nom_pharm = self.return_nom_pharm()
+        field_dispense = fields.FIELD_DISPENSE
+        field_dispensing_organization = fields.FIELD_DISPENSING_ORGANIZATION
+        site_instances = []
+        for instance_key, instance in self.prescription_record[fields.FIELD_INSTANCES].items():
+            if not instance:
+                self._handle_missing_issue(instance_key)
+            try:
+                disp_site = instance[field_dispense].get(field_dispensing_organization) or nom_pharm
+            except KeyError:
+                disp_site = nom_pharm
+            if disp_site:
+                site_instances.append((disp_site, instance))
+        return site_instances
+
+    @staticmethod
+    def _dispenser_date_terms(index_start, disp_sites, prescription_time):
+        """
+        Build the dispenser date index terms for each of the dispensing sites
+        """
+        return {index_start + disp_site + "|" + prescription_time for disp_site in disp_sites}
+
+    def return_dispenser_indexes(self):
+        """
+        Return the dispensing site status and all dispenser date index terms, keyed on
+        index name, from a single walk of the instances. The individual return_*_index
+        methods return the same terms for callers that only need one of them.
+        """
+        nhs_number = self.return_nhs_number()
+        prescriber = self.return_prescribing_organisation()
+        prescription_time = self.return_prescription_time()
+        site_instances = self._return_dispensing_site_instances()
+        disp_sites = {disp_site for disp_site, _ in site_instances}
+
+        return {
+            indexes.INDEX_DISPENSER_STATUS: {
+                disp_site + "_" + instance[fields.FIELD_PRESCRIPTION_STATUS]
+                for disp_site, instance in site_instances
+            },
+            indexes.INDEX_NHSNUMBER_PRDSDATE: self._dispenser_date_terms(
+                nhs_number + "|" + prescriber + "|", disp_sites, prescription_time
+            ),
+            indexes.INDEX_PRESCRIBER_DSDATE: self._dispenser_date_terms(
+                prescriber + "|", disp_sites, prescription_time
+            ),
+            indexes.INDEX_DISPENSER_DATE: self._dispenser_date_terms(
+                "", disp_sites, prescription_time
+            ),
+            indexes.INDEX_NHSNUMBER_DSDATE: self._dispenser_date_terms(
+                nhs_number + "|", disp_sites, prescription_time
+            ),
+        }
 
     def return_disp_site_status_index(self):
         """
         Return the dispensing organization and the prescription status.
         If nominated but not yet downloaded, return NomPharm instead of dispensing org
         """
-        dispensing_site_statuses = set()
-        for instance_key in self.prescription_record[fields.FIELD_INSTANCES]:
-            instance = self._get_prescription_instance_data(instance_key)
-            disp_site = self.return_disp_site_or_nom_pharm(instance)
-            if not disp_site:
-                continue
-            presc_status = instance[fields.FIELD_PRESCRIPTION_STATUS]
-            dispensing_site_statuses.add(disp_site + "_" + presc_status)
-
+        dispensing_site_statuses = {
+            disp_site + "_" + instance[fields.FIELD_PRESCRIPTION_STATUS]
+            for disp_site, instance in self._return_dispensing_site_instances()
+        }
         return [True, dispensing_site_statuses]
 
     def return_nhs_number_prescriber_dispenser_date_index(self):
@@ -726,15 +1077,8 @@ class PrescriptionRecord(object):
         prescriber = self.return_prescribing_organisation()
         index_start = nhs_number + "|" + prescriber + "|"
         prescription_time = self.return_prescription_time()
-        nhs_number_presc_disp_dates = set()
-        for instance_key in self.prescription_record[fields.FIELD_INSTANCES]:
-            instance = self._get_prescription_instance_data(instance_key)
-            disp_site = self.return_disp_site_or_nom_pharm(instance)
-            if not disp_site:
-                continue
-            nhs_number_presc_disp_dates.add(index_start + disp_site + "|" + prescription_time)
-
-        return [True, nhs_number_presc_disp_dates]
+        disp_sites = {disp_site for disp_site, _ in self._return_dispensing_site_instances()}
+        return [True, self._dispenser_date_terms(index_start, disp_sites, prescription_time)]
 
     def return_prescriber_dispenser_date_index(self):
         """
@@ -743,31 +1087,16 @@ class PrescriptionRecord(object):
         prescriber = self.return_prescribing_organisation()
         index_start = prescriber + "|"
         prescription_time = self.return_prescription_time()
-        presc_disp_dates = set()
-        for instance_key in self.prescription_record[fields.FIELD_INSTANCES]:
-            instance = self._get_prescription_instance_data(instance_key)
-            disp_site = self.return_disp_site_or_nom_pharm(instance)
-            if not disp_site:
-                continue
-            presc_disp_dates.add(index_start + disp_site + "|" + prescription_time)
-
-        return [True, presc_disp_dates]
+        disp_sites = {disp_site for disp_site, _ in self._return_dispensing_site_instances()}
+        return [True, self._dispenser_date_terms(index_start, disp_sites, prescription_time)]
 
     def return_dispenser_date_index(self):
         """
         Return the dispensingOrganization and the prescription date
         """
-        index_start = ""
         prescription_time = self.return_prescription_time()
-        presc_disp_dates = set()
-        for instance_key in self.prescription_record[fields.FIELD_INSTANCES]:
-            instance = self._get_prescription_instance_data(instance_key)
-            disp_site = self.return_disp_site_or_nom_pharm(instance)
-            if not disp_site:
-                continue
-            presc_disp_dates.add(index_start + disp_site + "|" + prescription_time)
-
-        return [True, presc_disp_dates]
+        disp_sites = {disp_site for disp_site, _ in self._return_dispensing_site_instances()}
+        return [True, self._dispenser_date_terms("", disp_sites, prescription_time)]
 
     def return_nhs_number_dispenser_date_index(self):
         """
@@ -776,15 +1105,8 @@ class PrescriptionRecord(object):
         nhs_number = self.return_nhs_number()
         index_start = nhs_number + "|"
         prescription_time = self.return_prescription_time()
-        nhs_number_disp_dates = set()
-        for instance_key in self.prescription_record[fields.FIELD_INSTANCES]:
-            instance = self._get_prescription_instance_data(instance_key)
-            disp_site = self.return_disp_site_or_nom_pharm(instance)
-            if not disp_site:
-                continue
-            nhs_number_disp_dates.add(index_start + disp_site + "|" + prescription_time)
-
-        return [True, nhs_number_disp_dates]
+        disp_sites = {disp_site for disp_site, _ in self._return_dispensing_site_instances()}
+        return [True, self._dispenser_date_terms(index_start, disp_sites, prescription_time)]
 
     def return_nominated_performer(self):
         """
@@ -840,41 +1162,32 @@ class PrescriptionRecord(object):
         Return the pending cancellations flag
         """
         prescription = self.prescription_record[fields.FIELD_PRESCRIPTION]
-        max_repeats = prescription.get(fields.FIELD_MAX_REPEATS)
-
-        if not max_repeats:
-            max_repeats = 1
+        # pending cancellations are only ever summarised against the current issue, so
+        # there is no need to walk the other issues
+        current_issue = self.prescription_record[fields.FIELD_INSTANCES].get(
+            str(prescription[fields.FIELD_CURRENT_INSTANCE])
+        )
+        # handle missing issues
+        if not current_issue:
+            return False
 
-        for prescription_issue in range(1, int(max_repeats) + 1):
-            prescription_issue = self.prescription_record[fields.FIELD_INSTANCES].get(
-                str(prescription_issue)
-            )
-            # handle missing issues
-            if not prescription_issue:
-                continue
-            issue_specific_cancellations = {}
-            applied_cancellations_for_issue = prescription_issue.get(fields.FIELD_CANCELLATIONS, [])
-            cancellation_status_string_prefix = ""
-            self._create_cancellation_summary_dict(
-                applied_cancellations_for_issue,
-                issue_specific_cancellations,
-                cancellation_status_string_prefix,
-            )
-            if str(prescription_issue[fields.FIELD_INSTANCE_NUMBER]) == str(
-                prescription[fields.FIELD_CURRENT_INSTANCE]
-            ):
-                pending_cancellations = prescription[fields.FIELD_PENDING_CANCELLATIONS]
-                cancellation_status_string_prefix = "Pending: "
-                self._create_cancellation_summary_dict(
-                    pending_cancellations,
-                    issue_specific_cancellations,
-                    cancellation_status_string_prefix,
-                )
-                for _, val in issue_specific_cancellations.items():
-                    if val.get(fields.FIELD_REASONS, "")[:7] == "Pending":
-                        return True
+        pending_cancellations = prescription[fields.FIELD_PENDING_CANCELLATIONS]
+        # only pending cancellations are seeded with the "Pending" prefix, so with none
+        # recorded there is nothing to find
+        if not pending_cancellations:
+            return False
 
-        return False
+        issue_specific_cancellations = {}
+        self._create_cancellation_summary_dict(
+            current_issue.get(fields.FIELD_CANCELLATIONS, []), issue_specific_cancellations, ""
+        )
+        self._create_cancellation_summary_dict(
+            pending_cancellations, issue_specific_cancellations, "Pending: "
+        )
+        return any(
+            val.get(fields.FIELD_REASONS, "").startswith("Pending")
+            for val in issue_specific_cancellations.values()
+        )
 
     def _create_cancellation_summary_dict(
         self, recorded_cancellations, issue_cancellation_dict, cancellation_status
@@ -888,20 +1201,17 @@ class PrescriptionRecord(object):
         if not recorded_cancellations:
             return
 
+        change_log = self.prescription_record[fields.FIELD_CHANGE_LOG]
+        field_id = fields.FIELD_ID
+        field_reasons = fields.FIELD_REASONS
         for cancellation in recorded_cancellations:
-            subsequent_reason = False
-            cancellation_reasons = str(cancellation_status)
-
             cancellation_id = cancellation.get(fields.FIELD_CANCELLATION_ID, [])
-            scn = PrescriptionsChangeLogProcessor.get_scn(
-                self.prescription_record["changeLog"].get(cancellation_id, {})
+            scn = PrescriptionsChangeLogProcessor.get_scn(change_log.get(cancellation_id, {}))
+            # the reason text is everything between the code and any further colon
+            cancellation_reasons = cancellation_status + "; ".join(
+                str(handle_encoding_oddities(cancellation_reason.split(":", 2)[1].strip()))
+                for cancellation_reason in cancellation.get(field_reasons, [])
             )
-            for cancellation_reason in cancellation.get(fields.FIELD_REASONS, []):
-                cancellation_text = cancellation_reason.split(":")[1].strip()
-                if subsequent_reason:
-                    cancellation_reasons += "; "
-                subsequent_reason = True
-                cancellation_reasons += str(handle_encoding_oddities(cancellation_text))
 
             if cancellation.get(fields.FIELD_CANCELLATION_TARGET) == "Prescription":  # noqa: SIM108
                 cancellation_target = fields.FIELD_PRESCRIPTION
@@ -909,7 +1219,7 @@ class PrescriptionRecord(object):
                 cancellation_target = cancellation.get(fields.FIELD_CANCEL_LINE_ITEM_REF)
 
             if (
-                issue_cancellation_dict.get(cancellation_target, {}).get(fields.FIELD_ID)
+                issue_cancellation_dict.get(cancellation_target, {}).get(field_id)
                 == cancellation_id
             ):
                 # Cancellation has already been added and this is pending as multiple cancellations are not possible
@@ -917,8 +1227,8 @@ class PrescriptionRecord(object):
 
             issue_cancellation_dict[cancellation_target] = {
                 fields.FIELD_SCN: scn,
-                fields.FIELD_REASONS: cancellation_reasons,
-                fields.FIELD_ID: cancellation_id,
+                field_reasons: cancellation_reasons,
+                field_id: cancellation_id,
             }
 
     def return_current_instance(self):
@@ -928,7 +1238,7 @@ class PrescriptionRecord(object):
         ..  deprecated::
             use "current_issue_number" instead (which returns int instead of string)
         """
-        return str(self.current_issue_number)
+        return self._current_instance_key
 
     def return_prescription_status(self, instance_number, raise_exception_on_missing=True):
         """
@@ -1039,64 +1349,25 @@ class PrescriptionRecord(object):
         """
         Consistency check fields
         """
-        if prescription_status == PrescriptionStatus.WITH_DISPENSER:
-            check_list = [fields.FIELD_DISPENSING_ORGANIZATION]
-        elif prescription_status == PrescriptionStatus.WITH_DISPENSER_ACTIVE:
-            check_list = [fields.FIELD_DISPENSING_ORGANIZATION, fields.FIELD_LAST_DISPENSE_DATE]
-        elif prescription_status in [PrescriptionStatus.DISPENSED, PrescriptionStatus.CLAIMED]:
-            check_list = [fields.FIELD_LAST_DISPENSE_DATE]
-        else:
-            check_list = []
-
-        return check_list
+        return self._DISPENSE_CHECKS.get(prescription_status, ())
 
     def _get_instance_list_to_check(self, prescription_status):
         """
         Consistency check fields
         """
-        if prescription_status == PrescriptionStatus.EXPIRED:
-            check_list = [fields.FIELD_COMPLETION_DATE, fields.FIELD_EXPIRY_DATE]
-        elif prescription_status in [
-            PrescriptionStatus.CANCELLED,
-            PrescriptionStatus.NOT_DISPENSED,
-        ]:
-            check_list = [fields.FIELD_COMPLETION_DATE]
-        elif prescription_status in [
-            PrescriptionStatus.AWAITING_RELEASE_READY,
-            PrescriptionStatus.REPEAT_DISPENSE_FUTURE_INSTANCE,
-        ]:
-            check_list = [
-                fields.FIELD_DISPENSE_WINDOW_LOW_DATE,
-                fields.FIELD_NOMINATED_DOWNLOAD_DATE,
-            ]
-        else:
-            check_list = []
-
-        return check_list
+        return self._INSTANCE_CHECKS.get(prescription_status, ())
 
     def _get_prescription_list_to_check(self, prescription_status):
         """
         Consistency check fields
         """
-        if prescription_status in [
-            PrescriptionStatus.AWAITING_RELEASE_READY,
-            PrescriptionStatus.REPEAT_DISPENSE_FUTURE_INSTANCE,
-        ]:
-            check_list = [fields.FIELD_PRESCRIPTION_TIME]
-        else:
-            check_list = [fields.FIELD_PRESCRIPTION_TREATMENT_TYPE, fields.FIELD_PRESCRIPTION_TIME]
-
-        return check_list
+        return self._PRESCRIPTION_CHECKS.get(prescription_status, self._PRESCRIPTION_CHECKS_DEFAULT)
 
     def _get_claim_list_to_check(self, prescription_status):
         """
         Consistency check fields
         """
-        return (
-            [fields.FIELD_CLAIM_RECEIVED_DATE]
-            if prescription_status == PrescriptionStatus.CLAIMED
-            else []
-        )
+        return self._CLAIM_CHECKS.get(prescription_status, ())
 
     def _get_nominate_list_to_check(self):
         """
@@ -1106,9 +1377,9 @@ class PrescriptionRecord(object):
             fields.FIELD_PRESCRIPTION_TREATMENT_TYPE
         ]
         return (
-            [fields.FIELD_NOMINATED_PERFORMER]
+            (fields.FIELD_NOMINATED_PERFORMER,)
             if p_t_type == fields.TREATMENT_TYPE_REPEAT_DISPENSE
-            else []
+            else ()
         )
 
     def check_record_consistency(self, context):
@@ -1179,9 +1450,10 @@ class PrescriptionRecord(object):
         for each field
         """
         for req_field in list_of_checks:
-            if req_field not in record_part:
+            value = record_part.get(req_field, _MISSING)
+            if value is _MISSING:
                 test_failures.append("Mandatory item " + req_field + " missing")
-            if not record_part[req_field]:
+            elif not value:
                 if fail_on_none:
                     test_failures.append("Mandatory item " + req_field + " set to None")
                     return
@@ -1194,11 +1466,12 @@ class PrescriptionRecord(object):
         Check if the issue is the final one, this may be because the current issue is
         already at max_repeats, or becuase subsequent issues are missing
         """
-        if issue_number == self.max_repeats:
+        max_repeats = self.max_repeats
+        if issue_number == max_repeats:
             return True
 
-        for i in range(int(issue_number) + 1, int(self.max_repeats + 1)):
-            issue_data = self._get_prescription_instance_data(str(i), False)
+        for i in range(int(issue_number) + 1, max_repeats + 1):
+            issue_data = self._get_prescription_instance_data(_issue_number_str(i), False)
             if issue_data.get(fields.FIELD_PRESCRIPTION_STATUS):
                 return False
         return True
@@ -1222,8 +1495,9 @@ class PrescriptionRecord(object):
             if not instance_dict.get(fields.FIELD_PRESCRIPTION_STATUS):
                 continue
 
-            issue = PrescriptionIssue(instance_dict)
-            nad_status = self.set_nad_status(test_sites, context, str(issue.number))
+            # only the issue number is needed here, so read it without wrapping the dict
+            issue_number = int(instance_dict[fields.FIELD_INSTANCE_NUMBER])
+            nad_status = self.set_nad_status(test_sites, context, str(issue_number))
             [next_activity, next_activity_date, expiry_date] = (
                 self.nad_generator.next_activity_date(nad_status, nad_reference)
             )
@@ -1235,15 +1509,15 @@ class PrescriptionRecord(object):
             instance_dict[fields.FIELD_NEXT_ACTIVITY][fields.FIELD_DATE] = next_activity_date
 
             if isinstance(expiry_date, datetime.datetime):
-                expiry_date = expiry_date.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+                expiry_date = date_as_standard_string(expiry_date)
 
             instance_dict[fields.FIELD_EXPIRY_DATE] = expiry_date
 
-            issue_is_final = self.determine_if_final_issue(issue.number)
+            issue_is_final = self.determine_if_final_issue(issue_number)
 
             if not self._include_next_activity_for_instance(
                 next_activity,
-                issue.number,
+                issue_number,
                 self.current_issue_number,
                 self.max_repeats,
                 issue_is_final,
@@ -1260,8 +1534,12 @@ class PrescriptionRecord(object):
                 earliest_activity_date = next_activity_date
                 earliest_activity = next_activity
 
-            # Note: string comparison of dates in YYYYMMDD format
-            if next_activity_date <= earliest_activity_date:
+            # On a tie-break, user impacting activities take precedence (in priority order).
+            # Only a user impacting next_activity can displace the current earliest.
+            elif (
+                next_activity_date == earliest_activity_date
+                and next_activity in self._USER_IMPACTING_ACTIVITIES
+            ):
                 for activity in fields.USER_IMPACTING_ACTIVITY:
                     if next_activity == activity or earliest_activity == activity:
                         earliest_activity = activity
@@ -1302,30 +1580,15 @@ class PrescriptionRecord(object):
         issue_is_before_current = issue_number < current_issue_number
         all_remaining_issues_missing = (issue_number < current_issue_number) and (issue_is_final)
 
-        # default for future issue
-        permitted_activities = []
-
         if (issue_is_current and issue_is_final) or all_remaining_issues_missing:
-            # final issue
-            permitted_activities = [
-                fields.NEXTACTIVITY_EXPIRE,
-                fields.NEXTACTIVITY_CREATENOCLAIM,
-                fields.NEXTACTIVITY_READY,
-                fields.NEXTACTIVITY_DELETE,
-                fields.NEXTACTIVITY_PURGE,
-            ]
-
+            permitted_activities = self._FINAL_ISSUE_ACTIVITIES
         elif issue_is_before_current:
-            # previous issue
-            permitted_activities = [fields.NEXTACTIVITY_CREATENOCLAIM]
-
+            permitted_activities = self._PREVIOUS_ISSUE_ACTIVITIES
         elif issue_is_current:
-            # current issue
-            permitted_activities = [
-                fields.NEXTACTIVITY_EXPIRE,
-                fields.NEXTACTIVITY_READY,
-                fields.NEXTACTIVITY_CREATENOCLAIM,
-            ]
+            permitted_activities = self._CURRENT_ISSUE_ACTIVITIES
+        else:
+            # future issues support nothing
+            return False
 
         return next_activity in permitted_activities
 
@@ -1340,46 +1603,39 @@ class PrescriptionRecord(object):
         presc_details = self.prescription_record[fields.FIELD_PRESCRIPTION]
         inst_details = self._get_prescription_instance_data(instance_number_str, False)
 
-        nad_status = {}
-        nad_status[fields.FIELD_PRESCRIPTION_TREATMENT_TYPE] = presc_details[
-            fields.FIELD_PRESCRIPTION_TREATMENT_TYPE
-        ]
-        nad_status[fields.FIELD_PRESCRIPTION_DATE] = presc_details[fields.FIELD_PRESCRIPTION_TIME][
-            :8
-        ]
-        nad_status[fields.FIELD_RELEASE_VERSION] = self._release_version
-
-        if presc_details[fields.FIELD_PRESCRIBING_ORG] in test_prescribing_sites:
-            nad_status[fields.FIELD_PRESCRIBING_SITE_TEST_STATUS] = True
-        else:
-            nad_status[fields.FIELD_PRESCRIBING_SITE_TEST_STATUS] = False
-
-        nad_status[fields.FIELD_DISPENSE_WINDOW_HIGH_DATE] = inst_details[
-            fields.FIELD_DISPENSE_WINDOW_HIGH_DATE
-        ]
-        nad_status[fields.FIELD_DISPENSE_WINDOW_LOW_DATE] = inst_details[
-            fields.FIELD_DISPENSE_WINDOW_LOW_DATE
-        ]
-        nad_status[fields.FIELD_NOMINATED_DOWNLOAD_DATE] = inst_details[
-            fields.FIELD_NOMINATED_DOWNLOAD_DATE
-        ]
-        nad_status[fields.FIELD_LAST_DISPENSE_DATE] = inst_details[fields.FIELD_DISPENSE][
-            fields.FIELD_LAST_DISPENSE_DATE
-        ]
-        nad_status[fields.FIELD_LAST_DISPENSE_NOTIFICATION_MSG_REF] = inst_details[
-            fields.FIELD_DISPENSE
-        ][fields.FIELD_LAST_DISPENSE_NOTIFICATION_MSG_REF]
-        nad_status[fields.FIELD_COMPLETION_DATE] = inst_details[fields.FIELD_COMPLETION_DATE]
-        nad_status[fields.FIELD_CLAIM_SENT_DATE] = inst_details[fields.FIELD_CLAIM][
-            fields.FIELD_CLAIM_RECEIVED_DATE
-        ]
-        nad_status[fields.FIELD_HANDLE_TIME] = context.handleTime
-        nad_status[fields.FIELD_PRESCRIPTION_STATUS] = self.return_prescription_status(
-            instance_number_str
-        )
-        nad_status[fields.FIELD_INSTANCE_NUMBER] = instance_number_str
-
-        return nad_status
+        inst_dispense = inst_details[fields.FIELD_DISPENSE]
+
+        return {
+            fields.FIELD_PRESCRIPTION_TREATMENT_TYPE: presc_details[
+                fields.FIELD_PRESCRIPTION_TREATMENT_TYPE
+            ],
+            fields.FIELD_PRESCRIPTION_DATE: presc_details[fields.FIELD_PRESCRIPTION_TIME][:8],
+            fields.FIELD_RELEASE_VERSION: self._release_version,
+            fields.FIELD_PRESCRIBING_SITE_TEST_STATUS: (
+                presc_details[fields.FIELD_PRESCRIBING_ORG] in test_prescribing_sites
+            ),
+            fields.FIELD_DISPENSE_WINDOW_HIGH_DATE: inst_details[
+                fields.FIELD_DISPENSE_WINDOW_HIGH_DATE
+            ],
+            fields.FIELD_DISPENSE_WINDOW_LOW_DATE: inst_details[
+                fields.FIELD_DISPENSE_WINDOW_LOW_DATE
+            ],
+            fields.FIELD_NOMINATED_DOWNLOAD_DATE: inst_details[
+                fields.FIELD_NOMINATED_DOWNLOAD_DATE
+            ],
+            fields.FIELD_LAST_DISPENSE_DATE: inst_dispense[fields.FIELD_LAST_DISPENSE_DATE],
+            fields.FIELD_LAST_DISPENSE_NOTIFICATION_MSG_REF: inst_dispense[
+                fields.FIELD_LAST_DISPENSE_NOTIFICATION_MSG_REF
+            ],
+            fields.FIELD_COMPLETION_DATE: inst_details[fields.FIELD_COMPLETION_DATE],
+            fields.FIELD_CLAIM_SENT_DATE: inst_details[fields.FIELD_CLAIM][
+                fields.FIELD_CLAIM_RECEIVED_DATE
+            ],
+            fields.FIELD_HANDLE_TIME: context.handleTime,
+            # the instance has already been fetched, so read its status directly
+            fields.FIELD_PRESCRIPTION_STATUS: inst_details.get(fields.FIELD_PRESCRIPTION_STATUS),
+            fields.FIELD_INSTANCE_NUMBER: instance_number_str,
+        }
 
     def roll_forward_instance(self):
         """
@@ -1407,6 +1663,8 @@ class PrescriptionRecord(object):
         fields.FIELD_MAX_REPEATS - to match the max_repeats of the original record
         fields.FIELD_CURRENT_INSTANCE - to match the instanceNumber of the current record
 
+        valid_status_changes is the permitted [previous_status, new_status] pairs.
+
         Note that as per SPII-6085, we should permit a Repeat Prescribe message without a
         repeat number.
         """
@@ -1416,11 +1674,15 @@ class PrescriptionRecord(object):
         instance = self._get_prescription_instance_data(instance_number)
 
         stored_line_items = instance[fields.FIELD_LINE_ITEMS]
-        [stored_ids, passed_ids] = [set(), set()]
-        for line_item in stored_line_items:
-            stored_ids.add(str(line_item[fields.FIELD_ID]))
-        for line_item in passed_line_items:
-            passed_ids.add(str(line_item[fields.FIELD_ID]))
+        # index the stored line items on ID once, rather than rescanning them for every
+        # passed line item - reversed so the first stored match wins as before
+        stored_by_id = {
+            line_item[fields.FIELD_ID]: line_item for line_item in reversed(stored_line_items)
+        }
+        # read each passed ID once, for both the ID comparison and the matching below
+        passed_pairs = [(line_item[fields.FIELD_ID], line_item) for line_item in passed_line_items]
+        stored_ids = {str(line_item_id) for line_item_id in stored_by_id}
+        passed_ids = {str(line_item_id) for line_item_id, _ in passed_pairs}
         if stored_ids != passed_ids:
             self.log_object.write_log(
                 "EPS0146",
@@ -1433,20 +1695,23 @@ class PrescriptionRecord(object):
             )
             raise EpsBusinessError(EpsErrorBase.ITEM_NOT_FOUND)
 
-        for line_item in passed_line_items:
-            stored_line_item = self._return_matching_line_item(stored_line_items, line_item)
+        # callers pass the permitted transitions as [previous, new] pairs, so convert them
+        # once for hashed membership tests
+        valid_transitions = frozenset(tuple(change) for change in valid_status_changes)
+        for line_item_id, line_item in passed_pairs:
+            stored_line_item = stored_by_id.get(line_item_id)
             if not stored_line_item:
                 continue
 
             previous_status = stored_line_item[fields.FIELD_STATUS]
             new_status = line_item[fields.FIELD_STATUS]
-            if [previous_status, new_status] not in valid_status_changes:
+            if (previous_status, new_status) not in valid_transitions:
                 self.log_object.write_log(
                     "EPS0148",
                     None,
                     {
                         "internalID": self.internal_id,
-                        "lineItemID": line_item[fields.FIELD_ID],
+                        "lineItemID": line_item_id,
                         "previousStatus": previous_status,
                         "newStatus": new_status,
                     },
@@ -1465,7 +1730,7 @@ class PrescriptionRecord(object):
                             "internalID": self.internal_id,
                             "providedRepeatCount": (line_item[fields.FIELD_MAX_REPEATS]),
                             "storedRepeatCount": str(stored_line_item[fields.FIELD_MAX_REPEATS]),
-                            "lineItemID": line_item[fields.FIELD_ID],
+                            "lineItemID": line_item_id,
                         },
                     )
                     continue
@@ -1485,7 +1750,7 @@ class PrescriptionRecord(object):
                                 if self.max_repeats is None
                                 else str(self.max_repeats)
                             ),
-                            "lineItemID": line_item.get(fields.FIELD_ID),
+                            "lineItemID": line_item_id,
                         },
                     )
                     raise EpsBusinessError(EpsErrorBase.MAX_REPEAT_MISMATCH)
@@ -1498,7 +1763,7 @@ class PrescriptionRecord(object):
                             "internalID": self.internal_id,
                             "providedRepeatCount": (line_item[fields.FIELD_MAX_REPEATS]),
                             "storedRepeatCount": str(stored_line_item[fields.FIELD_MAX_REPEATS]),
-                            "lineItemID": line_item[fields.FIELD_ID],
+                            "lineItemID": line_item_id,
                         },
                     )
                     continue
@@ -1515,14 +1780,12 @@ class PrescriptionRecord(object):
                 )
                 raise EpsBusinessError(EpsErrorBase.MAX_REPEAT_MISMATCH)
 
-    def _return_matching_line_item(self, stored_line_items, line_item):
+    @property
+    def _max_repeats_str(self):
         """
-        Match on line item ID
+        Internal property to support record access - max repeats as stored, as a str
         """
-        for stored_line_item in stored_line_items:
-            if stored_line_item[fields.FIELD_ID] == line_item[fields.FIELD_ID]:
-                return stored_line_item
-        return None
+        return str(self.prescription_record[fields.FIELD_PRESCRIPTION][fields.FIELD_MAX_REPEATS])
 
     def return_details_for_release(self):
         """
@@ -1546,9 +1809,7 @@ class PrescriptionRecord(object):
         - Max repeats (if repeat type, otherwise return None)
         """
         current_issue = self.current_issue
-        max_repeats = str(
-            self.prescription_record[fields.FIELD_PRESCRIPTION][fields.FIELD_MAX_REPEATS]
-        )
+        max_repeats = self._max_repeats_str
         details = [
             str(current_issue.number),
             current_issue.status,
@@ -1574,6 +1835,17 @@ class PrescriptionRecord(object):
         last_dispense_date = instance[fields.FIELD_DISPENSE][fields.FIELD_LAST_DISPENSE_DATE]
         return last_dispense_date
 
+    def return_last_dispense_status_and_date(self, instance_number):
+        """
+        Return the last_dispense_status and last_dispense_date for the requested instance,
+        looking the instance up only once
+        """
+        instance = self._get_prescription_instance_data(instance_number)
+        return (
+            instance[fields.FIELD_LAST_DISPENSE_STATUS],
+            instance[fields.FIELD_DISPENSE][fields.FIELD_LAST_DISPENSE_DATE],
+        )
+
     def return_details_for_claim(self, instance_number_str):
         """
         For claim messages the following details are required:
@@ -1584,9 +1856,7 @@ class PrescriptionRecord(object):
         """
         issue_number = int(instance_number_str)
         issue = self.get_issue(issue_number)
-        max_repeats = str(
-            self.prescription_record[fields.FIELD_PRESCRIPTION][fields.FIELD_MAX_REPEATS]
-        )
+        max_repeats = self._max_repeats_str
         details = [
             issue.claim,
             issue.status,
@@ -1608,10 +1878,16 @@ class PrescriptionRecord(object):
         """
         For DPR changes currentInstance, instanceStatus and dispensing_org required
         """
-        dispensing_org = self._current_instance_data[fields.FIELD_DISPENSE][
+        # fetch the current instance once for both the status and dispensing org
+        current_instance = self._current_instance_data
+        dispensing_org = current_instance[fields.FIELD_DISPENSE][
             fields.FIELD_DISPENSING_ORGANIZATION
         ]
-        return (self.current_issue_number, self._current_instance_status, dispensing_org)
+        return (
+            self.current_issue_number,
+            current_instance[fields.FIELD_PRESCRIPTION_STATUS],
+            dispensing_org,
+        )
 
     def update_for_release(self, context):
         """
@@ -1624,7 +1900,7 @@ class PrescriptionRecord(object):
         self._current_instance_data[fields.FIELD_DISPENSE][
             fields.FIELD_DISPENSING_ORGANIZATION
         ] = context.agentOrganization
-        release_date = context.handleTime.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+        release_date = date_as_standard_string(context.handleTime)
         self._current_instance_data[fields.FIELD_RELEASE_DATE] = release_date
 
         self.update_line_item_status(
@@ -1653,14 +1929,13 @@ class PrescriptionRecord(object):
         else:
             instance = self._current_instance_data
 
-        instance[fields.FIELD_DISPENSE][fields.FIELD_LAST_DISPENSE_DATE] = context.dispenseDate
+        dispense = instance[fields.FIELD_DISPENSE]
+        dispense[fields.FIELD_LAST_DISPENSE_DATE] = context.dispenseDate
         instance[fields.FIELD_LAST_DISPENSE_STATUS] = context.prescriptionStatus
 
-        if hasattr(context, "agentOrganization"):
-            if context.agentOrganization:
-                instance[fields.FIELD_DISPENSE][
-                    fields.FIELD_DISPENSING_ORGANIZATION
-                ] = context.agentOrganization
+        agent_organization = getattr(context, "agentOrganization", None)
+        if agent_organization:
+            dispense[fields.FIELD_DISPENSING_ORGANIZATION] = agent_organization
 
         if context.prescriptionStatus in PrescriptionStatus.COMPLETED_STATES:
             instance[fields.FIELD_COMPLETION_DATE] = context.dispenseDate
@@ -1683,14 +1958,12 @@ class PrescriptionRecord(object):
         made in the interaction worker
         """
         instance = self._get_prescription_instance_data(context.targetInstance)
-        instance[fields.FIELD_DISPENSE][fields.FIELD_LAST_DISPENSE_DATE] = dispense_dict[
-            fields.FIELD_DISPENSE_DATE
-        ]
-        instance[fields.FIELD_LAST_DISPENSE_STATUS] = dispense_dict[
-            fields.FIELD_PRESCRIPTION_STATUS
-        ]
-        if dispense_dict[fields.FIELD_PRESCRIPTION_STATUS] in PrescriptionStatus.COMPLETED_STATES:
-            instance[fields.FIELD_COMPLETION_DATE] = dispense_dict[fields.FIELD_DISPENSE_DATE]
+        dispense_date = dispense_dict[fields.FIELD_DISPENSE_DATE]
+        prescription_status = dispense_dict[fields.FIELD_PRESCRIPTION_STATUS]
+        instance[fields.FIELD_DISPENSE][fields.FIELD_LAST_DISPENSE_DATE] = dispense_date
+        instance[fields.FIELD_LAST_DISPENSE_STATUS] = prescription_status
+        if prescription_status in PrescriptionStatus.COMPLETED_STATES:
+            instance[fields.FIELD_COMPLETION_DATE] = dispense_date
             self.set_next_instance_prior_issue_date(context, context.targetInstance)
             self.release_next_instance(
                 context,
@@ -1700,7 +1973,7 @@ class PrescriptionRecord(object):
                 context.targetInstance,
             )
         self.update_line_item_status_from_dispense(instance, dispense_dict[fields.FIELD_LINE_ITEMS])
-        self.update_instance_status(instance, dispense_dict[fields.FIELD_PRESCRIPTION_STATUS])
+        self.update_instance_status(instance, prescription_status)
 
     def update_for_claim(self, context, instance_number):
         """
@@ -1709,12 +1982,7 @@ class PrescriptionRecord(object):
         Do not update status of individual line items
         Add Claim details to record
         """
-        instance = self._get_prescription_instance_data(instance_number)
-        self.update_instance_status(instance, PrescriptionStatus.CLAIMED)
-        instance[fields.FIELD_CLAIM][fields.FIELD_CLAIM_RECEIVED_DATE] = context.claimDate
-        instance[fields.FIELD_CLAIM][fields.FIELD_CLAIM_STATUS] = fields.FIELD_CLAIMED_DISPLAY_NAME
-        instance[fields.FIELD_CLAIM][fields.FIELD_CLAIM_REBUILD] = False
-        instance[fields.FIELD_CLAIM][fields.FIELD_CLAIM_GUID] = context.dispenseClaimID
+        self._update_claim(context, instance_number, False)
 
     def update_for_claim_amend(self, context, instance_number):
         """
@@ -1727,16 +1995,25 @@ class PrescriptionRecord(object):
         Append the existing claimGUID into the historicClaimGUID List
         Add Claim details to record
         """
+        self._update_claim(context, instance_number, True)
+
+    def _update_claim(self, context, instance_number, is_amend):
+        """
+        Shared implementation of update_for_claim and update_for_claim_amend. On an amend
+        the existing claimGUID is kept in the historicClaimGUIDs list before it is replaced
+        """
         instance = self._get_prescription_instance_data(instance_number)
         self.update_instance_status(instance, PrescriptionStatus.CLAIMED)
-        instance[fields.FIELD_CLAIM][fields.FIELD_CLAIM_RECEIVED_DATE] = context.claimDate
-        instance[fields.FIELD_CLAIM][fields.FIELD_CLAIM_STATUS] = fields.FIELD_CLAIMED_DISPLAY_NAME
-        instance[fields.FIELD_CLAIM][fields.FIELD_CLAIM_REBUILD] = True
-        if fields.FIELD_HISTORIC_CLAIMS not in instance[fields.FIELD_CLAIM]:
-            instance[fields.FIELD_CLAIM][fields.FIELD_HISTORIC_CLAIM_GUIDS] = []
-        claim_guid = instance[fields.FIELD_CLAIM][fields.FIELD_CLAIM_GUID]
-        instance[fields.FIELD_CLAIM][fields.FIELD_HISTORIC_CLAIM_GUIDS].append(claim_guid)
-        instance[fields.FIELD_CLAIM][fields.FIELD_CLAIM_GUID] = context.dispenseClaimID
+        claim = instance[fields.FIELD_CLAIM]
+        claim[fields.FIELD_CLAIM_RECEIVED_DATE] = context.claimDate
+        claim[fields.FIELD_CLAIM_STATUS] = fields.FIELD_CLAIMED_DISPLAY_NAME
+        claim[fields.FIELD_CLAIM_REBUILD] = is_amend
+        if is_amend:
+            # new records hold False here until the first amend
+            historic_claim_guids = claim.get(fields.FIELD_HISTORIC_CLAIM_GUIDS) or []
+            historic_claim_guids.append(claim[fields.FIELD_CLAIM_GUID])
+            claim[fields.FIELD_HISTORIC_CLAIM_GUIDS] = historic_claim_guids
+        claim[fields.FIELD_CLAIM_GUID] = context.dispenseClaimID
 
     def update_for_return(self, _, retain_nomination=False):
         """
@@ -1809,42 +2086,59 @@ class PrescriptionRecord(object):
         rejected_list = []
 
         activity_to_look_for = fields.ACTIVITY_LOOKUP[action]
-        handle_date = context.handleTime.strftime(TimeFormats.STANDARD_DATE_FORMAT)
+        handle_date = date_as_standard_string(context.handleTime)
 
-        for issue in self.issues:
+        # the special cases depend only on the action, so select the per-issue check once
+        # rather than testing the action for every issue
+        special_check = None
+        stop_on_first_match = False
+        if action == fields.ADMIN_ACTION_RESET_NAD:
             # Special case to reset the NextActivityDate for prescriptions that were migrated without a NAD
-            if (issue.status == PrescriptionStatus.AWAITING_RELEASE_READY) and (
-                action == fields.ADMIN_ACTION_RESET_NAD
-            ):
-                issues_to_update.append(issue)
-            # Special case to allow the reset of the current instance
-            if action == fields.SPECIAL_RESET_CURRENT_INSTANCE:
-                issues_to_update.append(issue)
-                # break the loop once at least one issue has been identified.
-                if issues_to_update:
-                    break
+            special_check = self._confirm_nad_reset_on_issue
+        elif action == fields.SPECIAL_DISPENSE_RESET:
             # Special case to return the dispense notification to Spine in the case that it is 'hung'
-            if action == fields.SPECIAL_DISPENSE_RESET:
-                self._confirm_dispense_reset_on_issue(issues_to_update, issue)
+            special_check = self._confirm_dispense_reset_on_issue
+        elif action == fields.SPECIAL_APPLY_PENDING_CANCELLATIONS:
             # Special case to apply cancellations to those that weren't set post migration - issue 110898
-            if action == fields.SPECIAL_APPLY_PENDING_CANCELLATIONS:
-                self._confirm_cancellations_to_apply(issues_to_update, issue)
-                # break the loop once the first issue has been identified.
-                if issues_to_update:
-                    break
-            # NOTE: SPII-10495 some migrated prescriptions don't have the 'activity' field
-            # populated, so guard against this to avoid killing process.
-            if issue.next_activity is not None:
-                # Note: string comparison of dates in YYYYMMDD format
-                action_is_due = issue.next_activity_date_str <= handle_date
-
-                if (activity_to_look_for == issue.next_activity) and action_is_due:
-                    issues_to_update.append(issue)
-                else:
-                    rejection_ref = str(issue.number)
-                    rejection_ref += "|" + issue.next_activity
-                    rejection_ref += "|" + issue.next_activity_date_str
-                    rejected_list.append(rejection_ref)
+            special_check = self._confirm_cancellations_to_apply
+            # only the first issue needs to be identified.
+            stop_on_first_match = True
+
+        issues = self.issues
+        if action == fields.SPECIAL_RESET_CURRENT_INSTANCE:
+            # Special case to allow the reset of the current instance - the first issue is
+            # always identified, so there is no need to walk the rest
+            issues_to_update = issues[:1]
+        elif special_check:
+            # The special actions are never generated as a next activity, so only the
+            # special check can select an issue - filter the issues in one pass
+            if stop_on_first_match:
+                first_match = next((issue for issue in issues if special_check(issue)), None)
+                issues_to_update = [first_match] if first_match else []
+            else:
+                issues_to_update = [issue for issue in issues if special_check(issue)]
+            if not issues_to_update:
+                rejected_list = [
+                    f"{issue.number}|{issue.next_activity}|{issue.next_activity_date_str}"
+                    for issue in issues
+                    if issue.next_activity is not None
+                ]
+        else:
+            for issue in issues:
+                # NOTE: SPII-10495 some migrated prescriptions don't have the 'activity' field
+                # populated, so guard against this to avoid killing process.
+                next_activity = issue.next_activity
+                if next_activity is not None:
+                    next_activity_date_str = issue.next_activity_date_str
+                    # Note: string comparison of dates in YYYYMMDD format
+                    action_is_due = next_activity_date_str <= handle_date
+
+                    if (activity_to_look_for == next_activity) and action_is_due:
+                        issues_to_update.append(issue)
+                    else:
+                        rejected_list.append(
+                            f"{issue.number}|{next_activity}|{next_activity_date_str}"
+                        )
 
         if issues_to_update:
             # Note: calling code currently expects issue numbers as strings
@@ -1870,7 +2164,16 @@ class PrescriptionRecord(object):
                 },
             )
 
-    def _confirm_cancellations_to_apply(self, issues_to_update, issue):
+    def _confirm_nad_reset_on_issue(self, issue):
+        """
+        Only reset the next activity date of issues still awaiting release, as these may
+        have been migrated without one.
+
+        :rtype: bool
+        """
+        return issue.status == PrescriptionStatus.AWAITING_RELEASE_READY
+
+    def _confirm_cancellations_to_apply(self, issue):
         """
         Only apply pending cancellations to those issuse that are safe to cancel. It is
         fine to reapply cancellations that have already been successful, and cancellation
@@ -1879,11 +2182,12 @@ class PrescriptionRecord(object):
         The cancellation worker will apply the cancellation to the first available issue and
         all subsequent issues (due to constraints with active prescriptions, issue n+x must
         be cancellable if issue n is cancellable). So only need to identify the first issue
+
+        :rtype: bool
         """
-        if issue.status in PrescriptionStatus.CANCELLABLE_STATES:
-            issues_to_update.append(issue)
+        return issue.status in PrescriptionStatus.CANCELLABLE_STATES
 
-    def _confirm_dispense_reset_on_issue(self, issues_to_update, issue):
+    def _confirm_dispense_reset_on_issue(self, issue):
         """
         This code is to handle an exception that happened at go-live whereby some
         prescriptions could not be read and need to be reset in bulk. The conditions for
@@ -1896,33 +2200,14 @@ class PrescriptionRecord(object):
         was downloaded within the target window, but this was successfully processed and
         subsequently dispensed, releasing a new issue which may be status 0002, but will
         not have a release date within the target window.
-        """
-        # declared here as this whole method should be removed post clean-up
-        special_dispense_reset_dates = [
-            "20140824",
-            "20140825",
-            "20140826",
-            "20140827",
-            "20140828",
-            "20140829",
-            "20140830",
-            "20140831",
-            "20140901",
-            "20140902",
-            "20140903",
-            "20140904",
-            "20140905",
-            "20140906",
-            "20140907",
-            "20140908",
-        ]
-
-        if issue.status != PrescriptionStatus.WITH_DISPENSER:
-            return
 
-        release_date = issue.release_date
-        if release_date and str(release_date) in special_dispense_reset_dates:
-            issues_to_update.append(issue)
+        :rtype: bool
+        """
+        # release_date is always a str ("None" when absent), so membership alone is enough
+        return (
+            issue.status == PrescriptionStatus.WITH_DISPENSER
+            and issue.release_date in _SPECIAL_DISPENSE_RESET_DATES
+        )
 
     def update_by_action(self, context, nom_download_date_enabled=True):
         """
@@ -1968,60 +2253,8 @@ class PrescriptionRecord(object):
         issue = self.get_issue(target_issue_number)
 
         # dispatch based on action
-
-        if context.action == fields.ACTIVITY_NOMINATED_DOWNLOAD:
-            # make an issue available for download
-            self._update_make_available_for_nominated_download(issue)
-
-        elif context.action == fields.SPECIAL_RESET_CURRENT_INSTANCE:
-            old_current_issue_number, new_current_issue_number = self.reset_current_instance()
-            if old_current_issue_number != new_current_issue_number:
-                self.log_object.write_log(
-                    "EPS0401c",
-                    None,
-                    {
-                        "internalID": self.internal_id,
-                        "oldCurrentIssue": old_current_issue_number,
-                        "newCurrentIssue": new_current_issue_number,
-                        "prescriptionID": context.prescriptionID,
-                    },
-                )
-                self.current_issue_number = new_current_issue_number
-            else:
-                context.updatesToApply = False
-
-        elif context.action == fields.SPECIAL_DISPENSE_RESET:
-            # Special case to reset the dispense status. This needs to perform a dispense
-            # proposal return and then re-set the nominated performer
-            self.update_for_return(None, True)
-
-        elif context.action == fields.SPECIAL_APPLY_PENDING_CANCELLATIONS:
-            # No action to be taken at this level, just pass.
-            pass
-
-        elif context.action == fields.NEXTACTIVITY_EXPIRE:
-            # NOTE (SPII-10316): when requested to expire an issue, we must expire all
-            # subsequent issues as well, and set the current issue indicator to point at
-            # the last issue
-            issues_to_expire = self.get_issues_in_range(issue.number, None)
-            for issue_to_expire in issues_to_expire:
-                issue_to_expire.expire(context.handleTime, self)
-
-            self.current_issue_number = self.max_repeats
-
-        elif context.action == fields.NEXTACTIVITY_CREATENOCLAIM:
-            self._create_no_claim(issue, context.handleTime)
-            issue.mark_completed(context.handleTime, self)
-            self._move_to_next_issue_if_possible(issue.number, context, nom_download_date_enabled)
-
-        elif context.action == fields.ADMIN_ACTION_RESET_NAD:
-            # Log that the prescription has been touched, but no change should be made
-            self.log_object.write_log(
-                "EPS0401b",
-                None,
-                {"internalID": self.internal_id, "prescriptionID": context.prescriptionID},
-            )
-        else:
+        handler_name = self._INSTANCE_ACTION_HANDLERS.get(context.action)
+        if handler_name is None:
             # invalid action
             self.log_object.write_log(
                 "EPS0401",
@@ -2031,6 +2264,76 @@ class PrescriptionRecord(object):
                     "action": str(context.action),
                 },
             )
+            return
+        getattr(self, handler_name)(issue, context, nom_download_date_enabled)
+
+    def _action_nominated_download(self, issue, context, nom_download_date_enabled):
+        """
+        Make an issue available for download
+        """
+        self._update_make_available_for_nominated_download(issue)
+
+    def _action_reset_current_instance(self, issue, context, nom_download_date_enabled):
+        """
+        Reset the current instance, if it has moved on
+        """
+        old_current_issue_number, new_current_issue_number = self.reset_current_instance()
+        if old_current_issue_number != new_current_issue_number:
+            self.log_object.write_log(
+                "EPS0401c",
+                None,
+                {
+                    "internalID": self.internal_id,
+                    "oldCurrentIssue": old_current_issue_number,
+                    "newCurrentIssue": new_current_issue_number,
+                    "prescriptionID": context.prescriptionID,
+                },
+            )
+            self.current_issue_number = new_current_issue_number
+        else:
+            context.updatesToApply = False
+
+    def _action_dispense_reset(self, issue, context, nom_download_date_enabled):
+        """
+        Special case to reset the dispense status. This needs to perform a dispense
+        proposal return and then re-set the nominated performer
+        """
+        self.update_for_return(None, True)
+
+    def _action_apply_pending_cancellations(self, issue, context, nom_download_date_enabled):
+        """
+        No action to be taken at this level, just pass.
+        """
+
+    def _action_expire(self, issue, context, nom_download_date_enabled):
+        """
+        NOTE (SPII-10316): when requested to expire an issue, we must expire all
+        subsequent issues as well, and set the current issue indicator to point at
+        the last issue
+        """
+        issues_to_expire = self.get_issues_in_range(issue.number, None)
+        for issue_to_expire in issues_to_expire:
+            issue_to_expire.expire(context.handleTime, self)
+
+        self.current_issue_number = self.max_repeats
+
+    def _action_create_no_claim(self, issue, context, nom_download_date_enabled):
+        """
+        Mark the issue as no-claimed and complete, and move on to the next issue
+        """
+        self._create_no_claim(issue, context.handleTime)
+        issue.mark_completed(context.handleTime, self)
+        self._move_to_next_issue_if_possible(issue.number, context, nom_download_date_enabled)
+
+    def _action_reset_nad(self, issue, context, nom_download_date_enabled):
+        """
+        Log that the prescription has been touched, but no change should be made
+        """
+        self.log_object.write_log(
+            "EPS0401b",
+            None,
+            {"internalID": self.internal_id, "prescriptionID": context.prescriptionID},
+        )
 
     def _move_to_next_issue_if_possible(self, issue_number, context, nom_download_date_enabled):
         """
@@ -2058,16 +2361,9 @@ class PrescriptionRecord(object):
         Return the days supply from the prescription record, this will have been set to the
         value passed in the original prescription, or the default 28 days
         """
-        days_supply = self.prescription_record[fields.FIELD_PRESCRIPTION][fields.FIELD_DAYS_SUPPLY]
-        # Habdle records that were migrated with null daysSupply rather than 0.
-        if not days_supply:
-            return 0
-        if isinstance(days_supply, int):
-            return days_supply
-        # Habdle records that were migrated with blank space in the daysSupply rather than 0.
-        if not days_supply.strip():
-            return 0
-        return int(days_supply)
+        return _parse_days_supply(
+            self.prescription_record[fields.FIELD_PRESCRIPTION][fields.FIELD_DAYS_SUPPLY]
+        )
 
     def _create_no_claim(self, issue, handle_time):
         """
@@ -2099,11 +2395,13 @@ class PrescriptionRecord(object):
         Confirm that it is ok to delete the record by checking through the next activities
         of each of the prescription issues, if not then log and return false
         """
-        for issue_key in self.prescription_record[fields.FIELD_INSTANCES]:
-            issue = self._get_prescription_instance_data(issue_key)
-            next_activity_for_issue = issue.get(fields.FIELD_NEXT_ACTIVITY, {}).get(
-                fields.FIELD_ACTIVITY
-            )
+        field_next_activity = fields.FIELD_NEXT_ACTIVITY
+        field_activity = fields.FIELD_ACTIVITY
+        for issue_key, issue in self.prescription_record[fields.FIELD_INSTANCES].items():
+            if not issue:
+                self._handle_missing_issue(issue_key)
+            next_activity = issue.get(field_next_activity)
+            next_activity_for_issue = next_activity.get(field_activity) if next_activity else None
             if next_activity_for_issue == fields.NEXTACTIVITY_DELETE:
                 continue
 
@@ -2180,8 +2478,9 @@ class PrescriptionRecord(object):
         issue_numbers_to_update = self.get_issue_numbers_in_range(lowest, highest)
 
         # update the issues
+        admin_updates = self._resolve_admin_instance_updates(context)
         for issue_number in issue_numbers_to_update:
-            self._make_admin_instance_updates(context, issue_number)
+            self._make_admin_instance_updates(context, issue_number, admin_updates)
 
         return [True, None, None]
 
@@ -2198,22 +2497,27 @@ class PrescriptionRecord(object):
         """
         next_activity = self.return_next_activity_nad_bin()
         if next_activity:
-            if next_activity[0].startswith(fields.NEXTACTIVITY_PURGE):
+            if next_activity[0][:_PURGE_PREFIX_LEN] == fields.NEXTACTIVITY_PURGE:
                 return True
         return False
 
     @staticmethod
-    def _is_expiry_overdue(nad):
+    def _is_expiry_overdue(nad, today_str=None):
         """
         return True if Expiry is overdue or index isn't set
+
+        today_str may be passed in (as YYYYMMDD) where the caller needs today's date too
         """
         if not nad:
             return False
         if nad[0] is None:  # badly behaved prescriptions from pre-golive
             return False
-        if not nad[0][:6] == fields.NEXTACTIVITY_EXPIRE:
+        if not nad[0][:_EXPIRE_PREFIX_LEN] == fields.NEXTACTIVITY_EXPIRE:
             return False
-        if nad[0][7:15] >= datetime.datetime.now().strftime(TimeFormats.STANDARD_DATE_FORMAT):
+        if today_str is None:
+            today_str = date_as_standard_string(datetime.datetime.now())
+        # skip the separator to reach the YYYYMMDD date
+        if nad[0][_EXPIRE_PREFIX_LEN + 1 : _EXPIRE_PREFIX_LEN + 9] >= today_str:
             return False
         return True
 
@@ -2223,7 +2527,9 @@ class PrescriptionRecord(object):
         and prescription.
         """
         nad = context.epsRecord.return_next_activity_nad_bin()
-        if not self._is_expiry_overdue(nad):
+        # today's date is needed for both the overdue check and the completion date
+        today_str = date_as_standard_string(datetime.datetime.now())
+        if not self._is_expiry_overdue(nad, today_str):
             return
 
         self.log_object.write_log("EPS0335", None, {"internalID": self.internal_id})
@@ -2238,9 +2544,7 @@ class PrescriptionRecord(object):
 
         # Set the completion date if not already part of the admin update
         if not context.completionDate:
-            context.completionDate = datetime.datetime.now().strftime(
-                TimeFormats.STANDARD_DATE_FORMAT
-            )
+            context.completionDate = today_str
 
         # Create a LineDict if one does not already exist and ensure that all LineItems are included
         if not context.lineDict:
@@ -2319,16 +2623,44 @@ class PrescriptionRecord(object):
         instance[fields.FIELD_LAST_DISPENSE_STATUS] = context.lastDispenseStatus
         instance[fields.FIELD_COMPLETION_DATE] = context.completionDate
 
-    def _make_admin_instance_updates(self, context, instance_number):
+    def _resolve_admin_instance_updates(self, context):
+        """
+        Resolve which of the _ADMIN_INSTANCE_UPDATES are set on the context, so that the
+        context only needs checking once however many issues are updated.
+
+        :rtype: list(_ResolvedAdminUpdate)
+        """
+        admin_updates = []
+        for admin_update in self._ADMIN_INSTANCE_UPDATES:
+            context_value = getattr(context, admin_update.context_attr)
+            if not context_value:
+                continue
+            if admin_update.fixed_value is _FROM_CONTEXT:
+                new_value = logged_value = context_value
+            else:
+                new_value = admin_update.fixed_value
+                logged_value = str(new_value)
+            admin_updates.append(
+                _ResolvedAdminUpdate(
+                    section=admin_update.section,
+                    stored_field=admin_update.stored_field,
+                    logged_field=admin_update.logged_field,
+                    new_value=new_value,
+                    logged_value=logged_value,
+                )
+            )
+        return admin_updates
+
+    def _make_admin_instance_updates(self, context, instance_number, admin_updates=None):
         """
         Apply instance specific updates into record
+
+        admin_updates may be passed in where the same updates are applied to several
+        issues, see _resolve_admin_instance_updates
         """
         current_instance = str(instance_number)
         context.updateInstance = instance_number
-        prescription = self.prescription_record
-        instance = prescription[fields.FIELD_INSTANCES][current_instance]
-        dispense = instance[fields.FIELD_DISPENSE]
-        claim = instance[fields.FIELD_CLAIM]
+        instance = self.prescription_record[fields.FIELD_INSTANCES][current_instance]
 
         if context.prescriptionStatus:
             self.log_attribute_change(
@@ -2340,102 +2672,60 @@ class PrescriptionRecord(object):
             instance[fields.FIELD_PREVIOUS_STATUS] = instance[fields.FIELD_PRESCRIPTION_STATUS]
             instance[fields.FIELD_PRESCRIPTION_STATUS] = context.prescriptionStatus
 
-        if context.completionDate:
-            self.log_attribute_change(
-                fields.FIELD_COMPLETION_DATE,
-                instance[fields.FIELD_COMPLETION_DATE],
-                context.completionDate,
-                context.fieldsToUpdate,
-            )
-            instance[fields.FIELD_COMPLETION_DATE] = context.completionDate
-
-        if context.dispenseWindowLowDate:
-            self.log_attribute_change(
-                fields.FIELD_DISPENSE_WINDOW_LOW_DATE,
-                instance[fields.FIELD_DISPENSE_WINDOW_LOW_DATE],
-                context.dispenseWindowLowDate,
-                context.fieldsToUpdate,
-            )
-            instance[fields.FIELD_DISPENSE_WINDOW_LOW_DATE] = context.dispenseWindowLowDate
-
-        if context.nominatedDownloadDate:
-            self.log_attribute_change(
-                fields.FIELD_NOMINATED_DOWNLOAD_DATE,
-                instance[fields.FIELD_NOMINATED_DOWNLOAD_DATE],
-                context.nominatedDownloadDate,
-                context.fieldsToUpdate,
-            )
-            instance[fields.FIELD_NOMINATED_DOWNLOAD_DATE] = context.nominatedDownloadDate
-
-        if context.releaseDate:
-            self.log_attribute_change(
-                fields.FIELD_RELEASE_DATE,
-                instance[fields.FIELD_RELEASE_DATE],
-                context.releaseDate,
-                context.fieldsToUpdate,
-            )
-            instance[fields.FIELD_RELEASE_DATE] = context.releaseDate
-
-        if context.dispensingOrganization:
-            self.log_attribute_change(
-                fields.FIELD_DISPENSING_ORGANIZATION,
-                dispense[fields.FIELD_DISPENSING_ORGANIZATION],
-                context.dispensingOrganization,
-                context.fieldsToUpdate,
-            )
-            dispense[fields.FIELD_DISPENSING_ORGANIZATION] = context.dispensingOrganization
-
-        # This is to reset the dispensing org
-        if context.dispensingOrgNullFlavor:
-            self.log_attribute_change(
-                fields.FIELD_DISPENSING_ORGANIZATION,
-                dispense[fields.FIELD_DISPENSING_ORGANIZATION],
-                "None",
-                context.fieldsToUpdate,
-            )
-            dispense[fields.FIELD_DISPENSING_ORGANIZATION] = None
-
-        if context.lastDispenseDate:
+        if admin_updates is None:
+            admin_updates = self._resolve_admin_instance_updates(context)
+        fields_to_update = context.fieldsToUpdate
+        for admin_update in admin_updates:
+            section = admin_update.section
+            target = instance[section] if section else instance
+            previous_value = target[admin_update.stored_field]
+            if previous_value == admin_update.new_value:
+                # a re-asserted value is still reported as updated, but there is no change
+                # to make or log
+                if fields_to_update is not None:
+                    fields_to_update.append(admin_update.logged_field)
+                continue
             self.log_attribute_change(
-                fields.FIELD_LAST_DISPENSE_DATE,
-                dispense[fields.FIELD_LAST_DISPENSE_DATE],
-                context.lastDispenseDate,
-                context.fieldsToUpdate,
+                admin_update.logged_field,
+                previous_value,
+                admin_update.logged_value,
+                fields_to_update,
             )
-            dispense[fields.FIELD_LAST_DISPENSE_DATE] = context.lastDispenseDate
-
-        if context.claimSentDate:
-            self.log_attribute_change(
-                fields.FIELD_CLAIM_SENT_DATE,
-                claim[fields.FIELD_CLAIM_RECEIVED_DATE],
-                context.claimSentDate,
-                context.fieldsToUpdate,
+            target[admin_update.stored_field] = admin_update.new_value
+
+        # walk the line items once, looking each up in the (dict) lineDict, rather than
+        # rescanning all the line items for every changed line item
+        line_dict = context.lineDict
+        # an overdue expiry expires every line item that can be, whatever the lineDict says,
+        # so decide that once rather than for each line item
+        overdue_expiry = bool(context.overdueExpiry)
+        expiry_immutable_states = LineItemStatus.EXPIRY_IMMUTABLE_STATES
+        write_log = self.log_object.write_log
+        field_id = fields.FIELD_ID
+        field_status = fields.FIELD_STATUS
+        for current_line_item in instance[fields.FIELD_LINE_ITEMS]:
+            line_item_id = current_line_item[field_id]
+            if line_item_id not in line_dict:
+                continue
+            current_line_status = current_line_item[field_status]
+            if not overdue_expiry:
+                changed_line_status = line_dict[line_item_id]
+            elif current_line_status in expiry_immutable_states:
+                continue
+            else:
+                changed_line_status = LineItemStatus.EXPIRED
+            write_log(
+                "EPS0072",
+                None,
+                {
+                    "internalID": self.internal_id,
+                    "prescriptionID": context.prescriptionID,
+                    "lineItemChanged": line_item_id,
+                    "previousStatus": current_line_status,
+                    "newStatus": changed_line_status,
+                },
             )
-            claim[fields.FIELD_CLAIM_RECEIVED_DATE] = context.claimSentDate
-
-        for line_item_id in context.lineDict:
-            for current_line_item in instance[fields.FIELD_LINE_ITEMS]:
-                if current_line_item[fields.FIELD_ID] != line_item_id:
-                    continue
-                current_line_status = current_line_item[fields.FIELD_STATUS]
-                if context.overdueExpiry:
-                    if current_line_status in LineItemStatus.EXPIRY_IMMUTABLE_STATES:
-                        continue
-                    changed_line_status = LineItemStatus.EXPIRED
-                else:
-                    changed_line_status = context.lineDict[line_item_id]
-                self.log_object.write_log(
-                    "EPS0072",
-                    None,
-                    {
-                        "internalID": self.internal_id,
-                        "prescriptionID": context.prescriptionID,
-                        "lineItemChanged": line_item_id,
-                        "previousStatus": current_line_status,
-                        "newStatus": changed_line_status,
-                    },
-                )
-                current_line_item[fields.FIELD_STATUS] = changed_line_status
+            current_line_item[field_status] = changed_line_status
 
     def log_attribute_change(self, item_changed, previous_value, new_value, fields_to_update):
         """
@@ -2492,15 +2782,11 @@ class PrescriptionRecord(object):
         :type days_supply: int
         :type lead_days: int
         :rtype: datetime.datetime
-        :type next_issue_number: str
+        :type next_issue_number: int
         """
-        nominated_download_date = datetime.datetime.strptime(
-            prescribe_date, TimeFormats.STANDARD_DATE_FORMAT
-        )
-        duration = days_supply * (int(next_issue_number) - 1)
-        nominated_download_date += relativedelta(days=+duration)
-        nominated_download_date += relativedelta(days=-lead_days)
-        return nominated_download_date
+        nominated_download_date = standard_date_string_as_datetime(prescribe_date)
+        duration = days_supply * (next_issue_number - 1)
+        return nominated_download_date + datetime.timedelta(days=duration - lead_days)
 
     def _calculate_nominated_download_date_old(self, dispense_date, days_supply, lead_days):
         """
@@ -2511,12 +2797,8 @@ class PrescriptionRecord(object):
         :type lead_days: int
         :rtype: datetime.datetime
         """
-        nominated_download_date = datetime.datetime.strptime(
-            dispense_date, TimeFormats.STANDARD_DATE_FORMAT
-        )
-        nominated_download_date += relativedelta(days=+days_supply)
-        nominated_download_date += relativedelta(days=-lead_days)
-        return nominated_download_date
+        nominated_download_date = standard_date_string_as_datetime(dispense_date)
+        return nominated_download_date + datetime.timedelta(days=days_supply - lead_days)
 
     def return_next_issue_number(self, issue_number=None):
         """
@@ -2538,14 +2820,33 @@ class PrescriptionRecord(object):
         if not issue_number_str:
             return None
 
-        next_issue_number = int(issue_number_str) + 1
+        next_issue_number = self._next_future_issue_number(
+            int(issue_number_str), skip_check_for_correct_status
+        )
+        if next_issue_number is None:
+            return None
 
-        # make sure the prescription actually has this issue
-        if next_issue_number not in self.issue_numbers:
+        # Note: calling code is currently expecting a str, so convert,until we've had
+        # a chance to refactor properly
+        return _issue_number_str(next_issue_number)
+
+    def _next_future_issue_number(self, issue_number, skip_check_for_correct_status=False):
+        """
+        Find the next issue number after the specified one, if valid, working in ints
+        throughout. See _find_next_future_issue_number.
+
+        :type issue_number: int
+        :rtype: int or None
+        """
+        next_issue_number = issue_number + 1
+
+        # make sure the prescription actually has this issue - a hashed lookup on the
+        # instances rather than building the sorted issue_numbers list for each call
+        if not self._has_issue(next_issue_number):
             return None
 
         if skip_check_for_correct_status:
-            return str(next_issue_number)
+            return next_issue_number
 
         # examine the issue to make sure it's in the correct state
         next_issue = self.get_issue(next_issue_number)
@@ -2553,9 +2854,7 @@ class PrescriptionRecord(object):
             return None
 
         # if we get this far, then we have a valid next issue, so return its number
-        # Note: calling code is currently expecting a str, so convert,until we've had
-        # a chance to refactor properly
-        return str(next_issue_number)
+        return next_issue_number
 
     def set_next_instance_prior_issue_date(self, context, current_issue_number_str=None):
         """
@@ -2597,12 +2896,16 @@ class PrescriptionRecord(object):
         if not current_issue_number_str:
             current_issue_number_str = context.prescriptionRepeatLow
 
-        # find the number of the next issue, if there is a valid one
-        next_issue_number_str = self._find_next_future_issue_number(current_issue_number_str)
-        if next_issue_number_str is None:
+        # find the number of the next issue, if there is a valid one - kept as an int,
+        # and only converted to the str key form where the record or logs need it
+        next_issue_number = None
+        if current_issue_number_str:
+            next_issue_number = self._next_future_issue_number(int(current_issue_number_str))
+        if next_issue_number is None:
             # give up if there is no next issue
             self.pending_instance_change = None
             return
+        next_issue_number_str = _issue_number_str(next_issue_number)
 
         # update the issue
         dispense_date = self._extract_dispense_date_from_context(context)
@@ -2615,17 +2918,16 @@ class PrescriptionRecord(object):
                     {"internalID": self.internal_id, "prescriptionID": context.prescriptionID},
                 )
             nominated_download_date = self._calculate_nominated_download_date(
-                prescribe_date[:8], days_supply, nom_down_lead_days, next_issue_number_str
+                prescribe_date[:8], days_supply, nom_down_lead_days, next_issue_number
             )
+            nominated_download_date_str = date_as_standard_string(nominated_download_date)
             self.log_object.write_log(
                 "EPS0675",
                 None,
                 {
                     "internalID": self.internal_id,
                     "prescriptionID": context.prescriptionID,
-                    "nominatedDownloadDate": nominated_download_date.strftime(
-                        TimeFormats.STANDARD_DATE_FORMAT
-                    ),
+                    "nominatedDownloadDate": nominated_download_date_str,
                     "prescribeDate": prescribe_date,
                     "daysSupply": str(days_supply),
                     "leadDays": str(nom_down_lead_days),
@@ -2636,6 +2938,7 @@ class PrescriptionRecord(object):
             nominated_download_date = self._calculate_nominated_download_date_old(
                 dispense_date, days_supply, nom_down_lead_days
             )
+            nominated_download_date_str = date_as_standard_string(nominated_download_date)
 
         if nominated_download_date >= datetime.datetime(
             context.handleTime.year, context.handleTime.month, context.handleTime.day
@@ -2648,9 +2951,7 @@ class PrescriptionRecord(object):
         instance[fields.FIELD_PREVIOUS_STATUS] = instance[fields.FIELD_PRESCRIPTION_STATUS]
         instance[fields.FIELD_PRESCRIPTION_STATUS] = new_prescription_status
         instance[fields.FIELD_DISPENSE_WINDOW_LOW_DATE] = dispense_date
-        instance[fields.FIELD_NOMINATED_DOWNLOAD_DATE] = nominated_download_date.strftime(
-            TimeFormats.STANDARD_DATE_FORMAT
-        )
+        instance[fields.FIELD_NOMINATED_DOWNLOAD_DATE] = nominated_download_date_str
 
         # mark so that we know to update the prescription's current issue number
         self.pending_instance_change = next_issue_number_str
@@ -2671,11 +2972,7 @@ class PrescriptionRecord(object):
         """
         Add the reference to the dispense notification document to the instance.
         """
-        instance = (
-            self._get_prescription_instance_data(target_instance)
-            if target_instance
-            else self._current_instance_data
-        )
+        instance = self._get_target_instance_data(target_instance)
         instance[fields.FIELD_DISPENSE][
             fields.FIELD_LAST_DISPENSE_NOTIFICATION_MSG_REF
         ] = dn_document_ref
@@ -2692,11 +2989,13 @@ class PrescriptionRecord(object):
         Clear all but the release from the dispense history
         """
         instance = self._get_prescription_instance_data(target_instance)
+        dispense_history = instance[fields.FIELD_DISPENSE_HISTORY]
         new_dispense_history = {}
-        if fields.FIELD_RELEASE in instance[fields.FIELD_DISPENSE_HISTORY]:
-            release_snippet = copy(instance[fields.FIELD_DISPENSE_HISTORY][fields.FIELD_RELEASE])
-            new_dispense_history[fields.FIELD_RELEASE] = release_snippet
-        instance[fields.FIELD_DISPENSE_HISTORY] = copy(new_dispense_history)
+        if fields.FIELD_RELEASE in dispense_history:
+            new_dispense_history[fields.FIELD_RELEASE] = dispense_history[
+                fields.FIELD_RELEASE
+            ].copy()
+        instance[fields.FIELD_DISPENSE_HISTORY] = new_dispense_history
 
     def create_dispense_history_entry(self, dn_document_guid, target_instance=None):
         """
@@ -2709,32 +3008,25 @@ class PrescriptionRecord(object):
         Use the last dispense date from the record unless the last dispense time is passed
         in (used for release only).
         """
-        instance = (
-            self._get_prescription_instance_data(target_instance)
-            if target_instance
-            else self._current_instance_data
-        )
+        instance = self._get_target_instance_data(target_instance)
         instance[fields.FIELD_DISPENSE_HISTORY][dn_document_guid] = {}
         dispense_entry = instance[fields.FIELD_DISPENSE_HISTORY][dn_document_guid]
-        dispense_entry[fields.FIELD_DISPENSE] = copy(instance[fields.FIELD_DISPENSE])
-        dispense_entry[fields.FIELD_PRESCRIPTION_STATUS] = copy(
-            instance[fields.FIELD_PRESCRIPTION_STATUS]
-        )
-        dispense_entry[fields.FIELD_LAST_DISPENSE_STATUS] = copy(
-            instance[fields.FIELD_LAST_DISPENSE_STATUS]
-        )
-        line_items = []
-        for line_item in instance[fields.FIELD_LINE_ITEMS]:
-            line_item_copy = copy(line_item)
-            line_items.append(line_item_copy)
-        dispense_entry[fields.FIELD_LINE_ITEMS] = copy(line_items)
-        dispense_entry[fields.FIELD_COMPLETION_DATE] = copy(instance[fields.FIELD_COMPLETION_DATE])
+        dispense_entry[fields.FIELD_DISPENSE] = instance[fields.FIELD_DISPENSE].copy()
+        # statuses and dates are immutable strings, so only the dicts need copying
+        dispense_entry[fields.FIELD_PRESCRIPTION_STATUS] = instance[
+            fields.FIELD_PRESCRIPTION_STATUS
+        ]
+        dispense_entry[fields.FIELD_LAST_DISPENSE_STATUS] = instance[
+            fields.FIELD_LAST_DISPENSE_STATUS
+        ]
+        dispense_entry[fields.FIELD_LINE_ITEMS] = [
+            line_item.copy() for line_item in instance[fields.FIELD_LINE_ITEMS]
+        ]
+        dispense_entry[fields.FIELD_COMPLETION_DATE] = instance[fields.FIELD_COMPLETION_DATE]
 
-        instance_last_dispense = copy(
-            instance[fields.FIELD_DISPENSE][fields.FIELD_LAST_DISPENSE_DATE]
-        )
+        instance_last_dispense = instance[fields.FIELD_DISPENSE][fields.FIELD_LAST_DISPENSE_DATE]
         if not instance_last_dispense:
-            release_date = copy(instance[fields.FIELD_RELEASE_DATE])
+            release_date = instance[fields.FIELD_RELEASE_DATE]
             dispense_entry[fields.FIELD_DISPENSE][fields.FIELD_LAST_DISPENSE_DATE] = release_date
         else:
             dispense_entry[fields.FIELD_DISPENSE][
@@ -2758,24 +3050,24 @@ class PrescriptionRecord(object):
 
         instance[fields.FIELD_DISPENSE_HISTORY][fields.FIELD_RELEASE] = {}
         dispense_entry = instance[fields.FIELD_DISPENSE_HISTORY][fields.FIELD_RELEASE]
-        dispense_entry[fields.FIELD_DISPENSE] = copy(instance[fields.FIELD_DISPENSE])
-        dispense_entry[fields.FIELD_PRESCRIPTION_STATUS] = copy(
-            instance[fields.FIELD_PRESCRIPTION_STATUS]
-        )
-        dispense_entry[fields.FIELD_LAST_DISPENSE_STATUS] = copy(
-            instance[fields.FIELD_LAST_DISPENSE_STATUS]
-        )
+        dispense_entry[fields.FIELD_DISPENSE] = instance[fields.FIELD_DISPENSE].copy()
+        # statuses and dates are immutable strings, so only the dicts need copying
+        dispense_entry[fields.FIELD_PRESCRIPTION_STATUS] = instance[
+            fields.FIELD_PRESCRIPTION_STATUS
+        ]
+        dispense_entry[fields.FIELD_LAST_DISPENSE_STATUS] = instance[
+            fields.FIELD_LAST_DISPENSE_STATUS
+        ]
         line_items = []
+        field_status = fields.FIELD_STATUS
+        with_dispenser = LineItemStatus.WITH_DISPENSER
         for line_item in instance[fields.FIELD_LINE_ITEMS]:
-            line_item_copy = copy(line_item)
-            if (
-                line_item_copy[fields.FIELD_STATUS] != LineItemStatus.CANCELLED
-                and line_item_copy[fields.FIELD_STATUS] != LineItemStatus.EXPIRED
-            ):
-                line_item_copy[fields.FIELD_STATUS] = LineItemStatus.WITH_DISPENSER
+            line_item_copy = line_item.copy()
+            if line_item_copy[field_status] not in _TERMINAL_LINE_STATES:
+                line_item_copy[field_status] = with_dispenser
             line_items.append(line_item_copy)
         dispense_entry[fields.FIELD_LINE_ITEMS] = line_items
-        dispense_entry[fields.FIELD_COMPLETION_DATE] = copy(instance[fields.FIELD_COMPLETION_DATE])
+        dispense_entry[fields.FIELD_COMPLETION_DATE] = instance[fields.FIELD_COMPLETION_DATE]
         release_time_str = release_time.strftime(TimeFormats.STANDARD_DATE_FORMAT)
         dispense_entry[fields.FIELD_DISPENSE][fields.FIELD_LAST_DISPENSE_DATE] = release_time_str
         dispense_entry[fields.FIELD_DISPENSE][fields.FIELD_DISPENSING_ORGANIZATION] = dispensing_org
@@ -2784,11 +3076,7 @@ class PrescriptionRecord(object):
         """
         Add the reference to the dispense notification document to the instance.
         """
-        instance = (
-            self._get_prescription_instance_data(target_instance)
-            if target_instance
-            else self._current_instance_data
-        )
+        instance = self._get_target_instance_data(target_instance)
         instance[fields.FIELD_DISPENSE][
             fields.FIELD_LAST_DISPENSE_NOTIFICATION_GUID
         ] = dn_document_guid
@@ -2812,17 +3100,15 @@ class PrescriptionRecord(object):
         Add the old claim reference to the dispense claim MsgRef history and add the new
         document to the instance.
         """
-        instance = self._get_prescription_instance_data(instance_number)
+        claim = self._get_prescription_instance_data(instance_number)[fields.FIELD_CLAIM]
 
-        if not instance[fields.FIELD_CLAIM][fields.FIELD_HISTORIC_DISPENSE_CLAIM_MSG_REF]:
-            instance[fields.FIELD_CLAIM][fields.FIELD_HISTORIC_DISPENSE_CLAIM_MSG_REF] = []
+        # records hold False rather than an empty list until the first amend
+        historic_claim_msg_refs = claim[fields.FIELD_HISTORIC_DISPENSE_CLAIM_MSG_REF]
+        if not historic_claim_msg_refs:
+            historic_claim_msg_refs = claim[fields.FIELD_HISTORIC_DISPENSE_CLAIM_MSG_REF] = []
 
-        historic_claim_msg_ref = instance[fields.FIELD_CLAIM][fields.FIELD_DISPENSE_CLAIM_MSG_REF]
-
-        instance[fields.FIELD_CLAIM][fields.FIELD_HISTORIC_DISPENSE_CLAIM_MSG_REF].append(
-            historic_claim_msg_ref
-        )
-        instance[fields.FIELD_CLAIM][fields.FIELD_DISPENSE_CLAIM_MSG_REF] = dn_claim_ref
+        historic_claim_msg_refs.append(claim[fields.FIELD_DISPENSE_CLAIM_MSG_REF])
+        claim[fields.FIELD_DISPENSE_CLAIM_MSG_REF] = dn_claim_ref
 
     def update_instance_status(self, instance, new_status):
         """
@@ -2845,21 +3131,32 @@ class PrescriptionRecord(object):
         :type status_to_check: str
         :type new_status: str
         """
-        issue = PrescriptionIssue(issue_dict)
-        for line_item in issue.line_items:
-            if line_item.status == status_to_check:
-                line_item.update_status(new_status)
+        # work on the line item dicts directly, as update_line_item_status_from_dispense
+        # does, rather than wrapping the issue and each of its line items
+        field_status = fields.FIELD_STATUS
+        for line_item in issue_dict[fields.FIELD_LINE_ITEMS]:
+            if line_item[field_status] == status_to_check:
+                line_item[fields.FIELD_PREVIOUS_STATUS] = line_item[field_status]
+                line_item[field_status] = new_status
 
     def update_line_item_status_from_dispense(self, instance, dn_line_items):
         """
         Roll through the line itesm on the dispense notification, and update the
         prescription record line items to the revised previousStatus and status
         """
+        field_id = fields.FIELD_ID
+        field_status = fields.FIELD_STATUS
+        # index the record line items by ID once, rather than rescanning them all for
+        # every line item on the dispense notification
+        line_items_by_id = {
+            line_item[field_id]: line_item for line_item in instance[fields.FIELD_LINE_ITEMS]
+        }
         for dn_line_item in dn_line_items:
-            for line_item in instance[fields.FIELD_LINE_ITEMS]:
-                if line_item[fields.FIELD_ID] == dn_line_item[fields.FIELD_ID]:
-                    line_item[fields.FIELD_PREVIOUS_STATUS] = line_item[fields.FIELD_STATUS]
-                    line_item[fields.FIELD_STATUS] = dn_line_item[fields.FIELD_STATUS]
+            line_item = line_items_by_id.get(dn_line_item[field_id])
+            if line_item is None:
+                continue
+            line_item[fields.FIELD_PREVIOUS_STATUS] = line_item[field_status]
+            line_item[field_status] = dn_line_item[field_status]
 
     def set_exemption_dates(self):
         """
@@ -2868,12 +3165,9 @@ class PrescriptionRecord(object):
         patient_details = self.prescription_record[fields.FIELD_PATIENT]
         birth_time = patient_details[fields.FIELD_BIRTH_TIME]
 
-        lower_age_limit = datetime.datetime.strptime(birth_time, TimeFormats.STANDARD_DATE_FORMAT)
-        lower_age_limit += relativedelta(years=fields._YOUNG_AGE_EXEMPTION, days=-1)
-        lower_age_limit = lower_age_limit.isoformat()[0:10].replace("-", "")
-        higher_age_limit = datetime.datetime.strptime(birth_time, TimeFormats.STANDARD_DATE_FORMAT)
-        higher_age_limit += relativedelta(years=fields._OLD_AGE_EXEMPTION)
-        higher_age_limit = higher_age_limit.isoformat()[0:10].replace("-", "")
+        birth_date = standard_date_string_as_datetime(birth_time)
+        lower_age_limit = date_as_standard_string(birth_date + _YOUNG_AGE_EXEMPTION_DELTA)
+        higher_age_limit = date_as_standard_string(birth_date + _OLD_AGE_EXEMPTION_DELTA)
         patient_details[fields.FIELD_LOWER_AGE_LIMIT] = lower_age_limit
         patient_details[fields.FIELD_HIGHER_AGE_LIMIT] = higher_age_limit
 
@@ -2885,7 +3179,7 @@ class PrescriptionRecord(object):
             return self.prescription_record[fields.FIELD_PRESCRIPTION][
                 fields.FIELD_PRESCRIPTION_MSG_REF
             ]
-        if doc_type == "ReleaseRequest":
+        elif doc_type == "ReleaseRequest":
             return self._current_instance_data[fields.FIELD_RELEASE_REQUEST_MGS_REF]
         else:
             raise EpsSystemError("developmentFailure")
@@ -2926,31 +3220,33 @@ class PrescriptionRecord(object):
         # Note that we also have to remap the prescription status here if this is a GUID
         # release for a '0000' (internal only) prescription status.
         previous_presc_status = self._current_instance_data[fields.FIELD_PREVIOUS_STATUS]
-        if previous_presc_status == PrescriptionStatus.AWAITING_RELEASE_READY:
-            previous_presc_status = PrescriptionStatus.TO_BE_DISPENSED
+        previous_presc_status = self._RELEASE_RESPONSE_STATUS_REMAP.get(
+            previous_presc_status, previous_presc_status
+        )
 
         release_data[fields.FIELD_PRESCRIPTION_STATUS] = quoted(previous_presc_status)
 
-        display_name = PrescriptionStatus.PRESCRIPTION_DISPLAY_LOOKUP[previous_presc_status]
-        release_data[fields.FIELD_PRESCRIPTION_STATUS_DISPLAY_NAME] = quoted(display_name)
+        release_data[fields.FIELD_PRESCRIPTION_STATUS_DISPLAY_NAME] = (
+            _QUOTED_PRESCRIPTION_DISPLAY_NAMES[previous_presc_status]
+        )
         release_data[fields.FIELD_PRESCRIPTION_CURRENT_INSTANCE] = quoted(
-            str(self.current_issue_number)
+            self._current_instance_key
         )
         release_data[fields.FIELD_PRESCRIPTION_MAX_REPEATS] = quoted(
             presc_details[fields.FIELD_MAX_REPEATS]
         )
 
         for line_item in self.current_issue.line_items:
-            line_item_ref = "lineItem" + str(line_item.order)
+            line_item_ref = f"lineItem{line_item.order}"
             item_status = (
                 line_item.previous_status
                 if line_item.status == LineItemStatus.WITH_DISPENSER
                 else line_item.status
             )
 
-            release_data[line_item_ref + "Status"] = quoted(item_status)
-            item_display_name = LineItemStatus.ITEM_DISPLAY_LOOKUP[item_status]
-            release_data[line_item_ref + "StatusDisplayName"] = quoted(item_display_name)
+            release_data[f"{line_item_ref}Status"] = quoted(item_status)
+            item_display_name = _QUOTED_ITEM_DISPLAY_NAMES[item_status]
+            release_data[f"{line_item_ref}StatusDisplayName"] = item_display_name
 
             self.add_line_item_repeat_data(release_data, line_item_ref, line_item)
 
@@ -2967,13 +3263,12 @@ class PrescriptionRecord(object):
         :type line_item_ref: str
         :type line_item: PrescriptionLineItem
         """
-        line_instance = self.current_issue_number
+        # both are properties which convert from the stored str, so read each once
+        max_repeats = line_item.max_repeats
+        line_instance = min(max_repeats, self.current_issue_number)
 
-        if line_item.max_repeats < self.current_issue_number:
-            line_instance = line_item.max_repeats
-
-        release_data[line_item_ref + "MaxRepeats"] = quoted(str(line_item.max_repeats))
-        release_data[line_item_ref + "CurrentInstance"] = quoted(str(line_instance))
+        release_data[f"{line_item_ref}MaxRepeats"] = quoted(max_repeats)
+        release_data[f"{line_item_ref}CurrentInstance"] = quoted(line_instance)
 
     def validate_line_prescription_status(self, prescription_status, line_item_status):
         """
@@ -3013,18 +3308,18 @@ class PrescriptionRecord(object):
             )
             return
 
-        # Count upwards from the current issue number to max_repeats, looking either for
+        # Count upwards from the issue after the current one to max_repeats, looking for
         # an issue that exists
-        new_current_issue_number = False
-        for i in range(self.current_issue_number, self.max_repeats + 1):
-            try:
-                self.prescription_record[fields.FIELD_INSTANCES][str(i)]
-                new_current_issue_number = i
-                break
-            except KeyError:
-                continue
+        new_current_issue_number = next(
+            (
+                issue_number
+                for issue_number in range(self.current_issue_number + 1, self.max_repeats + 1)
+                if self._has_issue(issue_number)
+            ),
+            None,
+        )
 
-        if not new_current_issue_number:
+        if new_current_issue_number is None:
             self.log_object.write_log(
                 "EPS0625b",
                 None,
@@ -3058,9 +3353,21 @@ class PrescriptionRecord(object):
         :returns: a list containing the old and new "current instance" number as strings
         :rtype: [str, str]
         """
+        acceptable_states = PrescriptionStatus.ACTIVE_OR_FUTURE_STATES
+
+        # usually the current issue is still acceptable, so check it before walking the rest
+        old_current_issue_number = self.current_issue_number
+        current_issue_data = self.prescription_record[fields.FIELD_INSTANCES].get(
+            _issue_number_str(old_current_issue_number)
+        )
+        if (
+            current_issue_data
+            and current_issue_data[fields.FIELD_PRESCRIPTION_STATUS] in acceptable_states
+        ):
+            return (old_current_issue_number, old_current_issue_number)
+
         # see if we can find an issue from the current one upwards in an active or future state
         new_current_issue_number = None
-        acceptable_states = PrescriptionStatus.ACTIVE_STATES + PrescriptionStatus.FUTURE_STATES
         for issue in self.get_issues_from_current_upwards():
             if issue.status in acceptable_states:
                 new_current_issue_number = issue.number
@@ -3071,7 +3378,6 @@ class PrescriptionRecord(object):
             new_current_issue_number = self.issue_numbers[-1]
 
         # update the current instance number
-        old_current_issue_number = self.current_issue_number
         self.current_issue_number = new_current_issue_number
 
         return (old_current_issue_number, new_current_issue_number)
@@ -3124,11 +3430,13 @@ class PrescriptionRecord(object):
         """
         Check for the line item being in one of the specified states
         """
+        field_id = fields.FIELD_ID
+        field_status = fields.FIELD_STATUS
         for line_item in self._current_instance_data[
             fields.FIELD_LINE_ITEMS
         ]:  # noqa: SIM110 - More readable as is
-            if (line_item_ref == line_item[fields.FIELD_ID]) and (
-                line_item[fields.FIELD_STATUS] in line_item_states
+            if (line_item_ref == line_item[field_id]) and (
+                line_item[field_status] in line_item_states
             ):
                 return True
         return False
@@ -3152,7 +3460,7 @@ class PrescriptionRecord(object):
             None,
             {
                 "internalID": self.internal_id,
-                "currentInstance": str(self.current_issue_number),
+                "currentInstance": self._current_instance_key,
                 "cancellationType": fields.FIELD_PRESCRIPTION,
                 "currentStatus": presc_status,
             },
@@ -3180,8 +3488,10 @@ class PrescriptionRecord(object):
         line item status
         """
         line_item_status = None
+        cancel_line_item_ref = context.cancelLineItemRef
+        field_id = fields.FIELD_ID
         for line_item in self._current_instance_data[fields.FIELD_LINE_ITEMS]:
-            if context.cancelLineItemRef != line_item[fields.FIELD_ID]:
+            if cancel_line_item_ref != line_item[field_id]:
                 continue
             line_item_status = line_item[fields.FIELD_STATUS]
 
@@ -3190,7 +3500,7 @@ class PrescriptionRecord(object):
             None,
             {
                 "internalID": self.internal_id,
-                "currentInstance": str(self.current_issue_number),
+                "currentInstance": self._current_instance_key,
                 "cancellationType": "lineItem",
                 "currentStatus": line_item_status,
             },
@@ -3221,15 +3531,15 @@ class PrescriptionRecord(object):
         # only apply from the start issue upwards
         if not range_to_cancel_start_issue:
             range_to_cancel_start_issue = self.current_issue_number
-        range_to_update = self.get_issues_in_range(int(range_to_cancel_start_issue), None)
+        # only the numbers are needed, so skip wrapping each issue just to read them back
+        issue_numbers = self.get_issue_numbers_in_range(int(range_to_cancel_start_issue), None)
 
-        issue_numbers = [issue.number for issue in range_to_update]
+        if cancellation_obj[fields.FIELD_CANCELLATION_TARGET] == "LineItem":
+            process_cancellation = self.process_line_cancellation
+        else:
+            process_cancellation = self.process_instance_cancellation
         for issue_number in issue_numbers:
-            instance = instances[str(issue_number)]
-            if cancellation_obj[fields.FIELD_CANCELLATION_TARGET] == "LineItem":
-                self.process_line_cancellation(instance, cancellation_obj)
-            else:
-                self.process_instance_cancellation(instance, cancellation_obj)
+            process_cancellation(instances[_issue_number_str(issue_number)], cancellation_obj)
         # the current issue may have become cancelled, so find the new current one?
         self.reset_current_instance()
         return [cancellation_obj[fields.FIELD_CANCELLATION_ID], issue_numbers]
@@ -3248,28 +3558,35 @@ class PrescriptionRecord(object):
         instance[fields.FIELD_PREVIOUS_STATUS] = instance[fields.FIELD_PRESCRIPTION_STATUS]
         instance[fields.FIELD_PRESCRIPTION_STATUS] = PrescriptionStatus.CANCELLED
         instance[fields.FIELD_CANCELLATIONS].append(cancellation_obj)
-        completion_date = datetime.datetime.strptime(
-            cancellation_obj[fields.FIELD_CANCELLATION_TIME], TimeFormats.STANDARD_DATE_TIME_FORMAT
-        )
-        instance[fields.FIELD_COMPLETION_DATE] = completion_date.strftime(
-            TimeFormats.STANDARD_DATE_FORMAT
+        completion_date = standard_date_time_string_as_datetime(
+            cancellation_obj[fields.FIELD_CANCELLATION_TIME]
         )
+        instance[fields.FIELD_COMPLETION_DATE] = date_as_standard_string(completion_date)
 
     def process_line_cancellation(self, instance, cancellation_obj):
         """
         Loop through the line items to find one relevant to the cancellation,
         If all line items now inactive then cancel the instance
         """
-        active_line_item = False
-        for line_item in instance[fields.FIELD_LINE_ITEMS]:
-            if cancellation_obj[fields.FIELD_CANCEL_LINE_ITEM_REF] != line_item[fields.FIELD_ID]:
-                if line_item[fields.FIELD_STATUS] in LineItemStatus.ACTIVE_STATES:
-                    active_line_item = True
-                continue
-            line_item[fields.FIELD_PREVIOUS_STATUS] = line_item[fields.FIELD_STATUS]
-            line_item[fields.FIELD_STATUS] = LineItemStatus.CANCELLED
+        cancel_line_item_ref = cancellation_obj[fields.FIELD_CANCEL_LINE_ITEM_REF]
+        field_id = fields.FIELD_ID
+        field_status = fields.FIELD_STATUS
+        line_items = instance[fields.FIELD_LINE_ITEMS]
+        # line item IDs are unique within an issue, so stop at the one being cancelled
+        for line_item in line_items:
+            if line_item[field_id] == cancel_line_item_ref:
+                line_item[fields.FIELD_PREVIOUS_STATUS] = line_item[field_status]
+                line_item[field_status] = LineItemStatus.CANCELLED
+                break
         instance[fields.FIELD_CANCELLATIONS].append(cancellation_obj)
 
+        active_states = LineItemStatus.ACTIVE_STATES
+        active_line_item = any(
+            line_item[field_status] in active_states
+            for line_item in line_items
+            if line_item[field_id] != cancel_line_item_ref
+        )
+
         if not active_line_item:
             self.process_instance_cancellation(instance, cancellation_obj)
 
@@ -3312,22 +3629,13 @@ class PrescriptionRecord(object):
         if not self._pending_cancellations:
             return [True, None]
 
-        cancellation_target = str(cancellation_obj[fields.FIELD_CANCELLATION_TARGET])
+        cancellation_target = _cancellation_target(cancellation_obj)
         cancellation_org = str(cancellation_obj[fields.FIELD_AGENT_ORGANIZATION])
-        if cancellation_target == "LineItem":
-            cancellation_target = "LineItem_" + str(
-                cancellation_obj[fields.FIELD_CANCEL_LINE_ITEM_REF]
-            )
 
         org_match = True
         for pending_cancellation in self._pending_cancellations:
-            pending_target = str(pending_cancellation[fields.FIELD_CANCELLATION_TARGET])
-            if pending_target == "LineItem":
-                pending_target = "LineItem_" + str(
-                    pending_cancellation[fields.FIELD_CANCEL_LINE_ITEM_REF]
-                )
-            pending_org = str(pending_cancellation[fields.FIELD_AGENT_ORGANIZATION])
-            if pending_target == cancellation_target:
+            if _cancellation_target(pending_cancellation) == cancellation_target:
+                pending_org = str(pending_cancellation[fields.FIELD_AGENT_ORGANIZATION])
                 if pending_org != cancellation_org:
                     org_match = False
                 self.log_object.write_log(
@@ -3364,25 +3672,16 @@ class PrescriptionRecord(object):
         if not self._pending_cancellations:
             return [True, None]
 
-        cancellation_target = str(cancellation_obj[fields.FIELD_CANCELLATION_TARGET])
+        cancellation_target = _cancellation_target(cancellation_obj)
         cancellation_org = str(cancellation_obj[fields.FIELD_AGENT_ORGANIZATION])
-        if cancellation_target == "LineItem":
-            cancellation_target = "LineItem_" + str(
-                cancellation_obj[fields.FIELD_CANCEL_LINE_ITEM_REF]
-            )
 
-        whole_prescription_cancellation = False
+        # a pending whole prescription cancellation takes precedence over any other
+        matching_targets = (cancellation_target, fields.FIELD_PRESCRIPTION)
+
         org_match = True
         for pending_cancellation in self._pending_cancellations:
-            pending_target = str(pending_cancellation[fields.FIELD_CANCELLATION_TARGET])
-            pending_org = str(pending_cancellation[fields.FIELD_AGENT_ORGANIZATION])
-            if pending_target == fields.FIELD_PRESCRIPTION:
-                whole_prescription_cancellation = True
-            if pending_target == "LineItem":
-                pending_target = "LineItem_" + str(
-                    pending_cancellation[fields.FIELD_CANCEL_LINE_ITEM_REF]
-                )
-            if (pending_target == cancellation_target) or whole_prescription_cancellation:
+            if _cancellation_target(pending_cancellation) in matching_targets:
+                pending_org = str(pending_cancellation[fields.FIELD_AGENT_ORGANIZATION])
                 if pending_org != cancellation_org:
                     org_match = False
                 self.log_object.write_log(
@@ -3406,19 +3705,15 @@ class PrescriptionRecord(object):
         cancellations and where a cancellation is a duplicate, and does not apply to
         cancellations that are simply not valid.
         """
-        failed_cs = self.prescription_record[fields.FIELD_PRESCRIPTION][
-            fields.FIELD_UNSUCCESSFUL_CANCELLATIONS
-        ]
+        prescription = self.prescription_record[fields.FIELD_PRESCRIPTION]
+        failed_cs = prescription[fields.FIELD_UNSUCCESSFUL_CANCELLATIONS]
         cancellation_obj["failureReason"] = failure_reason
 
+        # only store the list back when a new one has been started
         if not failed_cs:
-            failed_cs = []
+            failed_cs = prescription[fields.FIELD_UNSUCCESSFUL_CANCELLATIONS] = []
         failed_cs.append(cancellation_obj)
 
-        self.prescription_record[fields.FIELD_PRESCRIPTION][
-            fields.FIELD_UNSUCCESSFUL_CANCELLATIONS
-        ] = failed_cs
-
     def set_pending_cancellation(self, cancellation_obj, prescription_present):
         """
         Set the default Prescription Pending Cancellation status code and then
@@ -3428,21 +3723,20 @@ class PrescriptionRecord(object):
             instance = self._get_prescription_instance_data("1")
             self.update_instance_status(instance, PrescriptionStatus.PENDING_CANCELLATION)
 
-        pending_cs = self._pending_cancellations
+        prescription = self.prescription_record[fields.FIELD_PRESCRIPTION]
+        pending_cs_field = fields.FIELD_PENDING_CANCELLATIONS
+        pending_cs = prescription[pending_cs_field]
 
         if not pending_cs:
             pending_cs = [cancellation_obj]
-            cancellation_date_obj = datetime.datetime.strptime(
-                cancellation_obj[fields.FIELD_CANCELLATION_TIME],
-                TimeFormats.STANDARD_DATE_TIME_FORMAT,
+            cancellation_date = date_as_standard_string(
+                standard_date_time_string_as_datetime(
+                    cancellation_obj[fields.FIELD_CANCELLATION_TIME]
+                )
             )
-            cancellation_date = cancellation_date_obj.strftime(TimeFormats.STANDARD_DATE_FORMAT)
-            if not self.prescription_record[fields.FIELD_PRESCRIPTION][
-                fields.FIELD_PRESCRIPTION_TIME
-            ]:
-                self.prescription_record[fields.FIELD_PRESCRIPTION][
-                    fields.FIELD_PRESCRIPTION_TIME
-                ] = cancellation_date
+            prescription_time_field = fields.FIELD_PRESCRIPTION_TIME
+            if not prescription[prescription_time_field]:
+                prescription[prescription_time_field] = cancellation_date
                 self.log_object.write_log(
                     "EPS0340",
                     None,
@@ -3455,7 +3749,7 @@ class PrescriptionRecord(object):
         else:
             pending_cs.append(cancellation_obj)
 
-        self._pending_cancellations = pending_cs
+        prescription[pending_cs_field] = pending_cs
 
     def set_initial_prescription_status(self, handle_time):
         """
@@ -3497,7 +3791,7 @@ class PrescriptionRecord(object):
         dispensing_org = instance[fields.FIELD_DISPENSE][fields.FIELD_DISPENSING_ORGANIZATION]
 
         return [
-            str(self.current_issue_number),
+            self._current_instance_key,
             instance_status,
             self._nhs_number,
             dispensing_org,
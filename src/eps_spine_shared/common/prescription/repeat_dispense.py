@@ -1,5 +1,4 @@
 import datetime
-from copy import copy
 
 from eps_spine_shared.common.prescription import fields
 from eps_spine_shared.common.prescription.record import PrescriptionRecord
@@ -29,14 +28,27 @@ class RepeatDispenseRecord(PrescriptionRecord):
         range_max = int(context.maxRepeats) + 1
         future_instance_status = PrescriptionStatus.REPEAT_DISPENSE_FUTURE_INSTANCE
 
+        # bind the field names used in the loops to locals
+        field_line_items = fields.FIELD_LINE_ITEMS
+        field_status = fields.FIELD_STATUS
+        expired_status = LineItemStatus.EXPIRED
+
+        # the max repeats are stored as strings, so convert them once rather than per instance
+        line_item_max_repeats = [
+            (line_item, int(line_item[fields.FIELD_MAX_REPEATS])) for line_item in line_items
+        ]
+
         for instance_number in range(1, range_max):
             instance_snippet = self.set_all_snippet_details(fields.INSTANCE_DETAILS, context)
-            instance_snippet[fields.FIELD_LINE_ITEMS] = []
-            for line_item in line_items:
-                line_item_copy = copy(line_item)
-                if int(line_item_copy[fields.FIELD_MAX_REPEATS]) < instance_number:
-                    line_item_copy[fields.FIELD_STATUS] = LineItemStatus.EXPIRED
-                instance_snippet[fields.FIELD_LINE_ITEMS].append(line_item_copy)
+            # each instance needs its own copy, as line item statuses are updated per instance
+            instance_snippet[field_line_items] = [
+                (
+                    {**line_item, field_status: expired_status}
+                    if max_repeats < instance_number
+                    else line_item.copy()
+                )
+                for line_item, max_repeats in line_item_max_repeats
+            ]
 
             instance_snippet[fields.FIELD_INSTANCE_NUMBER] = str(instance_number)
             if instance_number != 1:
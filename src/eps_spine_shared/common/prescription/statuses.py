@@ -32,64 +32,82 @@ class PrescriptionStatus(object):
     PRESCRIPTION_DISPLAY_LOOKUP[FUTURE_DATED_PRESCRIPTION] = "Prescription future instance"
     PRESCRIPTION_DISPLAY_LOOKUP[PENDING_CANCELLATION] = "Cancelled future instance"
 
-    CANCELLABLE_STATES = [
-        AWAITING_RELEASE_READY,
-        TO_BE_DISPENSED,
-        REPEAT_DISPENSE_FUTURE_INSTANCE,
-        FUTURE_DATED_PRESCRIPTION,
-    ]
-
-    WITH_DISPENSER_STATES = [WITH_DISPENSER, WITH_DISPENSER_ACTIVE]
-
-    ACTIVE_STATES = [AWAITING_RELEASE_READY, TO_BE_DISPENSED, WITH_DISPENSER, WITH_DISPENSER_ACTIVE]
-
-    FUTURE_STATES = [FUTURE_DATED_PRESCRIPTION, REPEAT_DISPENSE_FUTURE_INSTANCE]
-
-    COMPLETED_STATES = [EXPIRED, CANCELLED, DISPENSED, NOT_DISPENSED, CLAIMED, NO_CLAIMED]
-
-    NOT_COMPLETED_STATES = [
-        AWAITING_RELEASE_READY,
-        TO_BE_DISPENSED,
-        WITH_DISPENSER,
-        WITH_DISPENSER_ACTIVE,
-        FUTURE_DATED_PRESCRIPTION,
-        REPEAT_DISPENSE_FUTURE_INSTANCE,
-    ]
-
-    INCLUDE_PERFORMER_STATES = [
-        WITH_DISPENSER,
-        WITH_DISPENSER_ACTIVE,
-        DISPENSED,
-        NOT_DISPENSED,
-        CLAIMED,
-        NO_CLAIMED,
-    ]
-
-    EXPIRY_IMMUTABLE_STATES = [EXPIRED, CANCELLED, DISPENSED, NOT_DISPENSED, CLAIMED, NO_CLAIMED]
-
-    UNACTIONED_STATES = [
-        AWAITING_RELEASE_READY,
-        TO_BE_DISPENSED,
-        WITH_DISPENSER,
-        REPEAT_DISPENSE_FUTURE_INSTANCE,
-        PENDING_CANCELLATION,
-    ]
-
-    ALL_VALID_STATES = [
-        AWAITING_RELEASE_READY,
-        TO_BE_DISPENSED,
-        WITH_DISPENSER,
-        WITH_DISPENSER_ACTIVE,
-        EXPIRED,
-        CANCELLED,
-        DISPENSED,
-        NOT_DISPENSED,
-        CLAIMED,
-        NO_CLAIMED,
-        REPEAT_DISPENSE_FUTURE_INSTANCE,
-        FUTURE_DATED_PRESCRIPTION,
-        PENDING_CANCELLATION,
-    ]
+    CANCELLABLE_STATES = frozenset(
+        [
+            AWAITING_RELEASE_READY,
+            TO_BE_DISPENSED,
+            REPEAT_DISPENSE_FUTURE_INSTANCE,
+            FUTURE_DATED_PRESCRIPTION,
+        ]
+    )
+
+    WITH_DISPENSER_STATES = frozenset([WITH_DISPENSER, WITH_DISPENSER_ACTIVE])
+
+    ACTIVE_STATES = frozenset(
+        [AWAITING_RELEASE_READY, TO_BE_DISPENSED, WITH_DISPENSER, WITH_DISPENSER_ACTIVE]
+    )
+
+    FUTURE_STATES = frozenset([FUTURE_DATED_PRESCRIPTION, REPEAT_DISPENSE_FUTURE_INSTANCE])
+
+    ACTIVE_OR_FUTURE_STATES = ACTIVE_STATES | FUTURE_STATES
+
+    COMPLETED_STATES = frozenset(
+        [EXPIRED, CANCELLED, DISPENSED, NOT_DISPENSED, CLAIMED, NO_CLAIMED]
+    )
+
+    NOT_COMPLETED_STATES = frozenset(
+        [
+            AWAITING_RELEASE_READY,
+            TO_BE_DISPENSED,
+            WITH_DISPENSER,
+            WITH_DISPENSER_ACTIVE,
+            FUTURE_DATED_PRESCRIPTION,
+            REPEAT_DISPENSE_FUTURE_INSTANCE,
+        ]
+    )
+
+    INCLUDE_PERFORMER_STATES = frozenset(
+        [
+            WITH_DISPENSER,
+            WITH_DISPENSER_ACTIVE,
+            DISPENSED,
+            NOT_DISPENSED,
+            CLAIMED,
+            NO_CLAIMED,
+        ]
+    )
+
+    EXPIRY_IMMUTABLE_STATES = frozenset(
+        [EXPIRED, CANCELLED, DISPENSED, NOT_DISPENSED, CLAIMED, NO_CLAIMED]
+    )
+
+    UNACTIONED_STATES = frozenset(
+        [
+            AWAITING_RELEASE_READY,
+            TO_BE_DISPENSED,
+            WITH_DISPENSER,
+            REPEAT_DISPENSE_FUTURE_INSTANCE,
+            PENDING_CANCELLATION,
+        ]
+    )
+
+    ALL_VALID_STATES = frozenset(
+        [
+            AWAITING_RELEASE_READY,
+            TO_BE_DISPENSED,
+            WITH_DISPENSER,
+            WITH_DISPENSER_ACTIVE,
+            EXPIRED,
+            CANCELLED,
+            DISPENSED,
+            NOT_DISPENSED,
+            CLAIMED,
+            NO_CLAIMED,
+            REPEAT_DISPENSE_FUTURE_INSTANCE,
+            FUTURE_DATED_PRESCRIPTION,
+            PENDING_CANCELLATION,
+        ]
+    )
 
     EXPIRY_LOOKUP = {}
     EXPIRY_LOOKUP[AWAITING_RELEASE_READY] = EXPIRED
@@ -115,18 +133,22 @@ class LineItemStatus(object):
     TO_BE_DISPENSED = "0007"
     WITH_DISPENSER = "0008"
 
-    ITEM_CANCELLABLE_STATES = [TO_BE_DISPENSED]
-    ITEM_WITH_DISPENSER_STATES = [WITH_DISPENSER, PARTIAL_DISPENSED]
+    ITEM_CANCELLABLE_STATES = frozenset([TO_BE_DISPENSED])
+    ITEM_WITH_DISPENSER_STATES = frozenset([WITH_DISPENSER, PARTIAL_DISPENSED])
 
-    ACTIVE_STATES = [TO_BE_DISPENSED, WITH_DISPENSER, PARTIAL_DISPENSED, NOT_DISPENSED_OWING]
+    ACTIVE_STATES = frozenset(
+        [TO_BE_DISPENSED, WITH_DISPENSER, PARTIAL_DISPENSED, NOT_DISPENSED_OWING]
+    )
 
-    INCLUDE_PERFORMER_STATES = [
-        WITH_DISPENSER,
-        PARTIAL_DISPENSED,
-        FULLY_DISPENSED,
-        NOT_DISPENSED,
-        NOT_DISPENSED_OWING,
-    ]
+    INCLUDE_PERFORMER_STATES = frozenset(
+        [
+            WITH_DISPENSER,
+            PARTIAL_DISPENSED,
+            FULLY_DISPENSED,
+            NOT_DISPENSED,
+            NOT_DISPENSED_OWING,
+        ]
+    )
 
     ITEM_DISPLAY_LOOKUP = {}
     ITEM_DISPLAY_LOOKUP[FULLY_DISPENSED] = "Item fully dispensed"
@@ -139,46 +161,64 @@ class LineItemStatus(object):
     ITEM_DISPLAY_LOOKUP[WITH_DISPENSER] = "Item with dispenser"
 
     VALID_STATES = {}
-    VALID_STATES[PrescriptionStatus.AWAITING_RELEASE_READY] = [CANCELLED, EXPIRED, TO_BE_DISPENSED]
-    VALID_STATES[PrescriptionStatus.TO_BE_DISPENSED] = [CANCELLED, EXPIRED, TO_BE_DISPENSED]
-    VALID_STATES[PrescriptionStatus.WITH_DISPENSER] = [CANCELLED, EXPIRED, WITH_DISPENSER]
-    VALID_STATES[PrescriptionStatus.WITH_DISPENSER_ACTIVE] = [
-        FULLY_DISPENSED,
-        NOT_DISPENSED,
-        PARTIAL_DISPENSED,
-        NOT_DISPENSED_OWING,
-        CANCELLED,
-        EXPIRED,
-        WITH_DISPENSER,
-    ]
-    VALID_STATES[PrescriptionStatus.EXPIRED] = [CANCELLED, EXPIRED]
-    VALID_STATES[PrescriptionStatus.CANCELLED] = [CANCELLED, EXPIRED]
-    VALID_STATES[PrescriptionStatus.DISPENSED] = [
-        FULLY_DISPENSED,
-        NOT_DISPENSED,
-        CANCELLED,
-        EXPIRED,
-    ]
-    VALID_STATES[PrescriptionStatus.NOT_DISPENSED] = [NOT_DISPENSED, CANCELLED, EXPIRED]
-    VALID_STATES[PrescriptionStatus.CLAIMED] = [FULLY_DISPENSED, NOT_DISPENSED, CANCELLED, EXPIRED]
-    VALID_STATES[PrescriptionStatus.NO_CLAIMED] = [
-        FULLY_DISPENSED,
-        NOT_DISPENSED,
-        CANCELLED,
-        EXPIRED,
-    ]
-    VALID_STATES[PrescriptionStatus.REPEAT_DISPENSE_FUTURE_INSTANCE] = [
-        CANCELLED,
-        EXPIRED,
-        TO_BE_DISPENSED,
-    ]
-    VALID_STATES[PrescriptionStatus.FUTURE_DATED_PRESCRIPTION] = [
-        CANCELLED,
-        EXPIRED,
-        TO_BE_DISPENSED,
-    ]
-
-    EXPIRY_IMMUTABLE_STATES = [FULLY_DISPENSED, NOT_DISPENSED, EXPIRED, CANCELLED]
+    VALID_STATES[PrescriptionStatus.AWAITING_RELEASE_READY] = frozenset(
+        [CANCELLED, EXPIRED, TO_BE_DISPENSED]
+    )
+    VALID_STATES[PrescriptionStatus.TO_BE_DISPENSED] = frozenset(
+        [CANCELLED, EXPIRED, TO_BE_DISPENSED]
+    )
+    VALID_STATES[PrescriptionStatus.WITH_DISPENSER] = frozenset(
+        [CANCELLED, EXPIRED, WITH_DISPENSER]
+    )
+    VALID_STATES[PrescriptionStatus.WITH_DISPENSER_ACTIVE] = frozenset(
+        [
+            FULLY_DISPENSED,
+            NOT_DISPENSED,
+            PARTIAL_DISPENSED,
+            NOT_DISPENSED_OWING,
+            CANCELLED,
+            EXPIRED,
+            WITH_DISPENSER,
+        ]
+    )
+    VALID_STATES[PrescriptionStatus.EXPIRED] = frozenset([CANCELLED, EXPIRED])
+    VALID_STATES[PrescriptionStatus.CANCELLED] = frozenset([CANCELLED, EXPIRED])
+    VALID_STATES[PrescriptionStatus.DISPENSED] = frozenset(
+        [
+            FULLY_DISPENSED,
+            NOT_DISPENSED,
+            CANCELLED,
+            EXPIRED,
+        ]
+    )
+    VALID_STATES[PrescriptionStatus.NOT_DISPENSED] = frozenset([NOT_DISPENSED, CANCELLED, EXPIRED])
+    VALID_STATES[PrescriptionStatus.CLAIMED] = frozenset(
+        [FULLY_DISPENSED, NOT_DISPENSED, CANCELLED, EXPIRED]
+    )
+    VALID_STATES[PrescriptionStatus.NO_CLAIMED] = frozenset(
+        [
+            FULLY_DISPENSED,
+            NOT_DISPENSED,
+            CANCELLED,
+            EXPIRED,
+        ]
+    )
+    VALID_STATES[PrescriptionStatus.REPEAT_DISPENSE_FUTURE_INSTANCE] = frozenset(
+        [
+            CANCELLED,
+            EXPIRED,
+            TO_BE_DISPENSED,
+        ]
+    )
+    VALID_STATES[PrescriptionStatus.FUTURE_DATED_PRESCRIPTION] = frozenset(
+        [
+            CANCELLED,
+            EXPIRED,
+            TO_BE_DISPENSED,
+        ]
+    )
+
+    EXPIRY_IMMUTABLE_STATES = frozenset([FULLY_DISPENSED, NOT_DISPENSED, EXPIRED, CANCELLED])
 
     EXPIRY_LOOKUP = {}
     EXPIRY_LOOKUP[TO_BE_DISPENSED] = "0006"
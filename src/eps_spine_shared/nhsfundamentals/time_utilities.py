@@ -92,6 +92,46 @@ def date_today_as_string():
     return time_now_as_string(TimeFormats.STANDARD_DATE_FORMAT)
 
 
+def date_as_standard_string(date_object):
+    """
+    Return the date of a datetime as a string in standard (YYYYMMDD) format, equivalent to
+    strftime(TimeFormats.STANDARD_DATE_FORMAT) without going through strftime
+    """
+    return f"{date_object.year:04d}{date_object.month:02d}{date_object.day:02d}"
+
+
+def standard_date_string_as_datetime(date_string):
+    """
+    Parse a standard (YYYYMMDD) date string into a datetime, equivalent to
+    strptime(date_string, TimeFormats.STANDARD_DATE_FORMAT) without the format parsing
+    for the common well-formed case
+    """
+    if len(date_string) == 8 and date_string.isdigit():
+        return datetime(int(date_string[:4]), int(date_string[4:6]), int(date_string[6:]))
+    return datetime.strptime(date_string, TimeFormats.STANDARD_DATE_FORMAT)
+
+
+def standard_date_time_string_as_datetime(date_time_string):
+    """
+    Parse a standard (YYYYMMDDHHMMSS) date time string into a datetime, equivalent to
+    strptime(date_time_string, TimeFormats.STANDARD_DATE_TIME_FORMAT) without the format
+    parsing for the common well-formed case
+    """
+    if (
+        len(date_time_string) == TimeFormats.STANDARD_DATE_TIME_LENGTH
+        and date_time_string.isdigit()
+    ):
+        return datetime(
+            int(date_time_string[:4]),
+            int(date_time_string[4:6]),
+            int(date_time_string[6:8]),
+            int(date_time_string[8:10]),
+            int(date_time_string[10:12]),
+            int(date_time_string[12:]),
+        )
+    return datetime.strptime(date_time_string, TimeFormats.STANDARD_DATE_TIME_FORMAT)
+
+
 def time_now_as_string(date_format=TimeFormats.STANDARD_DATE_TIME_FORMAT):
     """
     Return the current date and time as a string in standard format
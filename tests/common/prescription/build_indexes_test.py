@@ -257,3 +257,31 @@ class BuildIndexesTest(TestCase):
             expected_index,
             "Created index " + str(created_index) + " expecting " + str(expected_index),
         )
+
+    def test_dispenser_indexes_single_walk(self):
+        """
+        Given a prescription with multiple instances at the same dispenser that the combined
+        dispenser indexes match the individual index terms
+        """
+        self.prescription.prescription_record["prescription"][
+            "prescribingOrganization"
+        ] = "TESTPrescriber"
+        self.prescription.prescription_record["prescription"]["prescriptionTime"] = "TESTtime"
+        for issue, status in [("1", "0006"), ("2", "0001")]:
+            self.prescription.prescription_record["instances"][issue] = {}
+            self.prescription.prescription_record["instances"][issue]["prescriptionStatus"] = status
+            self.prescription.prescription_record["instances"][issue]["dispense"] = {}
+            self.prescription.prescription_record["instances"][issue]["dispense"][
+                "dispensingOrganization"
+            ] = "TESTdispenser"
+
+        created_indexes = self.prescription.return_dispenser_indexes()
+        self.assertEqual(
+            created_indexes["dispensingSiteStatus_bin"],
+            set(["TESTdispenser_0006", "TESTdispenser_0001"]),
+        )
+        self.assertEqual(
+            created_indexes["nhsNumberPrescDispDate_bin"],
+            self.prescription.return_nhs_number_prescriber_dispenser_date_index()[1],
+        )
+        self.assertEqual(created_indexes["dispenserDate_bin"], set(["TESTdispenser|TESTtime"]))
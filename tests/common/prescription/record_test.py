@@ -12,8 +12,9 @@ from eps_spine_shared.common.prescription.record import PrescriptionRecord
 from eps_spine_shared.common.prescription.repeat_dispense import RepeatDispenseRecord
 from eps_spine_shared.common.prescription.repeat_prescribe import RepeatPrescribeRecord
 from eps_spine_shared.common.prescription.single_prescribe import SinglePrescribeRecord
+from eps_spine_shared.common.prescription.statuses import LineItemStatus, PrescriptionStatus
 from eps_spine_shared.common.prescription.types import PrescriptionTreatmentType
-from eps_spine_shared.errors import EpsSystemError
+from eps_spine_shared.errors import EpsBusinessError, EpsSystemError
 from eps_spine_shared.nhsfundamentals.time_utilities import TimeFormats
 from eps_spine_shared.testing.mock_logger import MockLogObject
 
@@ -57,6 +58,32 @@ class PrescriptionRecordTest(TestCase):
     def setUp(self):
         self.mock_log_object = MagicMock()
 
+    @staticmethod
+    def _admin_update_context(**overrides):
+        """
+        Build an admin update context with none of the admin update fields set, other than
+        the overrides given.
+        """
+        context = MagicMock()
+        for attribute in [
+            "prescriptionStatus",
+            "completionDate",
+            "dispenseWindowLowDate",
+            "nominatedDownloadDate",
+            "releaseDate",
+            "dispensingOrganization",
+            "dispensingOrgNullFlavor",
+            "lastDispenseDate",
+            "claimSentDate",
+            "overdueExpiry",
+        ]:
+            setattr(context, attribute, None)
+        context.lineDict = {}
+        context.fieldsToUpdate = []
+        for attribute, value in overrides.items():
+            setattr(context, attribute, value)
+        return context
+
     def test_basic_properties(self):
         """
         Test basic property access of a record loaded from JSON
@@ -248,6 +275,40 @@ class PrescriptionRecordTest(TestCase):
         action = fields.NEXTACTIVITY_PURGE
         self._assert_find_instances_to_action_update(prescription, handle_time, action, ["1"])
 
+    def test_find_instances_to_action_update_special_actions(self):
+        """
+        Test that the special case actions identify the expected instances.
+        """
+        prescription = load_test_example_json(self.mock_log_object, "7D9625-Z72BF2-11E3A.json")
+        handle_time = datetime(year=2050, month=1, day=1)
+
+        action = fields.SPECIAL_RESET_CURRENT_INSTANCE
+        self._assert_find_instances_to_action_update(prescription, handle_time, action, ["1"])
+
+        # no issue is awaiting release, nor carries a next activity of resetNAD
+        action = fields.ADMIN_ACTION_RESET_NAD
+        self._assert_find_instances_to_action_update(prescription, handle_time, action, None)
+
+        # only the first cancellable issue is identified
+        for issue_number, status in [("1", "0006"), ("2", "0001"), ("3", "9000")]:
+            prescription.get_prescription_instance_data(issue_number)[
+                fields.FIELD_PRESCRIPTION_STATUS
+            ] = status
+        action = fields.SPECIAL_APPLY_PENDING_CANCELLATIONS
+        self._assert_find_instances_to_action_update(prescription, handle_time, action, ["2"])
+
+        # issues with the dispenser released inside the go-live window are reset
+        for issue_number, status, release_date in [
+            ("1", "0002", "20140825"),
+            ("2", "0002", "20140408"),
+            ("3", "0006", "20140825"),
+        ]:
+            instance = prescription.get_prescription_instance_data(issue_number)
+            instance[fields.FIELD_PRESCRIPTION_STATUS] = status
+            instance[fields.FIELD_RELEASE_DATE] = release_date
+        action = fields.SPECIAL_DISPENSE_RESET
+        self._assert_find_instances_to_action_update(prescription, handle_time, action, ["1"])
+
     def test_find_instances_to_action_update_missing_instances(self):
         """
         SPII-10492 - Test that we can find instances that need updating in a migrated
@@ -267,6 +328,36 @@ class PrescriptionRecordTest(TestCase):
             prescription, handle_time, action, ["5", "6", "7", "8", "9", "10", "11", "12"]
         )
 
+    def test_create_instances_repeat_dispense(self):
+        """
+        Test that each repeat dispense instance has its own line items, expired beyond their
+        max repeats.
+        """
+        prescription = RepeatDispenseRecord(self.mock_log_object, "test")
+        line_items = [
+            {fields.FIELD_ID: "LI1", fields.FIELD_MAX_REPEATS: "3", fields.FIELD_STATUS: "0007"},
+            {fields.FIELD_ID: "LI2", fields.FIELD_MAX_REPEATS: "1", fields.FIELD_STATUS: "0007"},
+        ]
+        context = MagicMock()
+        context.maxRepeats = "3"
+
+        instances = prescription.create_instances(context, line_items)
+
+        self.assertEqual(sorted(instances), ["1", "2", "3"])
+        for instance_number, expected_statuses in [
+            ("1", ["0007", "0007"]),
+            ("2", ["0007", LineItemStatus.EXPIRED]),
+            ("3", ["0007", LineItemStatus.EXPIRED]),
+        ]:
+            instance_line_items = instances[instance_number][fields.FIELD_LINE_ITEMS]
+            self.assertEqual(
+                [line_item[fields.FIELD_STATUS] for line_item in instance_line_items],
+                expected_statuses,
+            )
+            for line_item, original in zip(instance_line_items, line_items):
+                self.assertIsNot(line_item, original)
+        self.assertEqual(line_items[1][fields.FIELD_STATUS], "0007")
+
     def test_reset_current_instance(self):
         """
         Test that resetting the current instance chooses the correct instance.
@@ -289,6 +380,16 @@ class PrescriptionRecordTest(TestCase):
         self.assertEqual((old, new), (3, 3))
         self.assertEqual(prescription.current_issue_number, 3)
 
+    def test_reset_current_instance_moves_past_inactive_current(self):
+        """
+        Test that resetting the current instance moves on when the current one is no longer active.
+        """
+        prescription = load_test_example_json(self.mock_log_object, "50EE48-B83002-490F7.json")
+        prescription.current_issue.status = PrescriptionStatus.CANCELLED
+        old, new = prescription.reset_current_instance()
+        self.assertEqual((old, new), (4, 5))
+        self.assertEqual(prescription.current_issue_number, 5)
+
     def test_handle_overdue_expiry_none(self):
         """
         SPII-31379 due to old prescrptions the NAD index is set to None
@@ -325,6 +426,28 @@ class PrescriptionRecordTest(TestCase):
         ]
         self.assertTrue(PrescriptionRecord._is_expiry_overdue(nad))
 
+    def test_handle_overdue_expiry_passed_today(self):
+        """
+        Expiry is compared against the passed in date where one is given
+        """
+        nad = ["expire:20240102"]
+        self.assertFalse(PrescriptionRecord._is_expiry_overdue(nad, "20240102"))
+        self.assertTrue(PrescriptionRecord._is_expiry_overdue(nad, "20240103"))
+
+    def test_is_next_activity_purge(self):
+        """
+        Only a purge next activity index term is treated as a purge
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        for nad, expected in [
+            (["purge:20240102"], True),
+            (["expire:20240102"], False),
+            (["pur"], False),
+            ([], False),
+        ]:
+            prescription.return_next_activity_nad_bin = MagicMock(return_value=nad)
+            self.assertEqual(prescription.is_next_activity_purge(), expected)
+
     def test_get_line_item_cancellations(self):
         """
         Test that we can get the line item cancellations for a prescription
@@ -356,6 +479,667 @@ class PrescriptionRecordTest(TestCase):
         )
         self.assertEqual(first_cancellation_time, None)
 
+    def test_return_pending_cancellations_flag(self):
+        """
+        Test that only pending cancellations against the current issue set the flag
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        self.assertFalse(prescription.return_pending_cancellations_flag())
+
+        prescription.prescription_record[fields.FIELD_PRESCRIPTION][
+            fields.FIELD_PENDING_CANCELLATIONS
+        ] = [
+            {
+                fields.FIELD_CANCELLATION_ID: "PENDING-CANCELLATION-ID",
+                fields.FIELD_CANCELLATION_TARGET: "Prescription",
+                fields.FIELD_REASONS: ["0001: Prescribing error"],
+            }
+        ]
+        self.assertTrue(prescription.return_pending_cancellations_flag())
+
+    def test_return_line_item_by_ref(self):
+        """
+        Test that line items can be looked up by reference on an instance
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+
+        line_item_id = "02ED7776-21CD-4E7B-AC9D-D1DBFEE7B8CF"
+        line_item = prescription.return_line_item_by_ref("1", line_item_id)
+        self.assertEqual(line_item[fields.FIELD_ID], line_item_id)
+        self.assertIsNone(prescription.return_line_item_by_ref("1", "NOT-A-LINE-ITEM"))
+
+    def test_return_last_dispense_status_and_date(self):
+        """
+        Test that the combined accessor matches the individual last dispense lookups
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+
+        self.assertEqual(
+            prescription.return_last_dispense_status_and_date("1"),
+            (
+                prescription.return_last_dispense_status("1"),
+                prescription.return_last_dispense_date("1"),
+            ),
+        )
+
+    def test_update_for_claim_amend_keeps_historic_claim_guids(self):
+        """
+        Test that repeated claim amends accumulate the previous claim GUIDs
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        context = MagicMock()
+        context.claimDate = "20240101"
+
+        context.dispenseClaimID = "CLAIM-1"
+        prescription.update_for_claim(context, "1")
+        context.dispenseClaimID = "CLAIM-2"
+        prescription.update_for_claim_amend(context, "1")
+        context.dispenseClaimID = "CLAIM-3"
+        prescription.update_for_claim_amend(context, "1")
+
+        claim = prescription.get_prescription_instance_data("1")[fields.FIELD_CLAIM]
+        self.assertEqual(claim[fields.FIELD_CLAIM_GUID], "CLAIM-3")
+        self.assertEqual(claim[fields.FIELD_HISTORIC_CLAIM_GUIDS], ["CLAIM-1", "CLAIM-2"])
+        self.assertTrue(claim[fields.FIELD_CLAIM_REBUILD])
+
+    def test_make_admin_instance_updates_line_items(self):
+        """
+        Test that only the line items named in the admin update have their status changed
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        context = self._admin_update_context(
+            lineDict={"45D5FB11-D793-4D51-9ADD-95E0F54D2786": "0008"}
+        )
+
+        prescription._make_admin_instance_updates(context, 1)
+
+        line_items = prescription.get_prescription_instance_data("1")[fields.FIELD_LINE_ITEMS]
+        self.assertEqual(
+            [line_item[fields.FIELD_STATUS] for line_item in line_items], ["0005", "0008", "0007"]
+        )
+
+    def test_calculate_nominated_download_date(self):
+        """
+        Test that the nominated download date allows for the issue's supply and lead time
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        self.assertEqual(
+            prescription._calculate_nominated_download_date("20240101", 28, 7, 3),
+            datetime(2024, 2, 19),
+        )
+        self.assertEqual(
+            prescription._calculate_nominated_download_date_old("20240101", 28, 7),
+            datetime(2024, 1, 22),
+        )
+
+    def test_verify_record_deletion(self):
+        """
+        Test that a record can only be deleted once every issue's next activity is delete
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        prescription.prescription_record = {
+            fields.FIELD_PRESCRIPTION: {fields.FIELD_PRESCRIPTION_ID: "test"},
+            fields.FIELD_INSTANCES: {
+                "1": {fields.FIELD_NEXT_ACTIVITY: {fields.FIELD_ACTIVITY: "delete"}},
+                "2": {fields.FIELD_NEXT_ACTIVITY: {fields.FIELD_ACTIVITY: "delete"}},
+            },
+        }
+        self.assertTrue(prescription._verify_record_deletion())
+
+        prescription.prescription_record[fields.FIELD_INSTANCES]["2"] = {
+            fields.FIELD_NEXT_ACTIVITY: {}
+        }
+        self.assertFalse(prescription._verify_record_deletion())
+
+    @parameterized.expand(
+        [
+            ("int", 28, 28),
+            ("str", "28", 28),
+            ("none", None, 0),
+            ("blank", "  ", 0),
+        ]
+    )
+    def test_get_days_supply(self, _, stored_days_supply, expected):
+        """
+        Test that the stored days supply is normalised to an int
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        prescription.prescription_record = {
+            fields.FIELD_PRESCRIPTION: {fields.FIELD_DAYS_SUPPLY: stored_days_supply}
+        }
+        self.assertEqual(prescription.get_days_supply(), expected)
+
+    @parameterized.expand(
+        [
+            ("reset_nad", "resetNAD", "EPS0401b"),
+            ("invalid", "notAnAction", "EPS0401"),
+        ]
+    )
+    def test_perform_instance_specific_updates_dispatch(self, _, action, expected_log):
+        """
+        Test that instance specific actions are dispatched on the action, and unknown actions
+        are logged
+        """
+        log_object = MockLogObject()
+        prescription = load_test_example_json(log_object, "23C1BC-Z75FB1-11EE84.json")
+        context = MagicMock()
+        context.action = action
+
+        prescription.perform_instance_specific_updates(1, context, True)
+
+        self.assertTrue(log_object.was_logged(expected_log))
+
+    def test_make_admin_instance_updates_overdue_expiry(self):
+        """
+        Test that an overdue expiry expires all named line items that are not already final
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        line_items = prescription.get_prescription_instance_data("1")[fields.FIELD_LINE_ITEMS]
+        context = self._admin_update_context(
+            overdueExpiry=True,
+            lineDict={line_item[fields.FIELD_ID]: "0008" for line_item in line_items},
+        )
+
+        prescription._make_admin_instance_updates(context, 1)
+
+        self.assertEqual(
+            [line_item[fields.FIELD_STATUS] for line_item in line_items], ["0005", "0006", "0006"]
+        )
+
+    def test_make_admin_instance_updates_fields(self):
+        """
+        Test that the admin update fields set on the context are applied and logged
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        context = self._admin_update_context(
+            dispensingOrganization="NEWORG",
+            dispensingOrgNullFlavor=True,
+            claimSentDate="20240101",
+        )
+
+        prescription._make_admin_instance_updates(context, 1)
+
+        instance = prescription.get_prescription_instance_data("1")
+        self.assertIsNone(instance[fields.FIELD_DISPENSE][fields.FIELD_DISPENSING_ORGANIZATION])
+        self.assertEqual(instance[fields.FIELD_CLAIM][fields.FIELD_CLAIM_RECEIVED_DATE], "20240101")
+        self.assertEqual(
+            context.fieldsToUpdate,
+            [
+                fields.FIELD_DISPENSING_ORGANIZATION,
+                fields.FIELD_DISPENSING_ORGANIZATION,
+                fields.FIELD_CLAIM_SENT_DATE,
+            ],
+        )
+
+    def test_make_admin_instance_updates_unchanged_field(self):
+        """
+        Test that re-asserting an admin update field's current value is not logged as a change
+        """
+        log_object = MockLogObject()
+        prescription = load_test_example_json(log_object, "23C1BC-Z75FB1-11EE84.json")
+        instance = prescription.get_prescription_instance_data("1")
+        instance[fields.FIELD_COMPLETION_DATE] = "20240101"
+        context = self._admin_update_context(completionDate="20240101", releaseDate="20240102")
+
+        prescription._make_admin_instance_updates(context, 1)
+
+        self.assertEqual(instance[fields.FIELD_RELEASE_DATE], "20240102")
+        self.assertEqual(
+            context.fieldsToUpdate, [fields.FIELD_COMPLETION_DATE, fields.FIELD_RELEASE_DATE]
+        )
+        self.assertTrue(
+            log_object.was_value_not_logged("EPS0071", "itemChanged", fields.FIELD_COMPLETION_DATE)
+        )
+        self.assertTrue(
+            log_object.was_value_logged("EPS0071", "itemChanged", fields.FIELD_RELEASE_DATE)
+        )
+
+    def test_create_dispense_history_entry(self):
+        """
+        Test that the dispense history entry is a snapshot of the issue which is not
+        affected by later updates to the issue
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        instance = prescription.get_prescription_instance_data("1")
+        previous_status = instance[fields.FIELD_PRESCRIPTION_STATUS]
+        previous_line_status = instance[fields.FIELD_LINE_ITEMS][0][fields.FIELD_STATUS]
+
+        prescription.create_dispense_history_entry("DN-GUID", "1")
+        instance[fields.FIELD_PRESCRIPTION_STATUS] = "0006"
+        instance[fields.FIELD_LINE_ITEMS][0][fields.FIELD_STATUS] = "0001"
+        instance[fields.FIELD_DISPENSE][fields.FIELD_DISPENSING_ORGANIZATION] = "NEWORG"
+
+        dispense_entry = instance[fields.FIELD_DISPENSE_HISTORY]["DN-GUID"]
+        self.assertEqual(dispense_entry[fields.FIELD_PRESCRIPTION_STATUS], previous_status)
+        self.assertEqual(
+            dispense_entry[fields.FIELD_LINE_ITEMS][0][fields.FIELD_STATUS], previous_line_status
+        )
+        self.assertNotEqual(
+            dispense_entry[fields.FIELD_DISPENSE][fields.FIELD_DISPENSING_ORGANIZATION], "NEWORG"
+        )
+
+    def test_create_release_history_entry(self):
+        """
+        Test that the release history entry returns line items to with dispenser, other
+        than those already cancelled or expired
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        instance = prescription.get_prescription_instance_data("1")
+        line_items = instance[fields.FIELD_LINE_ITEMS]
+        statuses = ["0005", "0006", "0007"]
+        for line_item, status in zip(line_items, statuses):
+            line_item[fields.FIELD_STATUS] = status
+
+        prescription.create_release_history_entry(datetime(2024, 1, 1), "DISPORG")
+
+        release_entry = instance[fields.FIELD_DISPENSE_HISTORY][fields.FIELD_RELEASE]
+        self.assertEqual(
+            [
+                line_item[fields.FIELD_STATUS]
+                for line_item in release_entry[fields.FIELD_LINE_ITEMS]
+            ],
+            ["0005", "0006", "0008"],
+        )
+        self.assertEqual([line_item[fields.FIELD_STATUS] for line_item in line_items], statuses)
+        self.assertEqual(
+            release_entry[fields.FIELD_DISPENSE][fields.FIELD_LAST_DISPENSE_DATE], "20240101"
+        )
+
+    def test_clear_dispense_notifications_from_history(self):
+        """
+        Test that only the release entry is kept in the dispense history
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        instance = prescription.get_prescription_instance_data("1")
+        prescription.create_release_history_entry(datetime(2024, 1, 1), "DISPORG")
+        prescription.create_dispense_history_entry("DN-GUID", "1")
+
+        prescription.clear_dispense_notifications_from_history("1")
+
+        dispense_history = instance[fields.FIELD_DISPENSE_HISTORY]
+        self.assertEqual(list(dispense_history), [fields.FIELD_RELEASE])
+        self.assertEqual(
+            dispense_history[fields.FIELD_RELEASE][fields.FIELD_DISPENSE][
+                fields.FIELD_DISPENSING_ORGANIZATION
+            ],
+            "DISPORG",
+        )
+
+    def test_update_line_item_status(self):
+        """
+        Test that only line items in the status to check are updated, with their previous
+        status retained
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        issue_dict = {
+            fields.FIELD_LINE_ITEMS: [
+                {fields.FIELD_ID: "LI1", fields.FIELD_STATUS: "0007"},
+                {fields.FIELD_ID: "LI2", fields.FIELD_STATUS: "0005"},
+            ]
+        }
+
+        prescription.update_line_item_status(issue_dict, "0007", "0008")
+
+        self.assertEqual(
+            issue_dict[fields.FIELD_LINE_ITEMS],
+            [
+                {
+                    fields.FIELD_ID: "LI1",
+                    fields.FIELD_STATUS: "0008",
+                    fields.FIELD_PREVIOUS_STATUS: "0007",
+                },
+                {fields.FIELD_ID: "LI2", fields.FIELD_STATUS: "0005"},
+            ],
+        )
+
+    def test_update_line_item_status_from_dispense(self):
+        """
+        Test that only the line items on the dispense notification are updated, with
+        their previous status retained
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        instance = {
+            fields.FIELD_LINE_ITEMS: [
+                {fields.FIELD_ID: "LI1", fields.FIELD_STATUS: "0008"},
+                {fields.FIELD_ID: "LI2", fields.FIELD_STATUS: "0008"},
+            ]
+        }
+        dn_line_items = [
+            {fields.FIELD_ID: "LI2", fields.FIELD_STATUS: "0001"},
+            {fields.FIELD_ID: "LI3", fields.FIELD_STATUS: "0001"},
+        ]
+
+        prescription.update_line_item_status_from_dispense(instance, dn_line_items)
+
+        self.assertEqual(
+            instance[fields.FIELD_LINE_ITEMS],
+            [
+                {fields.FIELD_ID: "LI1", fields.FIELD_STATUS: "0008"},
+                {
+                    fields.FIELD_ID: "LI2",
+                    fields.FIELD_STATUS: "0001",
+                    fields.FIELD_PREVIOUS_STATUS: "0008",
+                },
+            ],
+        )
+
+    def test_process_line_cancellation(self):
+        """
+        Test that cancelling a line item only cancels the issue once no other line item
+        is active
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        instance = {
+            fields.FIELD_PRESCRIPTION_STATUS: "0001",
+            fields.FIELD_CANCELLATIONS: [],
+            fields.FIELD_LINE_ITEMS: [
+                {fields.FIELD_ID: "LI1", fields.FIELD_STATUS: "0007"},
+                {fields.FIELD_ID: "LI2", fields.FIELD_STATUS: "0007"},
+            ],
+        }
+        cancellation_obj = {
+            fields.FIELD_CANCEL_LINE_ITEM_REF: "LI1",
+            fields.FIELD_CANCELLATION_TIME: "20240101120000",
+        }
+
+        prescription.process_line_cancellation(instance, cancellation_obj)
+
+        line_items = instance[fields.FIELD_LINE_ITEMS]
+        self.assertEqual(line_items[0][fields.FIELD_STATUS], "0005")
+        self.assertEqual(line_items[0][fields.FIELD_PREVIOUS_STATUS], "0007")
+        self.assertEqual(line_items[1][fields.FIELD_STATUS], "0007")
+        self.assertEqual(instance[fields.FIELD_PRESCRIPTION_STATUS], "0001")
+
+        cancellation_obj = {
+            fields.FIELD_CANCEL_LINE_ITEM_REF: "LI2",
+            fields.FIELD_CANCELLATION_TIME: "20240102120000",
+        }
+        prescription.process_line_cancellation(instance, cancellation_obj)
+
+        self.assertEqual(line_items[1][fields.FIELD_STATUS], "0005")
+        self.assertEqual(instance[fields.FIELD_PRESCRIPTION_STATUS], "0005")
+        self.assertEqual(instance[fields.FIELD_COMPLETION_DATE], "20240102")
+
+    @parameterized.expand(
+        [
+            ("20000615", "20160614", "20600615"),
+            ("20000229", "20160228", "20600229"),
+            ("20010101", "20161231", "20610101"),
+        ]
+    )
+    def test_set_exemption_dates(self, birth_time, lower_age_limit, higher_age_limit):
+        """
+        Test that the age exemption limits are set from the patient's birth date
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        prescription.prescription_record = {
+            fields.FIELD_PATIENT: {fields.FIELD_BIRTH_TIME: birth_time}
+        }
+
+        prescription.set_exemption_dates()
+
+        patient_details = prescription.prescription_record[fields.FIELD_PATIENT]
+        self.assertEqual(patient_details[fields.FIELD_LOWER_AGE_LIMIT], lower_age_limit)
+        self.assertEqual(patient_details[fields.FIELD_HIGHER_AGE_LIMIT], higher_age_limit)
+
+    def test_force_current_instance_increment(self):
+        """
+        Test that the current issue is moved on to the next issue that exists
+        """
+        prescription = load_test_example_json(self.mock_log_object, "50EE48-B83002-490F7.json")
+        self.assertEqual(prescription.current_issue_number, 4)
+        del prescription.prescription_record[fields.FIELD_INSTANCES]["5"]
+
+        prescription.force_current_instance_increment()
+
+        self.assertEqual(prescription.current_issue_number, 6)
+
+    def test_force_current_instance_increment_at_max_repeats(self):
+        """
+        Test that the current issue is left alone when already at the final issue
+        """
+        log_object = MockLogObject()
+        prescription = load_test_example_json(log_object, "7D9625-Z72BF2-11E3A.json")
+
+        prescription.force_current_instance_increment()
+
+        self.assertEqual(prescription.current_issue_number, 3)
+        self.assertTrue(log_object.was_logged("EPS0625b"))
+
+    def test_fetch_release_response_parameters(self):
+        """
+        Test that the release response parameters are quoted, with the status display names
+        """
+        prescription = load_test_example_json(self.mock_log_object, "7D9625-Z72BF2-11E3A.json")
+
+        release_data = prescription.fetch_release_response_parameters()
+
+        self.assertEqual(
+            release_data,
+            {
+                "lowerAgeLimit": '"19960419"',
+                "higherAgeLimit": '"20400420"',
+                "prescriptionStatus": '"0002"',
+                "prescriptionStatusDisplayName": '"With Dispenser"',
+                "prescriptionCurrentInstance": '"3"',
+                "prescriptionMaxRepeats": '"3"',
+                "lineItem1Status": '"0001"',
+                "lineItem1StatusDisplayName": '"Item fully dispensed"',
+                "lineItem1MaxRepeats": '"3"',
+                "lineItem1CurrentInstance": '"3"',
+                "lineItem2Status": '"0001"',
+                "lineItem2StatusDisplayName": '"Item fully dispensed"',
+                "lineItem2MaxRepeats": '"3"',
+                "lineItem2CurrentInstance": '"3"',
+            },
+        )
+
+    def test_add_claim_amend_document_ref(self):
+        """
+        Test that each amend moves the current claim reference into the claim history
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        claim = prescription.get_prescription_instance_data("1")[fields.FIELD_CLAIM]
+        claim[fields.FIELD_HISTORIC_DISPENSE_CLAIM_MSG_REF] = False
+        claim[fields.FIELD_DISPENSE_CLAIM_MSG_REF] = "CLAIM-1"
+
+        prescription.add_claim_amend_document_ref("CLAIM-2", "1")
+        prescription.add_claim_amend_document_ref("CLAIM-3", "1")
+
+        self.assertEqual(claim[fields.FIELD_DISPENSE_CLAIM_MSG_REF], "CLAIM-3")
+        self.assertEqual(
+            claim[fields.FIELD_HISTORIC_DISPENSE_CLAIM_MSG_REF], ["CLAIM-1", "CLAIM-2"]
+        )
+
+    def test_apply_cancellation(self):
+        """
+        Test that a whole prescription cancellation is applied from the start issue upwards
+        """
+        prescription = load_test_example_json(self.mock_log_object, "50EE48-B83002-490F7.json")
+        cancellation_obj = {
+            fields.FIELD_CANCELLATION_ID: "CANCEL-1",
+            fields.FIELD_CANCELLATION_TARGET: "Prescription",
+            fields.FIELD_CANCELLATION_TIME: "20240101120000",
+        }
+
+        cancellation_id, issue_numbers = prescription.apply_cancellation(cancellation_obj, "10")
+
+        self.assertEqual(cancellation_id, "CANCEL-1")
+        self.assertEqual(issue_numbers, [10, 11, 12])
+        for issue_number in ["9", "10", "11", "12"]:
+            instance = prescription.get_prescription_instance_data(issue_number)
+            self.assertEqual(
+                instance[fields.FIELD_PRESCRIPTION_STATUS] == "0005", issue_number != "9"
+            )
+
+    @parameterized.expand(
+        [
+            ("same_line_item_same_org", "LineItem", "LI1", "ORG1", [False, True], [False, True]),
+            ("same_line_item_other_org", "LineItem", "LI1", "ORG2", [False, False], [False, False]),
+            ("other_line_item", "LineItem", "LI2", "ORG1", [True, None], [False, True]),
+            (
+                "whole_prescription",
+                fields.FIELD_PRESCRIPTION,
+                None,
+                "ORG2",
+                [True, None],
+                [False, False],
+            ),
+        ]
+    )
+    def test_check_pending_cancellation_unique(
+        self, _, target, line_item_ref, org, expected_w_disp, expected
+    ):
+        """
+        Test that a cancellation is only unique when no pending cancellation shares its
+        target, with a pending whole prescription cancellation taking precedence when the
+        prescription is not yet with a dispenser
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        prescription.prescription_record = {
+            fields.FIELD_PRESCRIPTION: {
+                fields.FIELD_PENDING_CANCELLATIONS: [
+                    {
+                        fields.FIELD_CANCELLATION_TARGET: "LineItem",
+                        fields.FIELD_CANCEL_LINE_ITEM_REF: "LI1",
+                        fields.FIELD_AGENT_ORGANIZATION: "ORG1",
+                    },
+                    {
+                        fields.FIELD_CANCELLATION_TARGET: fields.FIELD_PRESCRIPTION,
+                        fields.FIELD_AGENT_ORGANIZATION: "ORG1",
+                    },
+                ]
+            }
+        }
+        cancellation_obj = {
+            fields.FIELD_CANCELLATION_TARGET: target,
+            fields.FIELD_CANCEL_LINE_ITEM_REF: line_item_ref,
+            fields.FIELD_AGENT_ORGANIZATION: org,
+        }
+        pending_cancellations = prescription.prescription_record[fields.FIELD_PRESCRIPTION][
+            fields.FIELD_PENDING_CANCELLATIONS
+        ]
+        self.assertEqual(expected, prescription.check_pending_cancellation_unique(cancellation_obj))
+
+        # leave only the line item cancellation pending for the with dispenser check
+        del pending_cancellations[1]
+        self.assertEqual(
+            expected_w_disp, prescription.check_pending_cancellation_unique_w_disp(cancellation_obj)
+        )
+
+    def test_set_unsuccessful_cancellation(self):
+        """
+        Test that unsuccessful cancellations are recorded with their failure reason, starting
+        the list when there is none yet
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        prescription.prescription_record = {
+            fields.FIELD_PRESCRIPTION: {fields.FIELD_UNSUCCESSFUL_CANCELLATIONS: None}
+        }
+        first = {fields.FIELD_CANCELLATION_ID: "CANCEL-1"}
+        second = {fields.FIELD_CANCELLATION_ID: "CANCEL-2"}
+
+        prescription.set_unsuccessful_cancellation(first, "reason 1")
+        prescription.set_unsuccessful_cancellation(second, "reason 2")
+
+        failed_cs = prescription.prescription_record[fields.FIELD_PRESCRIPTION][
+            fields.FIELD_UNSUCCESSFUL_CANCELLATIONS
+        ]
+        self.assertEqual(failed_cs, [first, second])
+        self.assertEqual(
+            [c["failureReason"] for c in failed_cs],
+            ["reason 1", "reason 2"],
+        )
+
+    def test_set_pending_cancellation(self):
+        """
+        Test that the first pending cancellation sets a missing prescription time from its
+        cancellation date, and that later ones are appended
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        prescription.prescription_record = {
+            fields.FIELD_PRESCRIPTION: {
+                fields.FIELD_PRESCRIPTION_ID: "TEST-ID",
+                fields.FIELD_PRESCRIPTION_TIME: None,
+                fields.FIELD_PENDING_CANCELLATIONS: [],
+            }
+        }
+        first = {fields.FIELD_CANCELLATION_TIME: "20240102030405"}
+        second = {fields.FIELD_CANCELLATION_TIME: "20240305060708"}
+
+        prescription.set_pending_cancellation(first, True)
+        prescription.set_pending_cancellation(second, True)
+
+        prescription_dict = prescription.prescription_record[fields.FIELD_PRESCRIPTION]
+        self.assertEqual(prescription_dict[fields.FIELD_PRESCRIPTION_TIME], "20240102")
+        self.assertEqual(prescription_dict[fields.FIELD_PENDING_CANCELLATIONS], [first, second])
+
+    def test_return_message_ref(self):
+        """
+        Test that the message reference is returned for each supported document type
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        prescription.prescription_record[fields.FIELD_PRESCRIPTION][
+            fields.FIELD_PRESCRIPTION_MSG_REF
+        ] = "PRESCRIPTION-REF"
+        prescription.get_prescription_instance_data("1")[
+            fields.FIELD_RELEASE_REQUEST_MGS_REF
+        ] = "RELEASE-REF"
+
+        self.assertEqual(prescription.return_message_ref("Prescription"), "PRESCRIPTION-REF")
+        self.assertEqual(prescription.return_message_ref("ReleaseRequest"), "RELEASE-REF")
+        with self.assertRaises(EpsSystemError):
+            prescription.return_message_ref("DispenseNotification")
+
+    def test_fetch_release_response_parameters_awaiting_release_ready(self):
+        """
+        Test that an internal only awaiting release ready status is reported as to be
+        dispensed in the release response
+        """
+        prescription = load_test_example_json(self.mock_log_object, "7D9625-Z72BF2-11E3A.json")
+        prescription.get_prescription_instance_data("3")[fields.FIELD_PREVIOUS_STATUS] = "0000"
+
+        release_data = prescription.fetch_release_response_parameters()
+
+        self.assertEqual(release_data["prescriptionStatus"], '"0001"')
+        self.assertEqual(release_data["prescriptionStatusDisplayName"], '"To Be Dispensed"')
+
+    def test_individual_consistency_checks(self):
+        """
+        Test that missing and empty mandatory fields are both reported
+        """
+        prescription = PrescriptionRecord(self.mock_log_object, "test")
+        test_failures = []
+        prescription.individual_consistency_checks(
+            ["present", "missing", "empty"], {"present": "1", "empty": None}, test_failures
+        )
+        self.assertEqual(
+            test_failures,
+            ["Mandatory item missing missing", "Mandatory item empty set to None"],
+        )
+
+    def test_compare_line_items_for_dispense(self):
+        """
+        Test that passed line items are matched to the stored ones and their status
+        transitions validated
+        """
+        prescription = load_test_example_json(self.mock_log_object, "23C1BC-Z75FB1-11EE84.json")
+        passed_line_items = [
+            {fields.FIELD_ID: "02ED7776-21CD-4E7B-AC9D-D1DBFEE7B8CF", fields.FIELD_STATUS: "0005"},
+            {fields.FIELD_ID: "45D5FB11-D793-4D51-9ADD-95E0F54D2786", fields.FIELD_STATUS: "0001"},
+            {fields.FIELD_ID: "BC7A2174-72D6-4C95-8B2D-3E1B63DF90BD", fields.FIELD_STATUS: "0001"},
+        ]
+        valid_status_changes = [["0005", "0005"], ["0007", "0001"]]
+        prescription.compare_line_items_for_dispense(passed_line_items, valid_status_changes, "1")
+
+        with self.assertRaises(EpsBusinessError):
+            prescription.compare_line_items_for_dispense(passed_line_items, [["0007", "0001"]], "1")
+
+        with self.assertRaises(EpsBusinessError):
+            prescription.compare_line_items_for_dispense(
+                passed_line_items[1:], valid_status_changes, "1"
+            )
+
     def test_set_initial_prescription_status_active_prescription(self):
         """
         Test that a prescription with a start date of today or earlier is marked as TO_BE_DISPENSED.
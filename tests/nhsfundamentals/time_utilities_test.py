@@ -7,7 +7,10 @@ from parameterized.parameterized import parameterized
 from eps_spine_shared.nhsfundamentals.time_utilities import (
     TimeFormats,
     convert_spine_date,
+    date_as_standard_string,
     guess_common_datetime_format,
+    standard_date_string_as_datetime,
+    standard_date_time_string_as_datetime,
     time_now_as_string,
 )
 
@@ -62,6 +65,66 @@ class TimeUtilitiesTests(TestCase):
         result = guess_common_datetime_format(time_string)
         self.assertEqual(expected, result)
 
+    @parameterized.expand(
+        [
+            ("start_of_year", datetime(2021, 1, 1, 0, 0, 0)),
+            ("end_of_year", datetime(2021, 12, 31, 23, 59, 59)),
+        ]
+    )
+    def test_date_as_standard_string(self, _, date_object):
+        """
+        Check date_as_standard_string matches strftime with the standard date format
+        """
+        self.assertEqual(
+            date_object.strftime(TimeFormats.STANDARD_DATE_FORMAT),
+            date_as_standard_string(date_object),
+        )
+
+    @parameterized.expand(
+        [
+            ("standard", "20240229"),
+            ("short_day", "2024011"),
+        ]
+    )
+    def test_standard_date_string_as_datetime(self, _, date_string):
+        """
+        Check standard_date_string_as_datetime matches strptime with the standard date format
+        """
+        self.assertEqual(
+            datetime.strptime(date_string, TimeFormats.STANDARD_DATE_FORMAT),
+            standard_date_string_as_datetime(date_string),
+        )
+
+    def test_standard_date_string_as_datetime_invalid(self):
+        """
+        Check standard_date_string_as_datetime rejects an invalid date
+        """
+        with self.assertRaises(ValueError):
+            standard_date_string_as_datetime("20230229")
+
+    @parameterized.expand(
+        [
+            ("standard", "20240229235959"),
+            ("midnight", "20240101000000"),
+            ("short_second", "2024010112000"),
+        ]
+    )
+    def test_standard_date_time_string_as_datetime(self, _, date_time_string):
+        """
+        Check standard_date_time_string_as_datetime matches strptime with the standard date time format
+        """
+        self.assertEqual(
+            datetime.strptime(date_time_string, TimeFormats.STANDARD_DATE_TIME_FORMAT),
+            standard_date_time_string_as_datetime(date_time_string),
+        )
+
+    def test_standard_date_time_string_as_datetime_invalid(self):
+        """
+        Check standard_date_time_string_as_datetime rejects an invalid time
+        """
+        with self.assertRaises(ValueError):
+            standard_date_time_string_as_datetime("20240101246000")
+
     def test_guess_common_datetime_format_none_if_unknown(self):
         """
         Check time format determined from date time string specifying to return none if could not be determined